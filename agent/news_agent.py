@@ -64,6 +64,8 @@ class NewsAnalysisAgent:
         """
         config = get_config()
         self.openai_api_key = api_key or config.get_openai_key()
+        # 이전 실행에서 수집한 URL 제외 여부 (CRAWLER_SKIP_SEEN)
+        self.skip_seen = config.CRAWLER_SKIP_SEEN
 
         if not self.openai_api_key:
             raise RuntimeError("OPENAI_API_KEY가 필요합니다.")
@@ -273,7 +275,7 @@ class NewsAnalysisAgent:
                 scraper = NewsScraperTool()
                 try:
                     article_urls = await asyncio.wait_for(
-                        asyncio.to_thread(scraper.search_news, keyword, valid_sources, max_articles),
+                        asyncio.to_thread(scraper.search_news, keyword, valid_sources, max_articles, self.skip_seen),
                         timeout=120
                     )
                     
@@ -286,7 +288,7 @@ class NewsAnalysisAgent:
                     
                     # 순차 추출
                     for url in article_urls:
-                        source = "naver" if "naver.com" in url else "google"
+                        source = scraper.source_of(url)
                         try:
                             article = scraper.scrape_article(url, source)
                             article_dict = article.to_dict()
@@ -304,7 +306,7 @@ class NewsAnalysisAgent:
                         "sources": valid_sources
                     }
                 finally:
-                    scraper.cleanup()
+                    await asyncio.to_thread(scraper.cleanup)
 
             if not articles_data or (len(articles_data) == 1 and "error" in articles_data[0]):
                 return {
@@ -721,11 +723,11 @@ class NewsAnalysisAgent:
                 scraper = NewsScraperTool()
                 try:
                     article_urls = await asyncio.wait_for(
-                        asyncio.to_thread(scraper.search_news, keyword, valid_sources, max_articles),
+                        asyncio.to_thread(scraper.search_news, keyword, valid_sources, max_articles, self.skip_seen),
                         timeout=120
                     )
                     for url in (article_urls or []):
-                        source = "naver" if "naver.com" in url else "google"
+                        source = scraper.source_of(url)
                         try:
                             article = scraper.scrape_article(url, source)
                             article_dict = article.to_dict()
@@ -735,7 +737,7 @@ class NewsAnalysisAgent:
                             pass
                         time.sleep(0.5)
                 finally:
-                    scraper.cleanup()
+                    await asyncio.to_thread(scraper.cleanup)
             
             timing_info["crawling_time"] = round(time.time() - crawling_start, 2)
             
@@ -7,6 +7,7 @@ Agent를 독립적인 서비스로 실행하기 위한 간단한 HTTP 서버
 
 import asyncio
 import json
+import logging
 from contextlib import asynccontextmanager
 from typing import Dict, Any, List, Optional
 from fastapi import FastAPI, HTTPException
@@ -14,7 +15,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from common.config import get_config
-from common.utils import safe_log, validate_input
+from common.utils import enable_queue_logging, safe_log, stop_queue_logging, validate_input
 from .news_agent import NewsAnalysisAgent
 from .tools.image_searcher import ImageSearchTool
 
@@ -28,6 +29,9 @@ async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리 (startup/shutdown)"""
     # Startup
     global agent_instance, image_search_tool
+    # 로깅 설정 후 로그 출력을 백그라운드 스레드로 이동 (요청 처리 중 로그 IO 대기 방지)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    enable_queue_logging()
     try:
         config = get_config()
         agent_instance = NewsAnalysisAgent(config.get_openai_key())
@@ -43,6 +47,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown (필요시 정리 작업)
     safe_log("Agent 서비스 종료", level="info")
+    stop_queue_logging()
 
 
 app = FastAPI(
@@ -13,6 +13,7 @@ try:
     from .playwright_scraper import PlaywrightNewsScraper, PlaywrightNewsScraperSync
     from .playwright_naver import PlaywrightNaverScraper
     from .playwright_google import PlaywrightGoogleScraper
+    from .playwright_base import shutdown_shared
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -29,5 +30,6 @@ __all__ = [
     "PlaywrightNewsScraperSync",
     "PlaywrightNaverScraper",
     "PlaywrightGoogleScraper",
+    "shutdown_shared",
     "PLAYWRIGHT_AVAILABLE",
 ]
@@ -9,11 +9,13 @@ Selenium 대신 XML 파싱 사용
 import time
 import requests
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from urllib.parse import quote, unquote
 from html import unescape
 import re
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -22,6 +24,112 @@ from common.utils import safe_log, validate_input, validate_url
 from .base_scraper import BaseNewsScraper
 from .models import NewsArticle, Comment
 
+# 정적 HTML 파서 (선택적, 없으면 WebDriver 요소 조회로 추출)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# RSS 요청과 리디렉션 확인이 함께 쓰는 HTTP 세션
+# (news.google.com 연결을 재사용해 매 요청의 DNS/TCP/TLS 핸드셰이크 생략, 일시적 5xx는 재시도)
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+
+# 기사 제목 셀렉터 (우선순위 순)
+TITLE_SELECTORS = [
+    "h1",
+    "h2.article-title",
+    ".article-title h1",
+    "article h1",
+    ".headline",
+    "h1.title",
+    ".tit_view",
+    "#articleTitle",
+    ".news_tit",
+]
+
+# 기사 본문 셀렉터 (우선순위 순)
+CONTENT_SELECTORS = [
+    "article p",
+    ".article-body p",
+    ".article-content p",
+    "#article-body p",
+    ".story-body p",
+    "div[itemprop='articleBody'] p",
+    "#dic_area",  # 네이버 뉴스
+    ".news_end_body_container",
+    "#articeBody",
+    ".article_body",
+    "article",
+    ".content",
+    "#content",
+    "main p",
+]
+
+
+# 본문 텍스트에서 제외할 태그 (Selenium의 .text처럼 보이는 텍스트만 남김)
+NON_CONTENT_TAGS = ["script", "style", "noscript"]
+
+
+def _strip_site_name(title: str) -> str:
+    """페이지 타이틀에서 " - 뉴스 사이트명" 등 제거"""
+    return re.sub(r'\s*[-|]\s*[^-|]+$', '', title)
+
+
+def parse_article_html(html: str) -> Optional[Dict[str, str]]:
+    """
+    기사 HTML에서 제목/본문 추출 (WebDriver 요소 조회와 동일한 셀렉터/기준)
+
+    요소마다 WebDriver 명령을 보내는 대신 HTML을 한 번에 파싱합니다.
+    본문을 찾지 못하면 None을 반환합니다.
+
+    Args:
+        html: 페이지 HTML
+
+    Returns:
+        {"title", "content"} 딕셔너리 또는 None
+    """
+    tree = LexborHTMLParser(html)
+    # selectolax의 text()는 인라인 JS/CSS도 포함하므로 파싱 직후 제거
+    tree.strip_tags(NON_CONTENT_TAGS)
+
+    content = None
+    for content_selector in CONTENT_SELECTORS:
+        texts = [node.text(separator=" ").strip() for node in tree.css(content_selector)]
+        content_text = " ".join(text for text in texts if text)
+        if len(content_text) > 50:  # 최소 50자 이상
+            content = content_text
+            break
+    if not content:
+        return None
+
+    title = None
+    for title_selector in TITLE_SELECTORS:
+        for node in tree.css(title_selector):
+            text = node.text(separator=" ").strip()
+            if len(text) > 5:  # 최소 5자 이상
+                title = text
+                break
+        if title:
+            break
+    if not title:
+        # 페이지 타이틀 사용
+        title_node = tree.css_first("title")
+        title = _strip_site_name(title_node.text().strip()) if title_node is not None else ""
+    if not title:
+        return None
+
+    return {"title": title, "content": content}
+
 
 class GoogleNewsScraper(BaseNewsScraper):
     """
@@ -55,10 +163,7 @@ class GoogleNewsScraper(BaseNewsScraper):
             safe_log("구글 뉴스 RSS 피드 요청", level="info", keyword=keyword, url=rss_url)
 
             # RSS 피드 요청
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            response = requests.get(rss_url, headers=headers, timeout=30)
+            response = _SESSION.get(rss_url, timeout=30)
             response.raise_for_status()
             
             print(f"[DEBUG] RSS 피드 응답 수신: {len(response.content)} bytes")
@@ -153,10 +258,7 @@ class GoogleNewsScraper(BaseNewsScraper):
         
         try:
             # 리디렉션을 따라가서 최종 URL 얻기
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            response = requests.head(google_news_url, headers=headers, allow_redirects=True, timeout=10)
+            response = _SESSION.head(google_news_url, allow_redirects=True, timeout=10)
             final_url = response.url
             
             # 구글 뉴스가 아닌 실제 기사 URL인지 확인
@@ -199,21 +301,26 @@ class GoogleNewsScraper(BaseNewsScraper):
             self.driver.get(url)
             time.sleep(2)  # 페이지 로드 대기
 
+            # 페이지 HTML을 한 번에 받아 파싱 (실패하면 아래의 요소별 조회로 폴백)
+            if SELECTOLAX_AVAILABLE:
+                try:
+                    parsed = parse_article_html(self.driver.page_source)
+                except Exception as e:
+                    parsed = None
+                    safe_log("HTML 파싱 실패, 요소 조회로 폴백", level="debug", error=str(e), url=url)
+                if parsed:
+                    safe_log("HTML 파싱으로 추출 성공", level="debug", content_length=len(parsed["content"]), url=url)
+                    return {
+                        "title": parsed["title"],
+                        "content": parsed["content"],
+                        "comments": [],  # 구글 뉴스는 댓글 추출 미지원
+                        "extraction_method": "selenium",
+                        "source": "google"
+                    }
+
             # 제목 추출 (여러 셀렉터 시도)
             title = None
-            title_selectors = [
-                "h1",
-                "h2.article-title",
-                ".article-title h1",
-                "article h1",
-                ".headline",
-                "h1.title",
-                ".tit_view",
-                "#articleTitle",
-                ".news_tit",
-            ]
-            
-            for i, title_selector in enumerate(title_selectors, 1):
+            for i, title_selector in enumerate(TITLE_SELECTORS, 1):
                 try:
                     title_elements = self.driver.find_elements(By.CSS_SELECTOR, title_selector)
                     if title_elements:
@@ -233,31 +340,14 @@ class GoogleNewsScraper(BaseNewsScraper):
                 title = self.driver.title
                 if title:
                     # " - 뉴스 사이트명" 등 제거
-                    title = re.sub(r'\s*[-|]\s*[^-|]+$', '', title)
+                    title = _strip_site_name(title)
                     print(f"[DEBUG] ✓ 페이지 타이틀 사용: {title[:50]}...")
                 else:
                     title = "제목 추출 실패"
 
             # 본문 추출 (여러 셀렉터 시도)
             content = None
-            content_selectors = [
-                "article p",
-                ".article-body p",
-                ".article-content p",
-                "#article-body p",
-                ".story-body p",
-                "div[itemprop='articleBody'] p",
-                "#dic_area",  # 네이버 뉴스
-                ".news_end_body_container",
-                "#articeBody",
-                ".article_body",
-                "article",
-                ".content",
-                "#content",
-                "main p",
-            ]
-            
-            for i, content_selector in enumerate(content_selectors, 1):
+            for i, content_selector in enumerate(CONTENT_SELECTORS, 1):
                 try:
                     content_elements = self.driver.find_elements(By.CSS_SELECTOR, content_selector)
                     if content_elements:
@@ -314,7 +404,7 @@ class GoogleNewsScraper(BaseNewsScraper):
                 author=c.get("author"),
                 timestamp=None
             )
-            for c in result.get("comments", [])
+            for c in result.get("comments", ())
         ]
 
         return NewsArticle(
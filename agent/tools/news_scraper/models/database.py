@@ -8,26 +8,114 @@ SQLAlchemy ORM을 활용한 데이터 모델 정의 및 관리
 from typing import Optional, List, Dict, Any, Union
 from datetime import datetime, timezone
 from contextlib import contextmanager
+import csv
 import json
+import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 from sqlalchemy import (
-    create_engine, Column, Integer, String, Text, DateTime, 
+    create_engine, Integer, String, Text, DateTime, 
     Boolean, Float, ForeignKey, Index, UniqueConstraint,
-    JSON, BigInteger, SmallInteger
+    JSON, BigInteger, SmallInteger, Table, update, select, inspect, func, text
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session, relationship
+from sqlalchemy.orm import (
+    DeclarativeBase, Mapped, mapped_column, sessionmaker, Session, relationship, selectinload
+)
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
-from sqlalchemy.dialects.mysql import MEDIUMTEXT, LONGTEXT
+from sqlalchemy.dialects.mysql import MEDIUMTEXT, LONGTEXT, insert as mysql_insert
 
 from config.settings import settings
 
-Base = declarative_base()
+logger = logging.getLogger(__name__)
+
+
+class Base(DeclarativeBase):
+    """선언적 모델 베이스 클래스"""
+
+
+# 타임존 객체 캐싱 (핫 패스에서 속성 조회 방지)
+_UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """현재 UTC 시각 반환 (컬럼 기본값용)"""
+    return datetime.now(_UTC)
+
+
+def _preview(instance, name: str, length: int) -> str:
+    """
+    repr용 속성 미리보기
+
+    로드되지 않은 속성은 접근하지 않으므로 repr 호출이 추가 SELECT를 발생시키지 않습니다.
+    """
+    if name in inspect(instance).unloaded:
+        return '<unloaded>'
+    value = getattr(instance, name)
+    return value[:length] if value else ''
+
+
+# 목록/API 응답용 기사 컬럼 (대용량 본문 컬럼 제외)
+_ARTICLE_LIST_COLUMNS = (
+    'id', 'external_id', 'title', 'source_name', 'original_url', 'published_at',
+    'category', 'tags', 'sentiment_score', 'sentiment_label', 'sentiment_confidence',
+    'view_count', 'like_count', 'share_count', 'status', 'created_at'
+)
+
 
+class SentimentMixin:
+    """
+    감성 분석 결과 갱신 메서드 (Article, Comment 공용)
 
-class Article(Base):
+    sentiment_score, sentiment_label, sentiment_confidence, is_processed,
+    updated_at 컬럼을 가진 모델에 사용합니다.
+    """
+
+    def update_sentiment(self, score: float, label: str, confidence: float,
+                         now: Optional[datetime] = None):
+        """
+        감성 분석 결과 업데이트
+
+        Args:
+            now: 수정 시각 (배치 처리 시 동일한 타임스탬프 공유용)
+        """
+        self.sentiment_score = score
+        self.sentiment_label = label
+        self.sentiment_confidence = confidence
+        self.is_processed = True
+        self.updated_at = now or datetime.now(_UTC)
+
+    @classmethod
+    def bulk_update_sentiment(cls, session: Session, updates: List[Dict[str, Any]],
+                              now: Optional[datetime] = None) -> int:
+        """
+        감성 분석 결과 일괄 업데이트
+
+        기본 키 기반 ORM 벌크 UPDATE로 executemany 한 번에 처리합니다.
+
+        Args:
+            session: 데이터베이스 세션
+            updates: id, sentiment_score, sentiment_label, sentiment_confidence 딕셔너리 리스트
+            now: 수정 시각 (None일 경우 현재 시각)
+
+        Returns:
+            int: 업데이트 요청 행 수
+        """
+        if not updates:
+            return 0
+
+        now = now or datetime.now(_UTC)
+        session.execute(
+            update(cls),
+            [{**row, 'is_processed': True, 'updated_at': now} for row in updates]
+        )
+        return len(updates)
+
+
+class Article(SentimentMixin, Base):
     """
     뉴스 기사 테이블
 
@@ -38,53 +126,64 @@ class Article(Base):
     __tablename__ = 'articles'
 
     # 기본 키 및 식별자
-    id = Column(BigInteger, primary_key=True, autoincrement=True, comment='기사 고유 ID')
-    external_id = Column(String(255), unique=True, nullable=False, comment='외부 시스템 기사 ID')
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, comment='기사 고유 ID')
+    external_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, comment='외부 시스템 기사 ID')
 
     # 기사 메타데이터
-    title = Column(Text, nullable=False, comment='기사 제목')
-    content = Column(LONGTEXT, nullable=False, comment='기사 본문')
-    summary = Column(MEDIUMTEXT, nullable=True, comment='기사 요약')
+    title: Mapped[str] = mapped_column(Text, nullable=False, comment='기사 제목')
 
     # 출처 및 URL 정보
-    source_name = Column(String(100), nullable=False, comment='언론사명')
-    source_category = Column(String(50), nullable=True, comment='언론사 카테고리')
-    original_url = Column(Text, nullable=False, comment='원문 URL')
+    source_name: Mapped[str] = mapped_column(String(100), nullable=False, comment='언론사명')
+    source_category: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, comment='언론사 카테고리')
+    original_url: Mapped[str] = mapped_column(Text, nullable=False, comment='원문 URL')
 
     # 시간 정보
-    published_at = Column(DateTime(timezone=True), nullable=False, comment='기사 발행일시')
-    crawled_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), comment='크롤링 일시')
+    published_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, comment='기사 발행일시')
+    crawled_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=_utcnow, comment='크롤링 일시')
 
     # 분류 정보
-    category = Column(String(50), nullable=True, comment='기사 카테고리')
-    tags = Column(JSON, nullable=True, comment='태그 목록 (JSON 배열)')
+    category: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, comment='기사 카테고리')
+    tags: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True, comment='태그 목록 (JSON 배열)')
 
     # 감성 분석 결과
-    sentiment_score = Column(Float, nullable=True, comment='감성 점수 (-1.0 ~ 1.0)')
-    sentiment_label = Column(String(20), nullable=True, comment='감성 라벨 (positive, negative, neutral)')
-    sentiment_confidence = Column(Float, nullable=True, comment='감성 분석 신뢰도 (0.0 ~ 1.0)')
+    sentiment_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='감성 점수 (-1.0 ~ 1.0)')
+    sentiment_label: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment='감성 라벨 (positive, negative, neutral)')
+    sentiment_confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='감성 분석 신뢰도 (0.0 ~ 1.0)')
 
     # 크롤링 메타데이터
-    crawl_method = Column(String(50), nullable=True, comment='크롤링 방법 (playwright, firecrawl 등)')
-    crawl_success = Column(Boolean, default=True, comment='크롤링 성공 여부')
-    crawl_error_message = Column(Text, nullable=True, comment='크롤링 오류 메시지')
+    crawl_method: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, comment='크롤링 방법 (playwright, firecrawl 등)')
+    crawl_success: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, comment='크롤링 성공 여부')
+    crawl_error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True, comment='크롤링 오류 메시지')
 
     # 통계 정보
-    view_count = Column(Integer, default=0, comment='조회수')
-    like_count = Column(Integer, default=0, comment='좋아요 수')
-    share_count = Column(Integer, default=0, comment='공유 수')
+    view_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, comment='조회수')
+    like_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, comment='좋아요 수')
+    share_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, comment='공유 수')
 
     # 상태 관리
-    status = Column(String(20), default='active', comment='기사 상태 (active, deleted, hidden)')
-    is_processed = Column(Boolean, default=False, comment='감성 분석 처리 완료 여부')
+    status: Mapped[Optional[str]] = mapped_column(String(20), default='active', comment='기사 상태 (active, deleted, hidden)')
+    is_processed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, comment='감성 분석 처리 완료 여부')
 
     # 생성/수정 시간
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), comment='레코드 생성일시')
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), comment='레코드 수정일시')
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=_utcnow, comment='레코드 생성일시')
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow, comment='레코드 수정일시')
 
     # 관계 정의
-    comments = relationship("Comment", back_populates="article", cascade="all, delete-orphan")
-    keywords = relationship("Keyword", back_populates="article", cascade="all, delete-orphan")
+    # lazy='raise': 지연 로딩으로 인한 N+1 쿼리를 막기 위해 selectinload 등 명시적 로딩 필요
+    comments: Mapped[List["Comment"]] = relationship("Comment", back_populates="article", cascade="all, delete-orphan",
+                                               lazy='raise', passive_deletes=True)
+    keywords: Mapped[List["Keyword"]] = relationship("Keyword", back_populates="article", cascade="all, delete-orphan",
+                                               lazy='raise', passive_deletes=True)
+
+    # 본문/요약은 article_contents 테이블에 분리 저장 (필요 시 selectinload(Article.content_row))
+    content_row: Mapped[Optional["ArticleContent"]] = relationship(
+        "ArticleContent", back_populates="article", uselist=False,
+        cascade="all, delete-orphan", lazy='raise', passive_deletes=True
+    )
+    content = association_proxy('content_row', 'content',
+                                creator=lambda value: ArticleContent(content=value))
+    summary = association_proxy('content_row', 'summary',
+                                creator=lambda value: ArticleContent(summary=value))
 
     # 인덱스 정의
     __table_args__ = (
@@ -97,17 +196,25 @@ class Article(Base):
         Index('idx_status', 'status'),
         Index('idx_is_processed', 'is_processed'),
         Index('idx_source_published', 'source_name', 'published_at'),  # 복합 인덱스
+        Index('idx_processed_status', 'is_processed', 'status'),  # 처리 현황 집계용 커버링 인덱스
+        Index('idx_unprocessed_published', 'is_processed', 'published_at'),  # 미처리 작업 큐 범위 스캔용
+        Index('idx_tags_multi', text("(CAST(tags->'$' AS CHAR(255) ARRAY))")),  # MySQL 8 다중값 인덱스
         {'comment': '뉴스 기사 테이블 - 감성 분석 대상 기사 저장'}
     )
 
     def to_dict(self) -> Dict[str, Any]:
-        """모델 인스턴스를 딕셔너리로 변환"""
+        """
+        모델 인스턴스를 딕셔너리로 변환
+
+        본문(content, summary)은 content_row가 이미 로드된 경우에만 포함됩니다.
+        """
+        content_loaded = 'content_row' not in inspect(self).unloaded
         return {
             'id': self.id,
             'external_id': self.external_id,
             'title': self.title,
-            'content': self.content,
-            'summary': self.summary,
+            'content': self.content if content_loaded else None,
+            'summary': self.summary if content_loaded else None,
             'source_name': self.source_name,
             'original_url': self.original_url,
             'published_at': self.published_at.isoformat() if self.published_at else None,
@@ -123,15 +230,50 @@ class Article(Base):
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
-    def update_sentiment(self, score: float, label: str, confidence: float):
-        """감성 분석 결과 업데이트"""
-        self.sentiment_score = score
-        self.sentiment_label = label
-        self.sentiment_confidence = confidence
-        self.is_processed = True
-        self.updated_at = datetime.now(timezone.utc)
+    @classmethod
+    def query_dicts(cls, session: Session, **filters) -> List[Dict[str, Any]]:
+        """
+        API 응답용 경량 딕셔너리 조회
+
+        ORM 인스턴스를 만들지 않고 필요한 컬럼만 조회해 RowMapping을 바로 변환합니다.
+        대용량 본문 컬럼(content, summary)은 제외됩니다.
 
-    def add_tags(self, new_tags: List[str]):
+        Args:
+            session: 데이터베이스 세션
+            **filters: 컬럼명=값 형태의 동등 조건
+
+        Returns:
+            List[Dict]: to_dict()와 같은 키 구성(본문 제외)의 딕셔너리 리스트
+        """
+        stmt = select(*(getattr(cls, name) for name in _ARTICLE_LIST_COLUMNS)).filter_by(**filters)
+        rows = session.execute(stmt).mappings().all()
+        return [
+            {
+                **row,
+                'published_at': row['published_at'].isoformat() if row['published_at'] else None,
+                'created_at': row['created_at'].isoformat() if row['created_at'] else None,
+            }
+            for row in rows
+        ]
+
+    @classmethod
+    def by_tag(cls, session: Session, tag: str) -> List['Article']:
+        """
+        태그로 기사 조회
+
+        JSON_CONTAINS로 DB 엔진에서 필터링하므로 tags JSON을 파이썬으로 가져오지 않습니다.
+
+        Args:
+            session: 데이터베이스 세션
+            tag: 조회할 태그
+
+        Returns:
+            List[Article]: 해당 태그를 가진 기사 목록
+        """
+        stmt = select(cls).where(func.json_contains(cls.tags, json.dumps(tag)))
+        return list(session.execute(stmt).scalars().all())
+
+    def add_tags(self, new_tags: List[str], now: Optional[datetime] = None):
         """태그 추가"""
         if self.tags is None:
             self.tags = []
@@ -140,13 +282,40 @@ class Article(Base):
         existing_tags = set(self.tags)
         unique_new_tags = [tag for tag in new_tags if tag not in existing_tags]
         self.tags.extend(unique_new_tags)
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = now or datetime.now(_UTC)
+
+    def __repr__(self):
+        return f"<Article(id={self.id}, title='{_preview(self, 'title', 50)}...', source='{self.source_name}')>"
+
+
+class ArticleContent(Base):
+    """
+    기사 본문 테이블
+
+    목록 조회 등 대부분의 쿼리가 메타데이터만 사용하므로
+    대용량 본문과 요약을 별도 압축 테이블로 분리합니다.
+    """
+
+    __tablename__ = 'article_contents'
+
+    article_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('articles.id', ondelete='CASCADE'), primary_key=True, comment='기사 ID')
+    content: Mapped[str] = mapped_column(LONGTEXT, nullable=False, comment='기사 본문')
+    summary: Mapped[Optional[str]] = mapped_column(MEDIUMTEXT, nullable=True, comment='기사 요약')
+
+    # 관계 정의
+    article: Mapped["Article"] = relationship("Article", back_populates="content_row")
+
+    __table_args__ = {
+        'mysql_row_format': 'COMPRESSED',
+        'mysql_key_block_size': '8',
+        'comment': '기사 본문 테이블 - 대용량 본문/요약 압축 저장'
+    }
 
     def __repr__(self):
-        return f"<Article(id={self.id}, title='{self.title[:50]}...', source='{self.source_name}')>"
+        return f"<ArticleContent(article_id={self.article_id})>"
 
 
-class Comment(Base):
+class Comment(SentimentMixin, Base):
     """
     댓글 테이블
 
@@ -157,50 +326,55 @@ class Comment(Base):
     __tablename__ = 'comments'
 
     # 기본 키 및 식별자
-    id = Column(BigInteger, primary_key=True, autoincrement=True, comment='댓글 고유 ID')
-    external_id = Column(String(255), nullable=False, comment='외부 시스템 댓글 ID')
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, comment='댓글 고유 ID')
+    external_id: Mapped[str] = mapped_column(String(255), nullable=False, comment='외부 시스템 댓글 ID')
 
     # 관계 정보
-    article_id = Column(BigInteger, ForeignKey('articles.id', ondelete='CASCADE'), nullable=False, comment='소속 기사 ID')
-    parent_id = Column(BigInteger, ForeignKey('comments.id', ondelete='CASCADE'), nullable=True, comment='상위 댓글 ID (대댓글의 경우)')
+    article_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('articles.id', ondelete='CASCADE'), nullable=False, comment='소속 기사 ID')
+    parent_id: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey('comments.id', ondelete='CASCADE'), nullable=True, comment='상위 댓글 ID (대댓글의 경우)')
 
     # 댓글 내용
-    content = Column(MEDIUMTEXT, nullable=False, comment='댓글 내용')
-    author_name = Column(String(100), nullable=True, comment='작성자명')
-    author_id = Column(String(100), nullable=True, comment='작성자 ID')
+    # 목록 조회 시 제외 (필요 시 options(undefer(Comment.content)))
+    content: Mapped[str] = mapped_column(MEDIUMTEXT, nullable=False, deferred=True, comment='댓글 내용')
+    author_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment='작성자명')
+    author_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment='작성자 ID')
 
     # 감성 분석 결과
-    sentiment_score = Column(Float, nullable=True, comment='감성 점수 (-1.0 ~ 1.0)')
-    sentiment_label = Column(String(20), nullable=True, comment='감성 라벨 (positive, negative, neutral)')
-    sentiment_confidence = Column(Float, nullable=True, comment='감성 분석 신뢰도')
+    sentiment_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='감성 점수 (-1.0 ~ 1.0)')
+    sentiment_label: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment='감성 라벨 (positive, negative, neutral)')
+    sentiment_confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='감성 분석 신뢰도')
 
     # 스팸 및 품질 관리
-    is_spam = Column(Boolean, default=False, comment='스팸 여부')
-    spam_confidence = Column(Float, nullable=True, comment='스팸 판정 신뢰도')
-    toxicity_score = Column(Float, nullable=True, comment='독성 점수 (0.0 ~ 1.0)')
+    is_spam: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, comment='스팸 여부')
+    spam_confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='스팸 판정 신뢰도')
+    toxicity_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='독성 점수 (0.0 ~ 1.0)')
 
     # 통계 정보
-    like_count = Column(Integer, default=0, comment='좋아요 수')
-    dislike_count = Column(Integer, default=0, comment='싫어요 수')
-    reply_count = Column(Integer, default=0, comment='답글 수')
+    like_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, comment='좋아요 수')
+    dislike_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, comment='싫어요 수')
+    reply_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, comment='답글 수')
 
     # 시간 정보
-    posted_at = Column(DateTime(timezone=True), nullable=False, comment='댓글 작성일시')
-    crawled_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), comment='크롤링 일시')
+    posted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, comment='댓글 작성일시')
+    crawled_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=_utcnow, comment='크롤링 일시')
 
     # 상태 관리
-    status = Column(String(20), default='active', comment='댓글 상태')
-    is_processed = Column(Boolean, default=False, comment='감성 분석 처리 여부')
+    status: Mapped[Optional[str]] = mapped_column(String(20), default='active', comment='댓글 상태')
+    is_processed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, comment='감성 분석 처리 여부')
 
     # 생성/수정 시간
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), comment='레코드 생성일시')
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), comment='레코드 수정일시')
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=_utcnow, comment='레코드 생성일시')
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow, comment='레코드 수정일시')
 
     # 관계 정의
-    article = relationship("Article", back_populates="comments")
-    replies = relationship("Comment", cascade="all, delete-orphan", remote_side=[id])
+    article: Mapped["Article"] = relationship("Article", back_populates="comments")
+    replies: Mapped[List["Comment"]] = relationship("Comment", cascade="all, delete-orphan", lazy='raise', passive_deletes=True)
 
     # 인덱스 정의
+    # 참고: PARTITION BY HASH(article_id)는 적용하지 않음. InnoDB 파티션 테이블은
+    # 외래 키(article_id, parent_id의 ON DELETE CASCADE)를 지원하지 않고,
+    # 기본 키(id)에도 파티션 키가 포함되어야 하기 때문입니다.
+    # 기사별 조회는 idx_article_posted 복합 인덱스로 처리합니다.
     __table_args__ = (
         Index('idx_article_id', 'article_id'),
         Index('idx_parent_id', 'parent_id'),
@@ -209,18 +383,24 @@ class Comment(Base):
         Index('idx_is_spam', 'is_spam'),
         Index('idx_status', 'status'),
         Index('idx_article_posted', 'article_id', 'posted_at'),  # 복합 인덱스
+        Index('idx_spam_status', 'is_spam', 'status'),  # 스팸 집계용 커버링 인덱스
         UniqueConstraint('external_id', 'article_id', name='uq_external_article'),
         {'comment': '댓글 테이블 - 기사별 댓글 및 감성 분석 결과 저장'}
     )
 
     def to_dict(self) -> Dict[str, Any]:
-        """모델 인스턴스를 딕셔너리로 변환"""
+        """
+        모델 인스턴스를 딕셔너리로 변환
+
+        지연 로딩 컬럼인 content는 이미 로드된 경우에만 포함됩니다.
+        """
+        content_loaded = 'content' not in inspect(self).unloaded
         return {
             'id': self.id,
             'external_id': self.external_id,
             'article_id': self.article_id,
             'parent_id': self.parent_id,
-            'content': self.content,
+            'content': self.content if content_loaded else None,
             'author_name': self.author_name,
             'sentiment_score': self.sentiment_score,
             'sentiment_label': self.sentiment_label,
@@ -231,23 +411,15 @@ class Comment(Base):
             'status': self.status
         }
 
-    def update_sentiment(self, score: float, label: str, confidence: float):
-        """감성 분석 결과 업데이트"""
-        self.sentiment_score = score
-        self.sentiment_label = label
-        self.sentiment_confidence = confidence
-        self.is_processed = True
-        self.updated_at = datetime.now(timezone.utc)
-
-    def mark_as_spam(self, confidence: float = 1.0):
+    def mark_as_spam(self, confidence: float = 1.0, now: Optional[datetime] = None):
         """스팸으로 표시"""
         self.is_spam = True
         self.spam_confidence = confidence
         self.status = 'hidden'
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = now or datetime.now(_UTC)
 
     def __repr__(self):
-        return f"<Comment(id={self.id}, article_id={self.article_id}, content='{self.content[:30]}...')>"
+        return f"<Comment(id={self.id}, article_id={self.article_id}, content='{_preview(self, 'content', 30)}...')>"
 
 
 class Keyword(Base):
@@ -261,37 +433,37 @@ class Keyword(Base):
     __tablename__ = 'keywords'
 
     # 기본 키 및 식별자
-    id = Column(BigInteger, primary_key=True, autoincrement=True, comment='키워드 고유 ID')
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, comment='키워드 고유 ID')
 
     # 관계 정보
-    article_id = Column(BigInteger, ForeignKey('articles.id', ondelete='CASCADE'), nullable=False, comment='소속 기사 ID')
+    article_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('articles.id', ondelete='CASCADE'), nullable=False, comment='소속 기사 ID')
 
     # 키워드 정보
-    keyword = Column(String(200), nullable=False, comment='키워드')
-    keyword_type = Column(String(50), nullable=True, comment='키워드 타입 (entity, topic, emotion 등)')
+    keyword: Mapped[str] = mapped_column(String(200), nullable=False, comment='키워드')
+    keyword_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, comment='키워드 타입 (entity, topic, emotion 등)')
 
     # 중요도 및 점수
-    importance_score = Column(Float, nullable=False, default=0.0, comment='중요도 점수 (0.0 ~ 1.0)')
-    tf_idf_score = Column(Float, nullable=True, comment='TF-IDF 점수')
-    frequency = Column(Integer, nullable=False, default=1, comment='기사 내 등장 빈도')
+    importance_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, comment='중요도 점수 (0.0 ~ 1.0)')
+    tf_idf_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='TF-IDF 점수')
+    frequency: Mapped[int] = mapped_column(Integer, nullable=False, default=1, comment='기사 내 등장 빈도')
 
     # 감성 정보
-    sentiment_contribution = Column(Float, nullable=True, comment='감성에 대한 기여도')
+    sentiment_contribution: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='감성에 대한 기여도')
 
     # 위치 정보
-    first_position = Column(Integer, nullable=True, comment='첫 번째 등장 위치')
-    positions = Column(JSON, nullable=True, comment='모든 등장 위치 (JSON 배열)')
+    first_position: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment='첫 번째 등장 위치')
+    positions: Mapped[Optional[List[int]]] = mapped_column(JSON, nullable=True, comment='모든 등장 위치 (JSON 배열)')
 
     # 메타데이터
-    extraction_method = Column(String(50), nullable=True, comment='추출 방법 (regex, nlp, manual)')
-    confidence = Column(Float, nullable=True, comment='추출 신뢰도')
+    extraction_method: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, comment='추출 방법 (regex, nlp, manual)')
+    confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment='추출 신뢰도')
 
     # 생성/수정 시간
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), comment='레코드 생성일시')
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), comment='레코드 수정일시')
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=_utcnow, comment='레코드 생성일시')
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow, comment='레코드 수정일시')
 
     # 관계 정의
-    article = relationship("Article", back_populates="keywords")
+    article: Mapped["Article"] = relationship("Article", back_populates="keywords")
 
     # 인덱스 정의
     __table_args__ = (
@@ -319,10 +491,101 @@ class Keyword(Base):
             'confidence': self.confidence
         }
 
+    @classmethod
+    def by_min_positions(cls, session: Session, min_count: int,
+                         article_id: Optional[int] = None) -> List['Keyword']:
+        """
+        등장 위치 수 기준 키워드 조회
+
+        JSON_LENGTH로 DB 엔진에서 positions 배열 길이를 계산합니다.
+
+        Args:
+            session: 데이터베이스 세션
+            min_count: 최소 등장 위치 수
+            article_id: 특정 기사로 한정할 경우 기사 ID
+
+        Returns:
+            List[Keyword]: 조건을 만족하는 키워드 목록
+        """
+        stmt = select(cls).where(func.json_length(cls.positions) >= min_count)
+        if article_id is not None:
+            stmt = stmt.where(cls.article_id == article_id)
+        return list(session.execute(stmt).scalars().all())
+
     def __repr__(self):
         return f"<Keyword(id={self.id}, keyword='{self.keyword}', importance={self.importance_score})>"
 
 
+def _iter_batches(rows: List[Dict[str, Any]], batch_size: int):
+    """리스트를 batch_size 크기의 조각으로 나누어 반환"""
+    for start in range(0, len(rows), batch_size):
+        yield rows[start:start + batch_size]
+
+
+def _group_by_keys(rows: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    같은 키 구성의 행끼리 묶음 (순서 유지)
+
+    다중 VALUES INSERT와 ON DUPLICATE KEY UPDATE 컬럼 목록은 모든 행의 키가
+    같아야 하므로, 키 구성이 다른 행은 별도 문장으로 실행합니다.
+    """
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    return list(groups.values())
+
+
+def _dependency_levels(tables) -> List[list]:
+    """
+    외래 키 의존 관계에 따라 테이블을 생성 순서 레벨로 분류
+
+    Args:
+        tables: 위상 정렬된 테이블 목록 (MetaData.sorted_tables)
+
+    Returns:
+        List[list]: 레벨별 테이블 목록 (앞 레벨이 먼저 생성되어야 함)
+    """
+    depth = {}
+    for table in tables:
+        parents = [fk.column.table for fk in table.foreign_keys if fk.column.table is not table]
+        depth[table] = max((depth[parent] + 1 for parent in parents), default=0)
+
+    levels: List[list] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+    for table, level in depth.items():
+        levels[level].append(table)
+    return levels
+
+
+def _split_article_bodies(rows: List[Dict[str, Any]], stamp: Dict[str, datetime]):
+    """
+    기사 행에서 본문 컬럼(content, summary) 분리
+
+    content가 None이면 본문은 갱신하지 않고, 행에 있는 summary만 유지합니다.
+
+    Returns:
+        (articles 테이블 행 리스트, external_id → 본문 딕셔너리)
+    """
+    article_rows = []
+    bodies = {}
+    for row in rows:
+        row = {**stamp, **row}
+        body = {name: row.pop(name) for name in ('content', 'summary') if name in row}
+        if body.get('content') is None:
+            body.pop('content', None)
+        if body:
+            bodies[row['external_id']] = body
+        article_rows.append(row)
+    return article_rows, bodies
+
+
+def _article_content_rows(session: Session, bodies: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """저장된 기사 ID를 조회해 article_contents 행 생성"""
+    ids = session.execute(
+        select(Article.external_id, Article.id).where(Article.external_id.in_(bodies))
+    ).all()
+    return [{'article_id': article_id, **bodies[external_id]} for external_id, article_id in ids]
+
+
 class DatabaseManager:
     """
     데이터베이스 연결 및 세션 관리자
@@ -361,31 +624,57 @@ class DatabaseManager:
                 expire_on_commit=False
             )
 
-            print(f"데이터베이스 연결이 성공적으로 초기화되었습니다: {self.engine.url}")
+            logger.info("데이터베이스 연결이 성공적으로 초기화되었습니다: %s", self.engine.url)
 
-        except Exception as e:
-            print(f"데이터베이스 초기화 오류: {e}")
+        except Exception:
+            logger.exception("데이터베이스 초기화 오류")
             raise
 
-    def create_tables(self, drop_existing: bool = False):
+    def create_tables(self, drop_existing: bool = False, max_workers: int = 4):
         """
         데이터베이스 테이블 생성
 
+        MySQL에서는 외래 키 검사를 끄고 단일 DROP TABLE 문으로 일괄 삭제한 뒤,
+        의존 관계가 없는 테이블끼리 별도 연결에서 병렬로 생성합니다.
+
         Args:
             drop_existing: 기존 테이블 삭제 후 생성 여부
+            max_workers: 테이블 병렬 생성 시 최대 연결 수
         """
         try:
-            if drop_existing:
-                Base.metadata.drop_all(bind=self.engine)
-                print("기존 테이블이 삭제되었습니다.")
-
-            Base.metadata.create_all(bind=self.engine)
-            print("데이터베이스 테이블이 성공적으로 생성되었습니다.")
+            if self.engine.dialect.name != 'mysql':
+                if drop_existing:
+                    Base.metadata.drop_all(bind=self.engine)
+                    logger.info("기존 테이블이 삭제되었습니다.")
+                Base.metadata.create_all(bind=self.engine)
+                logger.info("데이터베이스 테이블이 성공적으로 생성되었습니다.")
+                return
 
-        except Exception as e:
-            print(f"테이블 생성 오류: {e}")
+            if drop_existing:
+                table_names = ", ".join(f"`{table.name}`" for table in Base.metadata.sorted_tables)
+                with self.engine.begin() as conn:
+                    conn.execute(text("SET FOREIGN_KEY_CHECKS=0"))
+                    try:
+                        conn.execute(text(f"DROP TABLE IF EXISTS {table_names}"))
+                    finally:
+                        conn.execute(text("SET FOREIGN_KEY_CHECKS=1"))
+                logger.info("기존 테이블이 삭제되었습니다.")
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for level in _dependency_levels(Base.metadata.sorted_tables):
+                    # 같은 레벨의 테이블은 서로 참조하지 않으므로 병렬 생성 가능
+                    list(executor.map(self._create_table, level))
+            logger.info("데이터베이스 테이블이 성공적으로 생성되었습니다.")
+
+        except Exception:
+            logger.exception("테이블 생성 오류")
             raise
 
+    def _create_table(self, table):
+        """단일 테이블을 별도 연결에서 생성"""
+        with self.engine.begin() as conn:
+            table.create(bind=conn, checkfirst=True)
+
     @contextmanager
     def get_session(self):
         """
@@ -397,13 +686,179 @@ class DatabaseManager:
         try:
             yield session
             session.commit()
-        except Exception as e:
+        except Exception:
             session.rollback()
-            print(f"데이터베이스 트랜잭션 오류: {e}")
+            logger.exception("데이터베이스 트랜잭션 오류")
             raise
         finally:
             session.close()
 
+    def bulk_insert(self, model, rows: List[Dict[str, Any]], batch_size: int = 500) -> int:
+        """
+        레코드 일괄 삽입
+
+        타임스탬프를 한 번만 계산해 모든 행에 주입하므로
+        행마다 컬럼 기본값 함수가 호출되지 않습니다.
+
+        Article 행의 본문(content, summary)은 article_contents에 함께 삽입합니다
+        (ArticleData.to_db_dict() 결과를 그대로 사용할 수 있음).
+
+        Args:
+            model: 대상 모델 클래스 (Article, Comment, Keyword)
+            rows: 삽입할 레코드 딕셔너리 리스트
+            batch_size: 배치당 행 수
+
+        Returns:
+            int: 삽입된 행 수
+        """
+        if not rows:
+            return 0
+
+        now = datetime.now(_UTC)
+        columns = model.__table__.c
+        stamp = {name: now for name in ('crawled_at', 'created_at', 'updated_at') if name in columns}
+
+        with self.get_session() as session:
+            for batch in _iter_batches(rows, batch_size):
+                if model is not Article:
+                    session.execute(model.__table__.insert(), [{**stamp, **row} for row in batch])
+                    continue
+
+                article_rows, bodies = _split_article_bodies(batch, stamp)
+                session.execute(Article.__table__.insert(), article_rows)
+                if not bodies:
+                    continue
+
+                # 새 기사는 본문 행이 없으므로 content 없는 요약만으로는 삽입할 수 없음
+                content_rows = [row for row in _article_content_rows(session, bodies) if 'content' in row]
+                for group in _group_by_keys(content_rows):
+                    session.execute(ArticleContent.__table__.insert(), group)
+
+        return len(rows)
+
+    def upsert_articles(self, rows: List[Dict[str, Any]], batch_size: int = 500) -> int:
+        """
+        기사 일괄 UPSERT (external_id 기준 중복 제거)
+
+        INSERT ... ON DUPLICATE KEY UPDATE로 사전 SELECT 없이 한 번의 왕복으로
+        삽입/갱신합니다. 본문(content, summary)은 article_contents에 같은 방식으로 저장합니다.
+
+        행마다 키 구성이 다르면 키 구성별로 나누어 실행하므로, 행에 없는 컬럼은
+        갱신되지 않습니다. content 없이 summary만 있는 행은 기존 본문의 요약만 갱신합니다.
+
+        Args:
+            rows: 기사 딕셔너리 리스트 (external_id 필수, content/summary 선택)
+            batch_size: 배치당 행 수
+
+        Returns:
+            int: 처리된 행 수
+        """
+        if not rows:
+            return 0
+
+        now = datetime.now(_UTC)
+        stamp = {'crawled_at': now, 'created_at': now, 'updated_at': now}
+        immutable = {'id', 'external_id', 'created_at'}
+
+        with self.get_session() as session:
+            for batch in _iter_batches(rows, batch_size):
+                article_rows, bodies = _split_article_bodies(batch, stamp)
+
+                for group in _group_by_keys(article_rows):
+                    stmt = mysql_insert(Article).values(group)
+                    stmt = stmt.on_duplicate_key_update({
+                        name: stmt.inserted[name]
+                        for name in group[0] if name not in immutable
+                    })
+                    session.execute(stmt)
+
+                if not bodies:
+                    continue
+
+                content_rows = _article_content_rows(session, bodies)
+                for group in _group_by_keys([row for row in content_rows if 'content' in row]):
+                    stmt = mysql_insert(ArticleContent).values(group)
+                    stmt = stmt.on_duplicate_key_update({
+                        name: stmt.inserted[name] for name in group[0] if name != 'article_id'
+                    })
+                    session.execute(stmt)
+
+                # content 없이 요약만 있는 행은 기존 본문 행의 요약만 갱신
+                summary_rows = [row for row in content_rows if 'content' not in row]
+                if summary_rows:
+                    session.execute(update(ArticleContent), summary_rows)
+
+        return len(rows)
+
+    def copy_articles_from_csv(self, path: str, contents_path: Optional[str] = None) -> None:
+        """
+        CSV 파일에서 기사 대량 적재 (초기 데이터 부트스트랩용)
+
+        SQL 파싱을 거치지 않는 DB 네이티브 적재를 사용합니다.
+        MySQL은 LOAD DATA LOCAL INFILE(연결 URL에 local_infile=1 필요),
+        PostgreSQL은 COPY ... FROM STDIN을 사용합니다.
+        일반 저장 경로는 bulk_insert/upsert_articles를 사용하세요.
+
+        CSV 형식: 첫 줄은 컬럼명 헤더, 쉼표 구분, 큰따옴표 인용, 줄바꿈은 LF
+
+        Args:
+            path: articles 테이블 CSV 경로 (id 컬럼 포함 권장)
+            contents_path: article_contents 테이블 CSV 경로 (article_id, content, summary)
+        """
+        self._copy_from_csv(Article.__table__, path)
+        if contents_path:
+            self._copy_from_csv(ArticleContent.__table__, contents_path)
+        logger.info("CSV 대량 적재 완료: %s", path)
+
+    def _copy_from_csv(self, table: Table, path: str):
+        """
+        단일 테이블 CSV 네이티브 적재
+
+        CSV 헤더는 SQL에 직접 들어가므로 테이블 컬럼인지 검증한 뒤 식별자로 인용합니다.
+
+        Raises:
+            ValueError: 테이블에 없는 컬럼이 헤더에 있거나 지원하지 않는 데이터베이스인 경우
+        """
+        dialect = self.engine.dialect.name
+        if dialect not in ('mysql', 'postgresql'):
+            raise ValueError(f"CSV 대량 적재를 지원하지 않는 데이터베이스입니다: {dialect}")
+
+        with open(path, encoding='utf-8', newline='') as f:
+            columns = next(csv.reader(f), [])
+        unknown = [name for name in columns if name not in table.c]
+        if not columns or unknown:
+            raise ValueError(f"{table.name} 테이블에 없는 CSV 컬럼입니다: {unknown or '(헤더 없음)'}")
+
+        preparer = self.engine.dialect.identifier_preparer
+        table_name = preparer.format_table(table)
+        column_list = ", ".join(preparer.quote(name) for name in columns)
+
+        if dialect == 'mysql':
+            with self.engine.begin() as conn:
+                conn.execute(text("SET SESSION unique_checks=0, foreign_key_checks=0"))
+                try:
+                    conn.execute(
+                        text(
+                            f"LOAD DATA LOCAL INFILE :path INTO TABLE {table_name} "
+                            "CHARACTER SET utf8mb4 "
+                            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                            "LINES TERMINATED BY '\\n' IGNORE 1 LINES "
+                            f"({column_list})"
+                        ),
+                        {'path': path}
+                    )
+                finally:
+                    conn.execute(text("SET SESSION unique_checks=1, foreign_key_checks=1"))
+
+        else:
+            raw = self.engine.raw_connection()
+            try:
+                with raw.cursor() as cursor, open(path, encoding='utf-8', newline='') as f:
+                    cursor.copy_expert(f"COPY {table_name} ({column_list}) FROM STDIN WITH CSV HEADER", f)
+                raw.commit()
+            finally:
+                raw.close()
+
     def get_session_direct(self) -> Session:
         """
         직접 세션 객체 반환
@@ -420,14 +875,39 @@ class DatabaseManager:
             bool: 연결 성공 여부
         """
         try:
-            with self.get_session() as session:
-                session.execute("SELECT 1")
-                print("데이터베이스 연결 테스트 성공")
-                return True
+            # 세션/트랜잭션 관리 없이 풀 연결로 직접 확인
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1")).scalar()
+                conn.rollback()
+            logger.debug("데이터베이스 연결 테스트 성공")
+            return True
         except Exception as e:
-            print(f"데이터베이스 연결 테스트 실패: {e}")
+            logger.warning("데이터베이스 연결 테스트 실패: %s", e)
             return False
 
+    def get_articles_with_comments(self, ids: List[int]) -> List[Article]:
+        """
+        댓글과 키워드를 함께 로드한 기사 목록 조회
+
+        selectinload로 관계를 일괄 로드하여 1+2N 쿼리 대신 3개의 쿼리로 처리합니다.
+
+        Args:
+            ids: 조회할 기사 ID 리스트
+
+        Returns:
+            List[Article]: 관계가 로드된 기사 목록
+        """
+        if not ids:
+            return []
+
+        with self.get_session() as session:
+            stmt = (
+                select(Article)
+                .where(Article.id.in_(ids))
+                .options(selectinload(Article.comments), selectinload(Article.keywords))
+            )
+            return list(session.execute(stmt).scalars().all())
+
     def get_table_info(self) -> Dict[str, Any]:
         """
         테이블 정보 조회
@@ -461,8 +941,8 @@ class DatabaseManager:
                     'unique_keywords': session.query(Keyword.keyword).distinct().count()
                 }
 
-        except Exception as e:
-            print(f"테이블 정보 조회 오류: {e}")
+        except Exception:
+            logger.exception("테이블 정보 조회 오류")
 
         return info
 
@@ -470,21 +950,36 @@ class DatabaseManager:
         """데이터베이스 연결 종료"""
         if self.engine:
             self.engine.dispose()
-            print("데이터베이스 연결이 종료되었습니다.")
+            logger.info("데이터베이스 연결이 종료되었습니다.")
+
+
+@functools.lru_cache(maxsize=1)
+def get_db_manager() -> DatabaseManager:
+    """
+    전역 데이터베이스 매니저 반환
+
+    최초 호출 시점에 생성하므로 모델만 import하는 코드(마이그레이션, 테스트 등)는
+    커넥션 풀을 만들지 않습니다.
+    """
+    return DatabaseManager()
+
 
+def __getattr__(name: str):
+    """기존 db_manager 전역 변수 접근 호환 (지연 생성)"""
+    if name == 'db_manager':
+        return get_db_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# 전역 데이터베이스 매니저 인스턴스
-db_manager = DatabaseManager()
 
 # 하위 호환성을 위한 함수들
 def get_session():
     """세션 컨텍스트 매니저 반환"""
-    return db_manager.get_session()
+    return get_db_manager().get_session()
 
 def create_tables(drop_existing: bool = False):
     """테이블 생성"""
-    return db_manager.create_tables(drop_existing)
+    return get_db_manager().create_tables(drop_existing)
 
 def test_connection() -> bool:
     """연결 테스트"""
-    return db_manager.test_connection()
+    return get_db_manager().test_connection()
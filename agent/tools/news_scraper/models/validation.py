@@ -5,14 +5,63 @@
 Pydantic을 활용한 데이터 검증 및 직렬화 모델 정의
 """
 
-from typing import Optional, List, Dict, Any, Union
-from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Union, Annotated, Tuple, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone, timedelta
 from enum import Enum
+from functools import lru_cache
+from itertools import repeat
+import html
+import json
 import re
 from urllib.parse import urlparse
 
-from pydantic import BaseModel, Field, validator, root_validator, HttpUrl
-from pydantic.types import constr, confloat, conint
+from pydantic import (
+    BaseModel, ConfigDict, Field, HttpUrl, SkipValidation, StringConstraints, TypeAdapter,
+    ValidationError, ValidationInfo, computed_field, field_validator, model_validator
+)
+
+
+# 댓글 작성일시 허용 범위 (10년)
+_MAX_COMMENT_AGE = timedelta(days=3650)
+
+# 정규식 패턴 (모듈 로드 시 1회 컴파일)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_NL_RE = re.compile(r'\n\s*\n')
+_HSPACE_RE = re.compile(r'[ \t]{2,}|\t')  # 이미 정규화된 단일 공백은 매칭하지 않음
+_AUTHOR_BAD_RE = re.compile(r'[<>"\']')
+_KEYWORD_RE = re.compile(r'^[가-힣a-zA-Z0-9\s\-_.]+$')
+# 스킴 + 호스트 + 선택적 경로/쿼리/프래그먼트 (fullmatch로 공백 포함 URL 거부)
+_URL_RE = re.compile(r'https?://([^/?#\s]+)(?:[/?#]\S*)?', re.IGNORECASE)
+
+
+def _context_now(info: ValidationInfo) -> datetime:
+    """검증 컨텍스트의 기준 시각 반환 (배치 검증 시 1회 계산된 값 공유)"""
+    if info.context and 'now' in info.context:
+        return info.context['now']
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(v: datetime) -> datetime:
+    """시간대 없는 일시는 UTC로 간주 (aware 기준 시각과 비교 시 TypeError 방지)"""
+    return v.replace(tzinfo=timezone.utc) if v.tzinfo is None else v
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_netloc(netloc: str) -> bool:
+    """URL 호스트 부분 검증 (같은 언론사 URL이 반복되므로 netloc 단위로 캐시)"""
+    try:
+        parsed = urlparse(f'//{netloc}')
+        return bool(parsed.hostname) and (parsed.port is None or parsed.port > 0)
+    except ValueError:
+        return False
+
+
+def _strip_html(text: str) -> str:
+    """HTML 태그 제거 (태그가 없는 문자열은 정규식 스캔 생략)"""
+    if '<' not in text:
+        return text
+    return _HTML_TAG_RE.sub('', text)
 
 
 class SentimentLabel(str, Enum):
@@ -22,6 +71,14 @@ class SentimentLabel(str, Enum):
     NEUTRAL = "neutral"
 
 
+# 감성 점수 구간별 기대 라벨 (음수/중성/양수 순)
+_SENTIMENT_BY_BUCKET = (
+    (SentimentLabel.NEGATIVE, '음수 감성 점수는 negative 라벨과 일치해야 합니다'),
+    (SentimentLabel.NEUTRAL, '중성 감성 점수는 neutral 라벨과 일치해야 합니다'),
+    (SentimentLabel.POSITIVE, '양수 감성 점수는 positive 라벨과 일치해야 합니다'),
+)
+
+
 class CrawlMethod(str, Enum):
     """크롤링 방법 열거형"""
     PLAYWRIGHT = "playwright"
@@ -47,82 +104,79 @@ class CommentData(BaseModel):
     """
 
     # 필수 필드
-    external_id: constr(min_length=1, max_length=255) = Field(..., description="외부 시스템 댓글 ID")
-    content: constr(min_length=1, max_length=50000) = Field(..., description="댓글 내용")
+    external_id: Annotated[str, StringConstraints(min_length=1, max_length=255)] = Field(..., description="외부 시스템 댓글 ID")
+    content: Annotated[str, StringConstraints(min_length=1, max_length=50000)] = Field(..., description="댓글 내용")
     posted_at: datetime = Field(..., description="댓글 작성일시")
 
     # 선택 필드
-    author_name: Optional[constr(max_length=100)] = Field(None, description="작성자명")
-    author_id: Optional[constr(max_length=100)] = Field(None, description="작성자 ID")
+    author_name: Optional[Annotated[str, StringConstraints(max_length=100)]] = Field(None, description="작성자명")
+    author_id: Optional[Annotated[str, StringConstraints(max_length=100)]] = Field(None, description="작성자 ID")
     parent_id: Optional[str] = Field(None, description="상위 댓글 ID")
 
     # 통계 필드
-    like_count: conint(ge=0) = Field(0, description="좋아요 수")
-    dislike_count: conint(ge=0) = Field(0, description="싫어요 수")
-    reply_count: conint(ge=0) = Field(0, description="답글 수")
+    like_count: int = Field(0, ge=0, description="좋아요 수")
+    dislike_count: int = Field(0, ge=0, description="싫어요 수")
+    reply_count: int = Field(0, ge=0, description="답글 수")
 
     # 감성 분석 결과 (선택)
-    sentiment_score: Optional[confloat(ge=-1.0, le=1.0)] = Field(None, description="감성 점수")
+    sentiment_score: Optional[float] = Field(None, ge=-1.0, le=1.0, description="감성 점수")
     sentiment_label: Optional[SentimentLabel] = Field(None, description="감성 라벨")
-    sentiment_confidence: Optional[confloat(ge=0.0, le=1.0)] = Field(None, description="감성 분석 신뢰도")
+    sentiment_confidence: Optional[float] = Field(None, ge=0.0, le=1.0, description="감성 분석 신뢰도")
 
     # 스팸 및 품질 관리
     is_spam: bool = Field(False, description="스팸 여부")
-    spam_confidence: Optional[confloat(ge=0.0, le=1.0)] = Field(None, description="스팸 판정 신뢰도")
-    toxicity_score: Optional[confloat(ge=0.0, le=1.0)] = Field(None, description="독성 점수")
+    spam_confidence: Optional[float] = Field(None, ge=0.0, le=1.0, description="스팸 판정 신뢰도")
+    toxicity_score: Optional[float] = Field(None, ge=0.0, le=1.0, description="독성 점수")
 
     # 크롤링 메타데이터
     crawl_method: Optional[CrawlMethod] = Field(None, description="크롤링 방법")
     crawled_at: Optional[datetime] = Field(None, description="크롤링 일시")
 
-    class Config:
-        """Pydantic 설정"""
-        use_enum_values = True
-        validate_assignment = True
-        str_strip_whitespace = True
+    # frozen=True를 써도 pydantic v2 모델은 필드를 __dict__에 저장하므로
+    # 인스턴스 메모리가 줄지 않음 (측정 결과 동일). 할당 검증을 유지합니다.
+    model_config = ConfigDict(
+        use_enum_values=True,
+        validate_assignment=True,
+        str_strip_whitespace=True
+    )
 
-    @validator('content')
-    def validate_content(cls, v):
+    @field_validator('content')
+    @classmethod
+    def validate_content(cls, v: str) -> str:
         """댓글 내용 검증 및 정제"""
-        if not v or not v.strip():
+        if not v:  # str_strip_whitespace로 이미 앞뒤 공백 제거됨
             raise ValueError('댓글 내용은 필수입니다')
 
         # HTML 태그 제거 (간단한 정규식)
-        v = re.sub(r'<[^>]+>', '', v)
-
-        # 연속된 공백 정규화
-        v = re.sub(r'\s+', ' ', v)
+        v = _strip_html(v)
 
-        # 앞뒤 공백 제거
-        v = v.strip()
-
-        return v
-
-    @validator('posted_at')
-    def validate_posted_at(cls, v):
-        """작성일시 검증"""
-        if v is None:
-            raise ValueError('댓글 작성일시는 필수입니다')
+        # 연속된 공백 정규화 및 앞뒤 공백 제거
+        return ' '.join(v.split())
 
+    @field_validator('posted_at')
+    @classmethod
+    def validate_posted_at(cls, v: datetime, info: ValidationInfo) -> datetime:
+        """작성일시 검증 (시간대 없는 값은 UTC로 간주)"""
+        v = _as_utc(v)
         # 미래 날짜 검증
-        now = datetime.now(timezone.utc)
+        now = _context_now(info)
         if v > now:
             raise ValueError('댓글 작성일시는 현재 시점보다 미래일 수 없습니다')
 
         # 너무 오래된 날짜 검증 (10년 이전)
-        from datetime import timedelta
-        ten_years_ago = now - timedelta(days=3650)
+        ten_years_ago = now - _MAX_COMMENT_AGE
         if v < ten_years_ago:
             raise ValueError('댓글 작성일시가 너무 오래되었습니다')
 
         return v
 
-    @validator('author_name')
-    def validate_author_name(cls, v):
+    @field_validator('author_name')
+    @classmethod
+    def validate_author_name(cls, v: Optional[str]) -> Optional[str]:
         """작성자명 검증"""
         if v is not None:
             # 특수문자 제거
-            v = re.sub(r'[<>"']', '', v)
+            v = _AUTHOR_BAD_RE.sub('', v)
             v = v.strip()
 
             # 빈 문자열이면 None 처리
@@ -131,43 +185,30 @@ class CommentData(BaseModel):
 
         return v
 
-    @root_validator
-    def validate_sentiment_consistency(cls, values):
+    @model_validator(mode='after')
+    def validate_sentiment_consistency(self) -> 'CommentData':
         """감성 분석 결과 일관성 검증"""
-        score = values.get('sentiment_score')
-        label = values.get('sentiment_label')
+        score = self.sentiment_score
+        label = self.sentiment_label
 
         if score is not None and label is not None:
-            # 점수와 라벨 일관성 검증
-            if score > 0.1 and label != SentimentLabel.POSITIVE:
-                raise ValueError('양수 감성 점수는 positive 라벨과 일치해야 합니다')
-            elif score < -0.1 and label != SentimentLabel.NEGATIVE:
-                raise ValueError('음수 감성 점수는 negative 라벨과 일치해야 합니다')
-            elif -0.1 <= score <= 0.1 and label != SentimentLabel.NEUTRAL:
-                raise ValueError('중성 감성 점수는 neutral 라벨과 일치해야 합니다')
+            # 점수 구간(-1/0/1)으로 기대 라벨을 조회해 한 번만 비교
+            expected, message = _SENTIMENT_BY_BUCKET[(score > 0.1) - (score < -0.1) + 1]
+            if label != expected:
+                raise ValueError(message)
 
-        return values
+        return self
 
-    def to_db_dict(self) -> Dict[str, Any]:
-        """데이터베이스 저장용 딕셔너리로 변환"""
-        return {
-            'external_id': self.external_id,
-            'content': self.content,
-            'posted_at': self.posted_at,
-            'author_name': self.author_name,
-            'author_id': self.author_id,
-            'like_count': self.like_count,
-            'dislike_count': self.dislike_count,
-            'reply_count': self.reply_count,
-            'sentiment_score': self.sentiment_score,
-            'sentiment_label': self.sentiment_label.value if self.sentiment_label else None,
-            'sentiment_confidence': self.sentiment_confidence,
-            'is_spam': self.is_spam,
-            'spam_confidence': self.spam_confidence,
-            'toxicity_score': self.toxicity_score,
-            'crawl_method': self.crawl_method.value if self.crawl_method else None,
-            'crawled_at': self.crawled_at or datetime.now(timezone.utc)
-        }
+    def to_db_dict(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        데이터베이스 저장용 딕셔너리로 변환
+
+        Args:
+            now: crawled_at 기본값 (배치 저장 시 동일한 시각 공유용)
+        """
+        data = self.model_dump(exclude={'parent_id'})
+        data['crawled_at'] = data['crawled_at'] or now or datetime.now(timezone.utc)
+        return data
 
 
 class ArticleData(BaseModel):
@@ -179,28 +220,28 @@ class ArticleData(BaseModel):
     """
 
     # 필수 필드
-    external_id: constr(min_length=1, max_length=255) = Field(..., description="외부 시스템 기사 ID")
-    title: constr(min_length=1, max_length=5000) = Field(..., description="기사 제목")
-    content: constr(min_length=50) = Field(..., description="기사 본문")
-    source_name: constr(min_length=1, max_length=100) = Field(..., description="언론사명")
-    original_url: HttpUrl = Field(..., description="원문 URL")
+    external_id: Annotated[str, StringConstraints(min_length=1, max_length=255)] = Field(..., description="외부 시스템 기사 ID")
+    title: Annotated[str, StringConstraints(min_length=1, max_length=5000)] = Field(..., description="기사 제목")
+    content: Annotated[str, StringConstraints(min_length=50)] = Field(..., description="기사 본문")
+    source_name: Annotated[str, StringConstraints(min_length=1, max_length=100)] = Field(..., description="언론사명")
+    original_url: Annotated[str, StringConstraints(max_length=2083)] = Field(..., description="원문 URL")
     published_at: datetime = Field(..., description="기사 발행일시")
 
     # 선택 필드
-    summary: Optional[constr(max_length=10000)] = Field(None, description="기사 요약")
-    source_category: Optional[constr(max_length=50)] = Field(None, description="언론사 카테고리")
-    category: Optional[constr(max_length=50)] = Field(None, description="기사 카테고리")
+    summary: Optional[Annotated[str, StringConstraints(max_length=10000)]] = Field(None, description="기사 요약")
+    source_category: Optional[Annotated[str, StringConstraints(max_length=50)]] = Field(None, description="언론사 카테고리")
+    category: Optional[Annotated[str, StringConstraints(max_length=50)]] = Field(None, description="기사 카테고리")
     tags: Optional[List[str]] = Field(None, description="태그 목록")
 
     # 통계 필드
-    view_count: conint(ge=0) = Field(0, description="조회수")
-    like_count: conint(ge=0) = Field(0, description="좋아요 수")
-    share_count: conint(ge=0) = Field(0, description="공유 수")
+    view_count: int = Field(0, ge=0, description="조회수")
+    like_count: int = Field(0, ge=0, description="좋아요 수")
+    share_count: int = Field(0, ge=0, description="공유 수")
 
     # 감성 분석 결과
-    sentiment_score: Optional[confloat(ge=-1.0, le=1.0)] = Field(None, description="감성 점수")
+    sentiment_score: Optional[float] = Field(None, ge=-1.0, le=1.0, description="감성 점수")
     sentiment_label: Optional[SentimentLabel] = Field(None, description="감성 라벨")
-    sentiment_confidence: Optional[confloat(ge=0.0, le=1.0)] = Field(None, description="감성 분석 신뢰도")
+    sentiment_confidence: Optional[float] = Field(None, ge=0.0, le=1.0, description="감성 분석 신뢰도")
 
     # 크롤링 메타데이터
     crawl_method: Optional[CrawlMethod] = Field(None, description="크롤링 방법")
@@ -209,114 +250,91 @@ class ArticleData(BaseModel):
     crawled_at: Optional[datetime] = Field(None, description="크롤링 일시")
 
     # 상태 관리
-    status: ArticleStatus = Field(ArticleStatus.ACTIVE, description="기사 상태")
+    status: ArticleStatus = Field(ArticleStatus.ACTIVE, validate_default=True, description="기사 상태")
 
-    class Config:
-        """Pydantic 설정"""
-        use_enum_values = True
-        validate_assignment = True
-        str_strip_whitespace = True
+    model_config = ConfigDict(
+        use_enum_values=True,
+        validate_assignment=True,
+        str_strip_whitespace=True
+    )
 
-    @validator('title')
-    def validate_title(cls, v):
+    @field_validator('title')
+    @classmethod
+    def validate_title(cls, v: str) -> str:
         """기사 제목 검증 및 정제"""
-        if not v or not v.strip():
+        if not v:
             raise ValueError('기사 제목은 필수입니다')
 
         # HTML 태그 제거
-        v = re.sub(r'<[^>]+>', '', v)
-
-        # 특수문자 정규화
-        v = re.sub(r'[\r\n\t]+', ' ', v)
-        v = re.sub(r'\s+', ' ', v)
-        v = v.strip()
+        v = _strip_html(v)
 
-        return v
+        # 제어문자(\r\n\t) 및 연속 공백 정규화
+        return ' '.join(v.split())
 
-    @validator('content')
-    def validate_content(cls, v):
+    @field_validator('content')
+    @classmethod
+    def validate_content(cls, v: str) -> str:
         """기사 본문 검증 및 정제"""
-        if not v or len(v.strip()) < 50:
+        if len(v) < 50:
             raise ValueError('기사 본문은 최소 50자 이상이어야 합니다')
 
         # HTML 태그 제거 (본문은 일부 태그 보존 가능)
         # 여기서는 단순화를 위해 모든 태그 제거
-        v = re.sub(r'<[^>]+>', '', v)
+        v = _strip_html(v)
 
         # 연속된 공백과 줄바꿈 정규화
-        v = re.sub(r'\n\s*\n', '\n\n', v)  # 연속된 빈 줄을 두 줄로 제한
-        v = re.sub(r'[ \t]+', ' ', v)  # 연속된 공백을 하나로
+        if '\n' in v:
+            v = _NL_RE.sub('\n\n', v)  # 연속된 빈 줄을 두 줄로 제한
+        v = _HSPACE_RE.sub(' ', v)  # 연속된 공백/탭을 하나로
 
         return v.strip()
 
-    @validator('tags')
-    def validate_tags(cls, v):
+    @field_validator('tags')
+    @classmethod
+    def validate_tags(cls, v: Optional[List[str]]) -> Optional[List[str]]:
         """태그 검증 및 정제"""
         if v is None:
             return v
 
-        # 빈 태그 제거 및 정제
-        cleaned_tags = []
-        for tag in v:
-            if isinstance(tag, str):
-                tag = tag.strip()
-                if tag and len(tag) <= 50:  # 태그 길이 제한
-                    cleaned_tags.append(tag)
-
-        # 중복 제거
-        return list(set(cleaned_tags))
-
-    @validator('published_at')
-    def validate_published_at(cls, v):
-        """발행일시 검증"""
-        if v is None:
-            raise ValueError('기사 발행일시는 필수입니다')
-
+        # 빈 태그 제거 및 정제 후 입력 순서를 유지하며 중복 제거
+        stripped = (tag.strip() for tag in v if isinstance(tag, str))
+        return list(dict.fromkeys(
+            tag for tag in stripped
+            if tag and len(tag) <= 50  # 태그 길이 제한
+        ))
+
+    @field_validator('published_at')
+    @classmethod
+    def validate_published_at(cls, v: datetime, info: ValidationInfo) -> datetime:
+        """발행일시 검증 (시간대 없는 값은 UTC로 간주)"""
+        v = _as_utc(v)
         # 미래 날짜 검증
-        now = datetime.now(timezone.utc)
+        now = _context_now(info)
         if v > now:
             raise ValueError('기사 발행일시는 현재 시점보다 미래일 수 없습니다')
 
         return v
 
-    @validator('original_url')
-    def validate_url(cls, v):
-        """URL 검증"""
-        if not v:
-            raise ValueError('원문 URL은 필수입니다')
-
-        # URL 구조 검증
-        parsed = urlparse(str(v))
-        if not parsed.netloc:
+    @field_validator('original_url')
+    @classmethod
+    def validate_url(cls, v: str) -> str:
+        """URL 검증 (전체 형식 확인 후 호스트 부분만 캐시 검증)"""
+        match = _URL_RE.fullmatch(v)
+        if not match or not _is_valid_netloc(match.group(1)):
             raise ValueError('유효한 URL 형식이 아닙니다')
 
         return v
 
-    def to_db_dict(self) -> Dict[str, Any]:
-        """데이터베이스 저장용 딕셔너리로 변환"""
-        return {
-            'external_id': self.external_id,
-            'title': self.title,
-            'content': self.content,
-            'summary': self.summary,
-            'source_name': self.source_name,
-            'source_category': self.source_category,
-            'original_url': str(self.original_url),
-            'published_at': self.published_at,
-            'category': self.category,
-            'tags': self.tags,
-            'view_count': self.view_count,
-            'like_count': self.like_count,
-            'share_count': self.share_count,
-            'sentiment_score': self.sentiment_score,
-            'sentiment_label': self.sentiment_label.value if self.sentiment_label else None,
-            'sentiment_confidence': self.sentiment_confidence,
-            'crawl_method': self.crawl_method.value if self.crawl_method else None,
-            'crawl_success': self.crawl_success,
-            'crawl_error_message': self.crawl_error_message,
-            'crawled_at': self.crawled_at or datetime.now(timezone.utc),
-            'status': self.status.value
-        }
+    def to_db_dict(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        데이터베이스 저장용 딕셔너리로 변환
+
+        Args:
+            now: crawled_at 기본값 (배치 저장 시 동일한 시각 공유용)
+        """
+        data = self.model_dump()
+        data['crawled_at'] = data['crawled_at'] or now or datetime.now(timezone.utc)
+        return data
 
 
 class KeywordData(BaseModel):
@@ -328,21 +346,22 @@ class KeywordData(BaseModel):
     """
 
     # 필수 필드
-    keyword: constr(min_length=1, max_length=200) = Field(..., description="키워드")
-    importance_score: confloat(ge=0.0, le=1.0) = Field(..., description="중요도 점수")
-    frequency: conint(ge=1) = Field(1, description="등장 빈도")
+    keyword: Annotated[str, StringConstraints(min_length=1, max_length=200)] = Field(..., description="키워드")
+    importance_score: float = Field(..., ge=0.0, le=1.0, description="중요도 점수")
+    frequency: int = Field(1, ge=1, description="등장 빈도")
 
     # 선택 필드
     keyword_type: Optional[str] = Field(None, description="키워드 타입")
     tf_idf_score: Optional[float] = Field(None, description="TF-IDF 점수")
-    sentiment_contribution: Optional[confloat(ge=-1.0, le=1.0)] = Field(None, description="감성 기여도")
-    first_position: Optional[conint(ge=0)] = Field(None, description="첫 등장 위치")
+    sentiment_contribution: Optional[float] = Field(None, ge=-1.0, le=1.0, description="감성 기여도")
+    first_position: Optional[int] = Field(None, ge=0, description="첫 등장 위치")
     positions: Optional[List[int]] = Field(None, description="모든 등장 위치")
     extraction_method: Optional[str] = Field(None, description="추출 방법")
-    confidence: Optional[confloat(ge=0.0, le=1.0)] = Field(None, description="추출 신뢰도")
+    confidence: Optional[float] = Field(None, ge=0.0, le=1.0, description="추출 신뢰도")
 
-    @validator('keyword')
-    def validate_keyword(cls, v):
+    @field_validator('keyword')
+    @classmethod
+    def validate_keyword(cls, v: str) -> str:
         """키워드 검증 및 정제"""
         if not v or not v.strip():
             raise ValueError('키워드는 필수입니다')
@@ -351,13 +370,14 @@ class KeywordData(BaseModel):
         v = v.strip().lower()
 
         # 특수문자 제한 검증
-        if not re.match(r'^[가-힣a-zA-Z0-9\s\-_.]+$', v):
+        if not _KEYWORD_RE.match(v):
             raise ValueError('키워드에 허용되지 않는 특수문자가 포함되어 있습니다')
 
         return v
 
-    @validator('positions')
-    def validate_positions(cls, v):
+    @field_validator('positions')
+    @classmethod
+    def validate_positions(cls, v: Optional[List[int]]) -> Optional[List[int]]:
         """등장 위치 검증"""
         if v is not None:
             # 중복 제거 및 정렬
@@ -370,18 +390,7 @@ class KeywordData(BaseModel):
 
     def to_db_dict(self) -> Dict[str, Any]:
         """데이터베이스 저장용 딕셔너리로 변환"""
-        return {
-            'keyword': self.keyword,
-            'keyword_type': self.keyword_type,
-            'importance_score': self.importance_score,
-            'tf_idf_score': self.tf_idf_score,
-            'frequency': self.frequency,
-            'sentiment_contribution': self.sentiment_contribution,
-            'first_position': self.first_position,
-            'positions': self.positions,
-            'extraction_method': self.extraction_method,
-            'confidence': self.confidence
-        }
+        return self.model_dump()
 
 
 class CrawlingRequest(BaseModel):
@@ -396,8 +405,8 @@ class CrawlingRequest(BaseModel):
     crawl_method: CrawlMethod = Field(CrawlMethod.PLAYWRIGHT, description="크롤링 방법")
 
     # 선택 필드
-    max_pages: conint(ge=1, le=1000) = Field(10, description="최대 크롤링 페이지 수")
-    delay_seconds: confloat(ge=0.0, le=60.0) = Field(1.0, description="페이지 간 지연 시간")
+    max_pages: int = Field(10, ge=1, le=1000, description="최대 크롤링 페이지 수")
+    delay_seconds: float = Field(1.0, ge=0.0, le=60.0, description="페이지 간 지연 시간")
     include_comments: bool = Field(True, description="댓글 포함 여부")
     include_images: bool = Field(False, description="이미지 포함 여부")
 
@@ -411,26 +420,28 @@ class CrawlingRequest(BaseModel):
     headers: Optional[Dict[str, str]] = Field(None, description="추가 HTTP 헤더")
     cookies: Optional[Dict[str, str]] = Field(None, description="쿠키")
 
-    @validator('date_from', 'date_to')
-    def validate_dates(cls, v):
-        """날짜 검증"""
+    @field_validator('date_from', 'date_to')
+    @classmethod
+    def validate_dates(cls, v: Optional[datetime]) -> Optional[datetime]:
+        """날짜 검증 (시간대 없는 값은 UTC로 간주)"""
         if v is not None:
+            v = _as_utc(v)
             now = datetime.now(timezone.utc)
             if v > now:
                 raise ValueError('날짜는 현재 시점보다 미래일 수 없습니다')
         return v
 
-    @root_validator
-    def validate_date_range(cls, values):
+    @model_validator(mode='after')
+    def validate_date_range(self) -> 'CrawlingRequest':
         """날짜 범위 검증"""
-        date_from = values.get('date_from')
-        date_to = values.get('date_to')
+        date_from = self.date_from
+        date_to = self.date_to
 
         if date_from is not None and date_to is not None:
             if date_from >= date_to:
                 raise ValueError('시작 날짜는 종료 날짜보다 이전이어야 합니다')
 
-        return values
+        return self
 
 
 class BatchValidationResult(BaseModel):
@@ -444,90 +455,249 @@ class BatchValidationResult(BaseModel):
     valid_count: int = Field(..., description="유효한 데이터 수")
     invalid_count: int = Field(..., description="무효한 데이터 수")
 
-    valid_data: List[Any] = Field(..., description="유효한 데이터 목록")
-    invalid_data: List[Dict[str, Any]] = Field(..., description="무효한 데이터 및 오류 정보")
+    # 배치 검증기가 이미 검증한 결과를 담으므로 리스트 재검증(원소별 순회/복사) 생략
+    valid_data: SkipValidation[List[Any]] = Field(..., description="유효한 데이터 목록")
+    invalid_data: SkipValidation[List[Dict[str, Any]]] = Field(..., description="무효한 데이터 및 오류 정보")
 
-    success_rate: float = Field(..., description="성공률 (0.0 ~ 1.0)")
+    @computed_field(description="성공률 (0.0 ~ 1.0)")
+    @property
+    def success_rate(self) -> float:
+        """성공률 (조회 시 계산)"""
+        if self.total_count == 0:
+            return 0.0
 
-    @validator('success_rate', pre=True, always=True)
-    def calculate_success_rate(cls, v, values):
-        """성공률 자동 계산"""
-        total = values.get('total_count', 0)
-        valid = values.get('valid_count', 0)
+        return self.valid_count / self.total_count
 
-        if total == 0:
-            return 0.0
 
-        return valid / total
+# 배치 검증용 TypeAdapter (모듈 로드 시 1회 생성)
+_COMMENTS_ADAPTER = TypeAdapter(List[CommentData])
+_ARTICLES_ADAPTER = TypeAdapter(List[ArticleData])
+_BATCH_ADAPTERS = {
+    'comments': (_COMMENTS_ADAPTER, CommentData),
+    'articles': (_ARTICLES_ADAPTER, ArticleData),
+}
 
+# 프로세스 풀 분할 시 워커 하나가 최소로 맡을 행 수
+_PARALLEL_MIN_ROWS = 2000
 
-# 유틸리티 함수들
-def validate_comments_batch(comments_data: List[Dict[str, Any]]) -> BatchValidationResult:
+
+def _format_errors(errors: List[Dict[str, Any]]) -> str:
+    """한 행의 검증 오류 목록을 문자열로 변환"""
+    return '; '.join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'model'}: {err['msg']}"
+        for err in errors
+    )
+
+
+def _validate_rows(kind: str, rows: List[Dict[str, Any]], now: datetime,
+                   offset: int = 0) -> Tuple[List[Any], List[Dict[str, Any]]]:
     """
-    댓글 데이터 일괄 검증
+    TypeAdapter로 리스트 전체를 한 번에 검증
 
-    Args:
-        comments_data: 댓글 데이터 리스트
+    모두 유효하면 pydantic-core 호출 한 번으로 끝나고, 오류가 있으면
+    오류 위치(loc[0])의 행 번호로 유효/무효 데이터를 분리합니다.
+    프로세스 풀 워커에서도 호출되므로 모듈 최상위에 두고 kind 문자열로
+    어댑터를 선택합니다. offset은 원본 리스트 기준 행 번호 보정값입니다.
+    """
+    adapter, model = _BATCH_ADAPTERS[kind]
+    context = {'now': now}
+    try:
+        return adapter.validate_python(rows, context=context), []
+    except ValidationError as exc:
+        errors_by_index: Dict[int, List[Dict[str, Any]]] = {}
+        # ctx(원본 예외 객체)와 input(data와 중복)은 제외해 결과를 JSON 직렬화 가능하게 유지
+        for err in exc.errors(include_url=False, include_context=False, include_input=False):
+            # 행 번호는 invalid_data의 index로 옮기고 loc에는 필드 경로만 남김
+            index, err['loc'] = err['loc'][0], err['loc'][1:]
+            errors_by_index.setdefault(index, []).append(err)
+
+        valid_data = [
+            model.model_validate(row, context=context)
+            for i, row in enumerate(rows) if i not in errors_by_index
+        ]
+        invalid_data = [
+            {'index': offset + i, 'data': rows[i],
+             'error': _format_errors(errors), 'errors': errors}
+            for i, errors in sorted(errors_by_index.items())
+        ]
+        return valid_data, invalid_data
+
+
+def _validate_batch(kind: str, rows: List[Dict[str, Any]],
+                    max_workers: Optional[int] = None) -> BatchValidationResult:
+    """
+    배치 검증 (max_workers 지정 시 프로세스 풀로 분할 검증)
 
-    Returns:
-        BatchValidationResult: 검증 결과
+    워커 간 결과 모델을 pickle로 주고받는 비용이 있어 행 수가
+    _PARALLEL_MIN_ROWS 미만이면 max_workers와 관계없이 단일 프로세스로 처리합니다.
+    """
+    now = datetime.now(timezone.utc)
+    workers = min(max_workers or 1, len(rows) // _PARALLEL_MIN_ROWS)
+
+    if workers <= 1:
+        valid_data, invalid_data = _validate_rows(kind, rows, now)
+    else:
+        # 연속 구간으로 나눠야 offset만으로 원래 행 번호를 복원할 수 있음
+        size = -(-len(rows) // workers)
+        offsets = range(0, len(rows), size)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                _validate_rows,
+                repeat(kind),
+                (rows[start:start + size] for start in offsets),
+                repeat(now),
+                offsets,
+            ))
+        valid_data = [item for valid, _ in results for item in valid]
+        invalid_data = [item for _, invalid in results for item in invalid]
+
+    return _build_result(len(rows), valid_data, invalid_data)
+
+
+def _validate_batch_json(kind: str, payload: Union[str, bytes]) -> BatchValidationResult:
     """
-    valid_data = []
-    invalid_data = []
+    JSON 배열 페이로드를 pydantic-core에서 파싱과 검증을 한 번에 처리
 
-    for i, comment_dict in enumerate(comments_data):
+    모두 유효하면 json.loads 없이 끝나고, 오류가 있을 때만 행 단위
+    분리를 위해 파싱한 뒤 dict 경로로 다시 검증합니다.
+
+    Raises:
+        ValueError: JSON으로 파싱할 수 없거나 배열이 아닌 페이로드
+    """
+    adapter, _ = _BATCH_ADAPTERS[kind]
+    now = datetime.now(timezone.utc)
+    try:
+        valid_data = adapter.validate_json(payload, context={'now': now})
+    except ValidationError as exc:
+        try:
+            rows = json.loads(payload)
+        except ValueError:
+            rows = None
+        if not isinstance(rows, list):
+            # 행 단위로 나눌 수 없는 페이로드는 배치 결과 대신 단일 오류로 보고
+            raise ValueError('JSON 배열 형식의 페이로드가 아닙니다') from exc
+        valid_data, invalid_data = _validate_rows(kind, rows, now)
+        return _build_result(len(rows), valid_data, invalid_data)
+
+    return _build_result(len(valid_data), valid_data, [])
+
+
+def _iter_validate(kind: str, rows: Iterable[Dict[str, Any]]
+                   ) -> Iterator[Tuple[int, Union[BaseModel, ValidationError]]]:
+    """행 단위 검증 결과를 (행 번호, 모델 또는 ValidationError)로 하나씩 반환"""
+    _, model = _BATCH_ADAPTERS[kind]
+    context = {'now': datetime.now(timezone.utc)}
+    for index, row in enumerate(rows):
         try:
-            comment = CommentData(**comment_dict)
-            valid_data.append(comment)
-        except Exception as e:
-            invalid_data.append({
-                'index': i,
-                'data': comment_dict,
-                'error': str(e)
-            })
+            yield index, model.model_validate(row, context=context)
+        except ValidationError as exc:
+            yield index, exc
 
+
+def _build_result(total_count: int, valid_data: List[Any],
+                  invalid_data: List[Dict[str, Any]]) -> BatchValidationResult:
+    """검증 결과 객체 생성"""
     return BatchValidationResult(
-        total_count=len(comments_data),
+        total_count=total_count,
         valid_count=len(valid_data),
         invalid_count=len(invalid_data),
         valid_data=valid_data,
         invalid_data=invalid_data,
-        success_rate=0.0  # 자동 계산됨
     )
 
 
-def validate_articles_batch(articles_data: List[Dict[str, Any]]) -> BatchValidationResult:
+# 유틸리티 함수들
+def validate_comments_batch(comments_data: List[Dict[str, Any]],
+                            max_workers: Optional[int] = None) -> BatchValidationResult:
+    """
+    댓글 데이터 일괄 검증
+
+    Args:
+        comments_data: 댓글 데이터 리스트
+        max_workers: 병렬 검증 프로세스 수 (None이면 단일 프로세스)
+
+    Returns:
+        BatchValidationResult: 검증 결과
+    """
+    return _validate_batch('comments', comments_data, max_workers)
+
+
+def validate_articles_batch(articles_data: List[Dict[str, Any]],
+                            max_workers: Optional[int] = None) -> BatchValidationResult:
     """
     기사 데이터 일괄 검증
 
     Args:
         articles_data: 기사 데이터 리스트
+        max_workers: 병렬 검증 프로세스 수 (None이면 단일 프로세스)
 
     Returns:
         BatchValidationResult: 검증 결과
     """
-    valid_data = []
-    invalid_data = []
+    return _validate_batch('articles', articles_data, max_workers)
 
-    for i, article_dict in enumerate(articles_data):
-        try:
-            article = ArticleData(**article_dict)
-            valid_data.append(article)
-        except Exception as e:
-            invalid_data.append({
-                'index': i,
-                'data': article_dict,
-                'error': str(e)
-            })
 
-    return BatchValidationResult(
-        total_count=len(articles_data),
-        valid_count=len(valid_data),
-        invalid_count=len(invalid_data),
-        valid_data=valid_data,
-        invalid_data=invalid_data,
-        success_rate=0.0  # 자동 계산됨
-    )
+def validate_comments_batch_json(payload: Union[str, bytes]) -> BatchValidationResult:
+    """
+    JSON 문자열/바이트로 받은 댓글 배열 일괄 검증
+
+    Args:
+        payload: 댓글 객체 배열의 JSON 문자열 또는 바이트
+
+    Returns:
+        BatchValidationResult: 검증 결과
+
+    Raises:
+        ValueError: JSON으로 파싱할 수 없거나 배열이 아닌 페이로드
+    """
+    return _validate_batch_json('comments', payload)
+
+
+def validate_articles_batch_json(payload: Union[str, bytes]) -> BatchValidationResult:
+    """
+    JSON 문자열/바이트로 받은 기사 배열 일괄 검증
+
+    Args:
+        payload: 기사 객체 배열의 JSON 문자열 또는 바이트
+
+    Returns:
+        BatchValidationResult: 검증 결과
+
+    Raises:
+        ValueError: JSON으로 파싱할 수 없거나 배열이 아닌 페이로드
+    """
+    return _validate_batch_json('articles', payload)
+
+
+def iter_validate_comments(comments_data: Iterable[Dict[str, Any]]
+                           ) -> Iterator[Tuple[int, Union[CommentData, ValidationError]]]:
+    """
+    댓글 데이터 스트리밍 검증
+
+    결과 리스트를 만들지 않으므로 대량 수집 데이터를 바로 저장 단계로
+    넘길 때 사용합니다.
+
+    Args:
+        comments_data: 댓글 데이터 이터러블
+
+    Yields:
+        (행 번호, CommentData 또는 ValidationError)
+    """
+    return _iter_validate('comments', comments_data)
+
+
+def iter_validate_articles(articles_data: Iterable[Dict[str, Any]]
+                           ) -> Iterator[Tuple[int, Union[ArticleData, ValidationError]]]:
+    """
+    기사 데이터 스트리밍 검증
+
+    Args:
+        articles_data: 기사 데이터 이터러블
+
+    Yields:
+        (행 번호, ArticleData 또는 ValidationError)
+    """
+    return _iter_validate('articles', articles_data)
 
 
 def sanitize_html_content(content: str) -> str:
@@ -544,22 +714,10 @@ def sanitize_html_content(content: str) -> str:
         return ""
 
     # HTML 태그 제거
-    content = re.sub(r'<[^>]+>', '', content)
-
-    # HTML 엔티티 디코딩 (간단한 경우만)
-    entity_map = {
-        '&amp;': '&',
-        '&lt;': '<', 
-        '&gt;': '>',
-        '&quot;': '"',
-        '&#39;': "'",
-        '&nbsp;': ' '
-    }
-
-    for entity, char in entity_map.items():
-        content = content.replace(entity, char)
+    content = _strip_html(content)
 
-    # 연속된 공백 정규화
-    content = re.sub(r'\s+', ' ', content)
+    # HTML 엔티티 디코딩 (명명/숫자 엔티티 일괄 처리, &nbsp;는 아래 공백 정규화에서 처리)
+    content = html.unescape(content)
 
-    return content.strip()
+    # 연속된 공백 정규화 및 앞뒤 공백 제거
+    return ' '.join(content.split())
@@ -5,19 +5,25 @@ Naver News Scraper
 네이버 뉴스 검색 및 기사 내용 추출 기능 제공
 """
 
-import time
+import re
+from functools import lru_cache
 from typing import List, Dict, Any
 from urllib.parse import quote
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from common.config import get_config
 from common.utils import safe_log, validate_input, validate_url
 from .base_scraper import BaseNewsScraper
 from .models import NewsArticle, Comment
 
 
+# 디버그 출력 여부 (DEBUG=true일 때만 [DEBUG] 출력 및 디버깅용 페이지 조회 수행)
+DEBUG = get_config().DEBUG
+
 # 네이버 뉴스 CSS Selector 상수 (2024년 12월 기준)
 NAVER_SELECTORS = {
     "news_link": [
@@ -68,6 +74,67 @@ NAVER_SELECTORS = {
     "comment": ".u_cbox_comment_box .u_cbox_contents",
 }
 
+# 뉴스 링크 셀렉터를 하나의 CSS 셀렉터 그룹으로 결합 (브라우저가 한 번에 평가)
+NEWS_LINK_SELECTOR = ", ".join(NAVER_SELECTORS["news_link"])
+
+# 네이버 뉴스 기사 URL 패턴
+# - 모바일 뉴스: https://n.news.naver.com/mnews/article/001/0015819227
+# - PC 뉴스: https://news.naver.com/main/read.nhn?mode=...
+# - 기타 news.naver.com 하위 /article/ 경로
+NAVER_ARTICLE_URL_RE = re.compile(r"news\.naver\.com(?:/main/read|.*/article/)")
+
+# 페이지 타이틀의 " : 네이버 뉴스" 등 사이트명 접미사
+PAGE_TITLE_SUFFIX_RE = re.compile(r'\s*[:|-]\s*(네이버|NAVER).*$')
+
+# 셀렉터에 매칭되는 링크의 href를 한 번의 WebDriver 호출로 수집하는 스크립트
+# (중복 href는 브라우저에서 제거하여 전송량 축소, 문서 순서 유지)
+COLLECT_HREFS_SCRIPT = (
+    "return [...new Set(Array.from(document.querySelectorAll(arguments[0]), a => a.href))]"
+    ".filter(Boolean);"
+)
+
+# 셀렉터에 매칭되는 모든 요소의 텍스트 (요소별 .text 왕복 대신 한 번에 수집)
+ELEMENT_TEXTS_SCRIPT = "return Array.from(document.querySelectorAll(arguments[0]), el => el.innerText.trim());"
+
+# 문서 HTML 길이와 앞부분 미리보기 (page_source 전체 전송 방지)
+PAGE_PREVIEW_SCRIPT = (
+    "const html = document.documentElement.outerHTML;"
+    "return [html.length, html.slice(0, arguments[0])];"
+)
+
+# 문서 로드 상태 ("loading" / "interactive" / "complete")
+READY_STATE_SCRIPT = "return document.readyState;"
+
+# 셀렉터에 매칭되는 요소 수 (find_elements와 달리 implicit wait 없이 즉시 반환)
+COUNT_SCRIPT = "return document.querySelectorAll(arguments[0]).length;"
+
+# 기사 페이지 준비 판단용 셀렉터 (제목/본문 후보 중 하나라도 있으면 추출 시작)
+ARTICLE_READY_SELECTOR = ", ".join(NAVER_SELECTORS["title"] + NAVER_SELECTORS["content"])
+ARTICLE_READY_TIMEOUT = 2
+
+# 댓글 영역 존재 판단용 셀렉터 (더보기 버튼이나 댓글이 없으면 댓글 비활성 기사로 간주)
+COMMENT_AREA_SELECTOR = f'{NAVER_SELECTORS["comment_more"]}, {NAVER_SELECTORS["comment"]}'
+COMMENT_AREA_TIMEOUT = 1
+COMMENT_LOAD_TIMEOUT = 3
+
+# 셀렉터 목록을 우선순위대로 평가해 최소 길이를 넘는 첫 텍스트와 셀렉터 번호를 반환
+# (joinAll이면 셀렉터에 매칭된 모든 요소의 텍스트를 합쳐서 판단)
+FIRST_TEXT_SCRIPT = """
+const [selectors, minLength, joinAll] = arguments;
+for (let i = 0; i < selectors.length; i++) {
+    const texts = Array.from(document.querySelectorAll(selectors[i]), el => el.innerText.trim())
+        .filter(Boolean);
+    const text = joinAll ? texts.join(' ') : texts.find(t => t.length > minLength);
+    if (text && text.length > minLength) {
+        return [i, text];
+    }
+}
+return null;
+"""
+
+# 검색에서 검증한 URL을 기사 추출 시 다시 검증하지 않도록 결과 캐시
+_validate_url_cached = lru_cache(maxsize=1024)(validate_url)
+
 
 class NaverNewsScraper(BaseNewsScraper):
     """네이버 뉴스 전용 크롤러"""
@@ -95,125 +162,80 @@ class NaverNewsScraper(BaseNewsScraper):
             # 네이버 뉴스 검색 URL (URL 인코딩)
             encoded_keyword = quote(keyword)
             search_url = f"https://search.naver.com/search.naver?where=news&query={encoded_keyword}"
-            print(f"[DEBUG] 네이버 뉴스 검색 시작: keyword={keyword}, url={search_url}")
+            if DEBUG:
+                print(f"[DEBUG] 네이버 뉴스 검색 시작: keyword={keyword}, url={search_url}")
             safe_log("네이버 뉴스 검색 시작", level="info", keyword=keyword, url=search_url)
 
             self.driver.get(search_url)
-            print(f"[DEBUG] 페이지 로드 완료, 2초 대기 중...")
-            time.sleep(3)  # 페이지 로드 대기 (3초로 증가)
+
+            # 문서 로드 완료만 한 번 확인 (검색 결과는 서버 렌더링이라 이후 바로 수집 가능)
+            # 셀렉터 존재 대기는 결과가 없을 때 CRAWLER_TIMEOUT 내내 폴링하므로 사용하지 않음
+            try:
+                WebDriverWait(self.driver, self.config.CRAWLER_TIMEOUT).until(
+                    lambda d: d.execute_script(READY_STATE_SCRIPT) == "complete"
+                )
+            except TimeoutException:
+                pass
 
             # 페이지 로드 확인
             current_url = self.driver.current_url
             page_title = self.driver.title
-            print(f"[DEBUG] 현재 URL: {current_url}, 페이지 제목: {page_title}")
+            if DEBUG:
+                print(f"[DEBUG] 현재 URL: {current_url}, 페이지 제목: {page_title}")
             safe_log("페이지 로드 완료", level="info", current_url=current_url, page_title=page_title)
 
-            # 여러 셀렉터 시도 (네이버가 구조를 자주 변경함)
-            # find_elements 사용 (타임아웃 없이 즉시 반환)
-            news_links = []
-            selectors = NAVER_SELECTORS["news_link"]
-            
-            print(f"[DEBUG] 총 {len(selectors)}개의 셀렉터 시도")
-            for i, selector in enumerate(selectors, 1):
-                try:
-                    print(f"[DEBUG] 셀렉터 {i}/{len(selectors)} 시도: {selector}")
-                    
-                    # find_elements는 요소가 없으면 빈 리스트 반환 (예외 없음)
-                    links = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    if links and len(links) > 0:
-                        # href 속성이 있는 링크만 필터링
-                        valid_links = [link for link in links if link.get_attribute("href")]
-                        if valid_links:
-                            news_links = valid_links
-                            print(f"[DEBUG] ✓ 셀렉터 성공! {len(valid_links)}개의 유효한 링크 발견")
-                            safe_log("셀렉터 성공", level="info", selector=selector, count=len(valid_links))
-                            break
-                        else:
-                            print(f"[DEBUG] ✗ 셀렉터 {i}: 요소는 있지만 href 없음")
-                    else:
-                        print(f"[DEBUG] ✗ 셀렉터 {i}: 요소 없음")
-                except Exception as e:
-                    error_msg = str(e)[:100]
-                    print(f"[DEBUG] ✗ 셀렉터 실패: {error_msg}")
-                    continue
-            
+            # 통합 셀렉터로 후보 링크의 href를 한 번에 수집
+            # (셀렉터별 find_elements와 요소별 get_attribute 왕복을 한 번의 호출로 대체)
+            hrefs = self.driver.execute_script(COLLECT_HREFS_SCRIPT, NEWS_LINK_SELECTOR) or []
+            if DEBUG:
+                print(f"[DEBUG] 통합 셀렉터로 {len(hrefs)}개의 링크 발견")
+
             # 모든 셀렉터 실패 시 디버깅 정보 출력
-            if not news_links:
-                print(f"[DEBUG] !! 모든 셀렉터 실패 !!")
-                # 페이지 소스 일부 출력 (디버깅용)
-                page_source = self.driver.page_source
-                print(f"[DEBUG] 페이지 소스 길이: {len(page_source)}")
-                print(f"[DEBUG] 페이지 소스 미리보기:\n{page_source[:2000]}\n...")
-                
+            if not hrefs:
+                # 페이지 소스 전체를 전송받지 않고 브라우저에서 잘라낸 미리보기만 수집
+                page_source_length, page_source_preview = self.driver.execute_script(
+                    PAGE_PREVIEW_SCRIPT, 2000
+                )
                 safe_log("페이지 로드 실패 - 디버깅 정보", level="error", 
                         page_title=page_title,
-                        page_source_preview=page_source[:1000],
+                        page_source_preview=page_source_preview[:1000],
                         current_url=current_url,
-                        page_source_length=len(page_source))
+                        page_source_length=page_source_length)
                 
-                # 스크린샷 저장 (디버깅용)
-                try:
-                    screenshot_path = "/tmp/naver_search_debug.png"
-                    self.driver.save_screenshot(screenshot_path)
-                    print(f"[DEBUG] 스크린샷 저장: {screenshot_path}")
-                    safe_log("디버깅 스크린샷 저장", level="info", path=screenshot_path)
-                except Exception as ss_error:
-                    print(f"[DEBUG] 스크린샷 저장 실패: {ss_error}")
+                if DEBUG:
+                    print(f"[DEBUG] !! 모든 셀렉터 실패 !!")
+                    print(f"[DEBUG] 페이지 소스 길이: {page_source_length}")
+                    print(f"[DEBUG] 페이지 소스 미리보기:\n{page_source_preview}\n...")
+                    
+                    # 스크린샷 저장 (디버깅용)
+                    try:
+                        screenshot_path = "/tmp/naver_search_debug.png"
+                        self.driver.save_screenshot(screenshot_path)
+                        print(f"[DEBUG] 스크린샷 저장: {screenshot_path}")
+                        safe_log("디버깅 스크린샷 저장", level="info", path=screenshot_path)
+                    except Exception as ss_error:
+                        print(f"[DEBUG] 스크린샷 저장 실패: {ss_error}")
                 
                 return []
 
-            # URL 목록 추출
-            article_urls = []
-            print(f"[DEBUG] {len(news_links)}개의 링크에서 URL 추출 시작")
-            
             # 디버깅: 처음 5개 링크의 전체 URL 출력
-            for i, link in enumerate(news_links[:5], 1):
-                try:
-                    href = link.get_attribute("href")
-                    if href:
-                        print(f"[DEBUG] 샘플 링크 {i} (전체): {href}")
-                except Exception:
-                    pass
-            
-            for i, link in enumerate(news_links[:max_articles * 3], 1):  # 더 많이 수집 후 필터링
-                try:
-                    href = link.get_attribute("href")
-                    if href and validate_url(href):
-                        # 네이버 뉴스 기사 URL 엄격 필터링
-                        is_news_article = False
-                        
-                        # 실제 기사 URL 패턴만 허용
-                        if "n.news.naver.com/mnews/article/" in href:
-                            # 모바일 뉴스: https://n.news.naver.com/mnews/article/001/0015819227
-                            is_news_article = True
-                            print(f"[DEBUG] ✓ 모바일 뉴스 기사: {href[:80]}...")
-                        elif "news.naver.com/main/read" in href:
-                            # PC 뉴스: https://news.naver.com/main/read.nhn?mode=...
-                            is_news_article = True
-                            print(f"[DEBUG] ✓ PC 뉴스 기사: {href[:80]}...")
-                        elif "/article/" in href and "news.naver.com" in href:
-                            # 기타 기사 패턴
-                            is_news_article = True
-                            print(f"[DEBUG] ✓ 기타 뉴스 기사: {href[:80]}...")
-                        else:
-                            # 제외되는 URL 로그 (디버깅용)
-                            if "news.naver.com" in href:
-                                print(f"[DEBUG] ✗ 기사 아님 (제외): {href[:80]}...")
-                        
-                        if is_news_article:
-                            article_urls.append(href)
-                                
-                        if len(article_urls) >= max_articles:
-                            break
-                except Exception as e:
-                    print(f"[DEBUG] 링크 추출 실패: {e}")
-                    continue
+            if DEBUG:
+                for i, href in enumerate(hrefs[:5], 1):
+                    print(f"[DEBUG] 샘플 링크 {i} (전체): {href}")
+
+            # 네이버 뉴스 기사 URL 엄격 필터링 (실제 기사 URL 패턴만 허용)
+            article_urls = []
+            for href in hrefs:
+                if NAVER_ARTICLE_URL_RE.search(href) and _validate_url_cached(href):
+                    article_urls.append(href)
+                    if len(article_urls) >= max_articles:
+                        break
 
-            print(f"[DEBUG] 최종 수집된 URL 개수: {len(article_urls)}")
+            if DEBUG:
+                print(f"[DEBUG] 최종 수집된 URL 개수: {len(article_urls)}")
             
             # URL이 0개면 페이지 소스를 더 자세히 출력
-            if len(article_urls) == 0:
+            if DEBUG and len(article_urls) == 0:
                 print(f"[DEBUG] !! 뉴스 URL이 하나도 없음. 페이지 HTML 샘플:")
                 try:
                     # 뉴스 관련 요소 찾기
@@ -247,7 +269,7 @@ class NaverNewsScraper(BaseNewsScraper):
         Returns:
             추출된 기사 정보
         """
-        if not validate_url(url):
+        if not _validate_url_cached(url):
             return {
                 "title": "추출 실패",
                 "content": "유효하지 않은 URL",
@@ -261,84 +283,63 @@ class NaverNewsScraper(BaseNewsScraper):
 
         try:
             self.driver.get(url)
-            wait = WebDriverWait(self.driver, self.config.CRAWLER_TIMEOUT)
 
-            # 페이지 로드 대기
-            time.sleep(2)
+            # 제목/본문 후보 요소가 나타날 때까지만 대기 (기존 고정 대기 2초를 상한으로 유지)
+            try:
+                WebDriverWait(self.driver, ARTICLE_READY_TIMEOUT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ARTICLE_READY_SELECTOR))
+                )
+            except TimeoutException:
+                pass
             
-            # 제목 추출 (여러 셀렉터 시도)
+            # 제목 추출 (우선순위 셀렉터를 브라우저에서 한 번에 평가)
             title = None
-            title_selectors = NAVER_SELECTORS["title"]
-            
-            print(f"[DEBUG] 제목 추출 시도 (URL: {url[:60]}...)")
-            for i, title_selector in enumerate(title_selectors, 1):
-                try:
-                    title_elements = self.driver.find_elements(By.CSS_SELECTOR, title_selector)
-                    if title_elements:
-                        for elem in title_elements:
-                            text = elem.text.strip()
-                            if text and len(text) > 3:  # 최소 3자 이상
-                                title = text
-                                print(f"[DEBUG] ✓ 제목 추출 성공! (셀렉터 {i}: {title_selector})")
-                                break
-                    if title:
-                        break
-                except Exception:
-                    continue
+            if DEBUG:
+                print(f"[DEBUG] 제목 추출 시도 (URL: {url[:60]}...)")
+            found = self.driver.execute_script(
+                FIRST_TEXT_SCRIPT, NAVER_SELECTORS["title"], 3, False  # 최소 3자 초과
+            )
+            if found:
+                index, title = found
+                if DEBUG:
+                    print(f"[DEBUG] ✓ 제목 추출 성공! (셀렉터 {index + 1}: {NAVER_SELECTORS['title'][index]})")
             
             if not title:
                 # 페이지 타이틀에서 추출 시도
                 page_title = self.driver.title
                 if page_title:
                     # " : 네이버 뉴스" 등 제거
-                    import re
-                    title = re.sub(r'\s*[:|-]\s*(네이버|NAVER).*$', '', page_title).strip()
-                    if title:
+                    title = PAGE_TITLE_SUFFIX_RE.sub('', page_title).strip()
+                    if title and DEBUG:
                         print(f"[DEBUG] ✓ 페이지 타이틀에서 추출: {title[:50]}...")
                 
             if not title:
                 safe_log("제목 추출 실패 - 모든 셀렉터 실패", level="warning", url=url)
                 title = "제목 추출 실패"
 
-            # 본문 추출 (여러 셀렉터 시도)
+            # 본문 추출 (셀렉터별 요소 텍스트를 합쳐 50자를 넘는 첫 결과 사용)
             content = None
-            content_selectors = NAVER_SELECTORS["content"]
-            
-            print(f"[DEBUG] 본문 추출 시도 (총 {len(content_selectors)}개 셀렉터)")
-            for i, content_selector in enumerate(content_selectors, 1):
-                try:
-                    content_elements = self.driver.find_elements(By.CSS_SELECTOR, content_selector)
-                    if content_elements:
-                        # 모든 텍스트 수집
-                        texts = []
-                        for elem in content_elements:
-                            text = elem.text.strip()
-                            if text:
-                                texts.append(text)
-                        
-                        content_text = " ".join(texts)
-                        if content_text and len(content_text) > 50:  # 최소 50자 이상
-                            content = content_text
-                            print(f"[DEBUG] ✓ 본문 추출 성공! (셀렉터 {i}: {content_selector}, 길이: {len(content)}자)")
-                            break
-                        else:
-                            print(f"[DEBUG] 셀렉터 {i} ({content_selector}): 내용 부족 ({len(content_text) if content_text else 0}자)")
-                    else:
-                        print(f"[DEBUG] 셀렉터 {i} ({content_selector}): 요소 없음")
-                except Exception as e:
-                    print(f"[DEBUG] 셀렉터 {i} ({content_selector}): 에러 - {str(e)[:50]}")
-                    continue
+            if DEBUG:
+                print(f"[DEBUG] 본문 추출 시도 (총 {len(NAVER_SELECTORS['content'])}개 셀렉터)")
+            found = self.driver.execute_script(
+                FIRST_TEXT_SCRIPT, NAVER_SELECTORS["content"], 50, True
+            )
+            if found:
+                index, content = found
+                if DEBUG:
+                    print(f"[DEBUG] ✓ 본문 추출 성공! (셀렉터 {index + 1}: {NAVER_SELECTORS['content'][index]}, 길이: {len(content)}자)")
             
             # 마지막 수단: body에서 p 태그 수집
             if not content:
                 try:
-                    p_elements = self.driver.find_elements(By.TAG_NAME, "p")
-                    if p_elements:
-                        texts = [p.text.strip() for p in p_elements if p.text.strip() and len(p.text.strip()) > 20]
-                        if texts:
-                            content = " ".join(texts[:10])  # 처음 10개 문단
-                            if len(content) > 50:
-                                print(f"[DEBUG] ✓ p 태그에서 본문 추출 (길이: {len(content)}자)")
+                    texts = [
+                        text for text in self.driver.execute_script(ELEMENT_TEXTS_SCRIPT, "p")
+                        if len(text) > 20
+                    ]
+                    if texts:
+                        content = " ".join(texts[:10])  # 처음 10개 문단
+                        if len(content) > 50 and DEBUG:
+                            print(f"[DEBUG] ✓ p 태그에서 본문 추출 (길이: {len(content)}자)")
                 except Exception:
                     pass
             
@@ -378,38 +379,50 @@ class NaverNewsScraper(BaseNewsScraper):
         comments = []
 
         try:
-            wait = WebDriverWait(self.driver, 5)
-
-            # 댓글 더보기 버튼 클릭 시도
+            # 댓글 영역이 짧은 시간 안에 나타나지 않으면 더 찾지 않고 종료
+            # (find_element 기반 대기는 implicit wait에 묶이므로 스크립트로 개수만 확인)
             try:
-                more_button = wait.until(
-                    EC.element_to_be_clickable(
-                        (By.CSS_SELECTOR, NAVER_SELECTORS["comment_more"])
-                    )
+                WebDriverWait(self.driver, COMMENT_AREA_TIMEOUT).until(
+                    lambda d: d.execute_script(COUNT_SCRIPT, COMMENT_AREA_SELECTOR) > 0
                 )
-                more_button.click()
-                time.sleep(2)  # 댓글 로딩 대기
-            except Exception:
-                pass  # 더보기 버튼이 없을 수 있음
-
-            # 댓글 요소들 찾기
-            comment_elements = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                NAVER_SELECTORS["comment"]
-            )
+            except TimeoutException:
+                if DEBUG:
+                    print(f"[DEBUG] 댓글 영역 없음, 댓글 추출 생략")
+                return comments
+
+            wait = WebDriverWait(self.driver, COMMENT_LOAD_TIMEOUT)
 
-            for i, comment_elem in enumerate(comment_elements[:10]):  # 최대 10개
+            # 댓글 더보기 버튼 클릭 시도 (버튼이 있을 때만 클릭 가능 상태를 기다림)
+            if self.driver.execute_script(COUNT_SCRIPT, NAVER_SELECTORS["comment_more"]):
                 try:
-                    text = comment_elem.text.strip()
-                    if text:
-                        comments.append({
-                            "id": f"comment_{i+1}",
-                            "text": text,
-                            "author": f"사용자{i+1}",
-                            "timestamp": None
-                        })
+                    more_button = wait.until(
+                        EC.element_to_be_clickable(
+                            (By.CSS_SELECTOR, NAVER_SELECTORS["comment_more"])
+                        )
+                    )
+                    prev_count = self.driver.execute_script(COUNT_SCRIPT, NAVER_SELECTORS["comment"])
+                    more_button.click()
+                    # 댓글 수가 늘어날 때까지만 대기
+                    wait.until(
+                        lambda d: d.execute_script(COUNT_SCRIPT, NAVER_SELECTORS["comment"]) > prev_count
+                    )
                 except Exception:
-                    continue
+                    pass  # 클릭할 수 없거나 더 불러올 댓글이 없을 수 있음
+
+            # 댓글 텍스트를 한 번의 호출로 수집
+            comment_texts = self.driver.execute_script(
+                ELEMENT_TEXTS_SCRIPT,
+                NAVER_SELECTORS["comment"]
+            )
+
+            for i, text in enumerate(comment_texts[:10]):  # 최대 10개
+                if text:
+                    comments.append({
+                        "id": f"comment_{i+1}",
+                        "text": text,
+                        "author": f"사용자{i+1}",
+                        "timestamp": None
+                    })
 
         except Exception as e:
             safe_log("댓글 추출 중 오류", level="warning", error=str(e))
@@ -438,7 +451,7 @@ class NaverNewsScraper(BaseNewsScraper):
                 author=c.get("author"),
                 timestamp=None
             )
-            for c in result.get("comments", [])
+            for c in result.get("comments", ())
         ]
 
         return NewsArticle(
@@ -6,14 +6,191 @@ Selenium 대비 2-3배 빠른 속도와 네이티브 비동기 지원
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import functools
+import logging
+import os
+import re
+import signal
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
+from urllib.parse import urlparse, urlsplit, urlunsplit
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from common.config import get_config
 from common.utils import safe_log
 
+logger = logging.getLogger(__name__)
+
+
+# 크롤링에 불필요해 차단하는 리소스 타입
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+
+# 광고/분석 트래커 호스트 (리소스 타입과 무관하게 차단, 하위 도메인 포함)
+BLOCKED_HOST_RE = re.compile(
+    r"^[a-z]+://(?:[^/?#]*\.)?(?:"
+    r"doubleclick\.net|googlesyndication\.com|googleadservices\.com|"
+    r"google-analytics\.com|googletagmanager\.com|googletagservices\.com|"
+    r"adservice\.google\.com|facebook\.net|scorecardresearch\.com|criteo\.(?:com|net)|"
+    r"veta\.naver\.com|wcs\.naver\.net|lcs\.naver\.com"
+    r")(?::\d+)?(?:[/?#]|$)",
+    re.IGNORECASE,
+)
+
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-software-rasterizer',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-translate',
+    '--hide-scrollbars',
+    '--mute-audio',
+    '--no-first-run',
+    '--safebrowsing-disable-auto-update',
+]
+
+# 프로세스 전체가 공유하는 Playwright/Chromium (스크래퍼 인스턴스는 컨텍스트만 소유)
+# Playwright 객체는 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 새로 실행합니다.
+_SHARED: Dict[str, Any] = {"loop": None, "lock": None, "playwright": None, "browser": None, "users": 0}
+
+
+def _kill_stale_driver(playwright) -> None:
+    """
+    닫힌 이벤트 루프에 남은 Playwright 드라이버 프로세스 종료
+
+    루프가 닫히면 browser.close()/playwright.stop()을 await할 수 없으므로
+    드라이버 프로세스를 직접 종료합니다 (파이프가 끊기면 Chromium도 함께 종료됨).
+    """
+    try:
+        pid = playwright._impl_obj._connection._transport._proc.pid
+        os.kill(pid, signal.SIGTERM)
+    except Exception as e:
+        safe_log("이전 Playwright 드라이버 종료 실패", level="warning", error=str(e))
+
+
+def _shared_lock() -> asyncio.Lock:
+    """
+    현재 이벤트 루프용 공유 브라우저 잠금 반환
+
+    다른 루프에서 실행한 브라우저가 남아 있으면 그 루프가 살아 있는 동안은
+    RuntimeError로 거부하고(그 루프에서 shutdown_shared()를 먼저 호출해야 함),
+    이미 닫힌 루프라면 남은 드라이버 프로세스를 종료한 뒤 새로 시작합니다.
+    """
+    loop = asyncio.get_running_loop()
+    old_loop = _SHARED["loop"]
+    if old_loop is not loop:
+        if _SHARED["playwright"] is not None:
+            if old_loop is not None and not old_loop.is_closed():
+                raise RuntimeError(
+                    "공유 Playwright 브라우저가 다른 이벤트 루프에서 실행 중입니다. "
+                    "해당 루프에서 shutdown_shared()를 먼저 호출하세요."
+                )
+            safe_log("닫힌 이벤트 루프의 Playwright 브라우저 정리", level="warning", users=_SHARED["users"])
+            _kill_stale_driver(_SHARED["playwright"])
+        _SHARED.update(loop=loop, lock=asyncio.Lock(), playwright=None, browser=None, users=0)
+    return _SHARED["lock"]
+
+
+async def _acquire_shared_browser() -> Browser:
+    """공유 브라우저 참조 획득 (없거나 연결이 끊겼으면 실행)"""
+    async with _shared_lock():
+        browser = _SHARED["browser"]
+        if browser is None or not browser.is_connected():
+            try:
+                if _SHARED["playwright"] is None:
+                    _SHARED["playwright"] = await async_playwright().start()
+                browser = await _SHARED["playwright"].chromium.launch(headless=True, args=BROWSER_ARGS)
+            except Exception as e:
+                safe_log("Playwright 브라우저 초기화 실패", level="error", error=str(e))
+                raise RuntimeError(f"Playwright 초기화 실패: {e}")
+            _SHARED["browser"] = browser
+            logger.debug("Playwright 브라우저 초기화 완료")
+            safe_log("Playwright 브라우저 초기화 완료", level="info")
+        _SHARED["users"] += 1
+        return browser
+
+
+async def _release_shared_browser() -> None:
+    """공유 브라우저 참조 반환 (마지막 사용자면 브라우저 종료)"""
+    async with _shared_lock():
+        _SHARED["users"] = max(_SHARED["users"] - 1, 0)
+        if _SHARED["users"] == 0:
+            await _close_shared()
+
+
+async def _close_shared() -> None:
+    """공유 브라우저와 Playwright 드라이버 종료"""
+    browser, playwright = _SHARED["browser"], _SHARED["playwright"]
+    _SHARED.update(browser=None, playwright=None, users=0)
+    if browser is not None:
+        await browser.close()
+    if playwright is not None:
+        await playwright.stop()
+
+
+async def shutdown_shared() -> None:
+    """
+    공유 브라우저 강제 종료 (프로세스 종료 전 최종 정리용)
+    
+    각 스크래퍼의 cleanup()을 모두 호출했다면 이미 종료되어 있습니다.
+    브라우저를 실행한 이벤트 루프에서 호출해야 하며, 다른 루프에서 공유
+    브라우저를 사용하려면 이전 루프가 닫히기 전에 먼저 호출하세요.
+    """
+    async with _shared_lock():
+        await _close_shared()
+
+
+# 기사 캐시 키에서 제외할 추적용 쿼리 파라미터
+TRACKING_QUERY_PARAMS = frozenset({"ref", "fbclid", "gclid"})
+TRACKING_QUERY_PREFIXES = ("utm_",)
+
+
+def _article_cache_key(url: str) -> str:
+    """캐시 키용 URL 정규화 (fragment와 추적용 파라미터 제거, 호스트 소문자화)"""
+    parts = urlsplit(url)
+    query = "&".join(
+        param for param in parts.query.split("&")
+        if param
+        and param.split("=", 1)[0] not in TRACKING_QUERY_PARAMS
+        and not param.startswith(TRACKING_QUERY_PREFIXES)
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+def cache_article_result(func):
+    """
+    extract_article 결과를 URL 기준으로 캐시하는 데코레이터
+    
+    성공 결과는 ARTICLE_CACHE_TTL, 실패(None)는 ARTICLE_CACHE_NEGATIVE_TTL 동안 재사용하여
+    겹치는 키워드로 반복 호출될 때 같은 기사를 다시 열지 않습니다.
+    force_refresh=True면 캐시를 무시하고 새로 추출합니다. 예외는 캐시하지 않습니다.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, url: str, force_refresh: bool = False):
+        key = _article_cache_key(url)
+        if not force_refresh:
+            hit, article = self._get_from_cache(key)
+            if hit:
+                return _copy_article(article)
+        article = await func(self, url)
+        self._save_to_cache(key, article)
+        return _copy_article(article)
+    return wrapper
+
+
+def _copy_article(article: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """캐시된 기사를 호출자가 수정해도 캐시가 바뀌지 않도록 얕은 복사"""
+    return dict(article) if article else article
+
 
 class PlaywrightBaseScraper(ABC):
     """
@@ -26,68 +203,123 @@ class PlaywrightBaseScraper(ABC):
     - 더 빠른 속도
     """
     
+    # 재사용을 위해 보관할 최대 페이지 수 (동시 추출 수와 맞춤)
+    MAX_POOLED_PAGES = 5
+    # 도메인별로 유지할 최대 컨텍스트 수 (초과 시 사용 중이 아닌 오래된 것부터 닫음)
+    MAX_DOMAIN_CONTEXTS = 8
+    # 기사 추출 결과 캐시 (최대 개수, 성공/실패 결과 유효 시간(초))
+    ARTICLE_CACHE_SIZE = 512
+    ARTICLE_CACHE_TTL = 3600
+    ARTICLE_CACHE_NEGATIVE_TTL = 300
+    # 컨텍스트 기본 제한 시간 (ms) - 응답 없는 페이지에서 빨리 실패해 병렬 추출이 멈추지 않도록
+    NAVIGATION_TIMEOUT = 15000
+    ACTION_TIMEOUT = 5000
+    
     def __init__(self):
         """초기화"""
         self.config = get_config()
         self.browser: Optional[Browser] = None
+        # 기본 컨텍스트 (검색 페이지 등 도메인 지정이 없는 작업용)
         self.context: Optional[BrowserContext] = None
-        self._playwright = None
+        # 도메인별 컨텍스트: 같은 매체 기사끼리 쿠키/봇 챌린지 통과 상태를 공유
+        self._contexts: "OrderedDict[str, BrowserContext]" = OrderedDict()
+        self._context_users: Dict[str, int] = {}
+        # 기사마다 페이지를 새로 만들지 않도록 사용이 끝난 페이지를 도메인별로 보관
+        self._page_pool: Dict[str, List[Page]] = {}
+        self._pooled_count = 0
+        self._page_domains: Dict[Page, str] = {}
+        # 동시 추출 시 브라우저가 여러 번 실행되지 않도록 초기화 직렬화
+        self._setup_lock = asyncio.Lock()
+        self._context_lock = asyncio.Lock()
+        # URL별 기사 추출 결과 캐시 {정규화 URL: (결과, 만료 시각)} (LRU 순서 유지)
+        self._article_cache: "OrderedDict[str, Tuple[Optional[Dict[str, Any]], float]]" = OrderedDict()
+    
+    def _get_from_cache(self, key: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """캐시에서 기사 조회 (적중 여부, 결과)"""
+        entry = self._article_cache.get(key)
+        if entry is None:
+            return False, None
+        article, expires_at = entry
+        if expires_at <= time.monotonic():
+            # 만료된 캐시 삭제
+            del self._article_cache[key]
+            return False, None
+        self._article_cache.move_to_end(key)
+        return True, article
+    
+    def _save_to_cache(self, key: str, article: Optional[Dict[str, Any]]) -> None:
+        """기사 추출 결과를 캐시에 저장 (가득 차면 가장 오래 쓰지 않은 항목 제거)"""
+        ttl = self.ARTICLE_CACHE_TTL if article else self.ARTICLE_CACHE_NEGATIVE_TTL
+        self._article_cache[key] = (article, time.monotonic() + ttl)
+        self._article_cache.move_to_end(key)
+        while len(self._article_cache) > self.ARTICLE_CACHE_SIZE:
+            self._article_cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """기사 캐시 클리어"""
+        self._article_cache.clear()
     
     async def setup(self) -> None:
-        """브라우저 초기화"""
-        if self.browser is not None:
-            return
-            
+        """브라우저 초기화 (공유 브라우저에 이 인스턴스 전용 컨텍스트 생성)"""
+        async with self._setup_lock:
+            if self.context is None:
+                self.browser = await _acquire_shared_browser()
+                try:
+                    self.context = await self._create_context()
+                except Exception:
+                    self.browser = None
+                    await _release_shared_browser()
+                    raise
+    
+    async def _create_context(self) -> BrowserContext:
+        """쿠키/스토리지가 분리된 브라우저 컨텍스트 생성"""
         try:
-            self._playwright = await async_playwright().start()
-            self.browser = await self._playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-software-rasterizer',
-                    '--disable-extensions',
-                    '--disable-background-networking',
-                    '--disable-default-apps',
-                    '--disable-sync',
-                    '--disable-translate',
-                    '--hide-scrollbars',
-                    '--mute-audio',
-                    '--no-first-run',
-                    '--safebrowsing-disable-auto-update',
-                ]
-            )
-            self.context = await self.browser.new_context(
+            context = await self.browser.new_context(
                 user_agent=self.config.CRAWLER_USER_AGENT,
                 viewport={'width': 1920, 'height': 1080},
                 locale='ko-KR',
             )
             # 불필요한 리소스 차단 (이미지, 폰트, 스타일시트 - 속도 향상)
-            await self.context.route("**/*.{png,jpg,jpeg,gif,svg,webp,ico}", lambda route: route.abort())
-            await self.context.route("**/*.woff*", lambda route: route.abort())
+            # URL 확장자 대신 리소스 타입으로 판별하여 확장자 없는 CDN 이미지도 차단
+            await context.route("**/*", self._block_resources)
+            # 페이지 이동/동작 기본 제한 시간을 컨텍스트에서 한 번만 지정
+            context.set_default_navigation_timeout(self.NAVIGATION_TIMEOUT)
+            context.set_default_timeout(self.ACTION_TIMEOUT)
             
-            print(f"[DEBUG] Playwright 브라우저 초기화 완료")
-            safe_log("Playwright 브라우저 초기화 완료", level="info")
+            logger.debug("Playwright 컨텍스트 초기화 완료")
+            safe_log("Playwright 컨텍스트 초기화 완료", level="info")
+            return context
             
         except Exception as e:
-            safe_log("Playwright 브라우저 초기화 실패", level="error", error=str(e))
+            safe_log("Playwright 컨텍스트 초기화 실패", level="error", error=str(e))
             raise RuntimeError(f"Playwright 초기화 실패: {e}")
     
+    @staticmethod
+    async def _block_resources(route, request) -> None:
+        """차단 대상 리소스 타입이나 광고/분석 호스트면 요청 중단, 아니면 그대로 진행"""
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_HOST_RE.match(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+    
     async def cleanup(self) -> None:
-        """리소스 정리"""
+        """리소스 정리 (마지막 사용자가 정리할 때 공유 브라우저 종료)"""
         try:
+            # 풀의 페이지는 컨텍스트와 함께 닫히므로 참조만 비움
+            self._page_pool.clear()
+            self._pooled_count = 0
+            self._page_domains.clear()
+            self._context_users.clear()
+            while self._contexts:
+                _, context = self._contexts.popitem()
+                await context.close()
             if self.context:
                 await self.context.close()
                 self.context = None
             if self.browser:
-                await self.browser.close()
                 self.browser = None
-            if self._playwright:
-                await self._playwright.stop()
-                self._playwright = None
-            print(f"[DEBUG] Playwright 리소스 정리 완료")
+                await _release_shared_browser()
+            logger.debug("Playwright 리소스 정리 완료")
             safe_log("Playwright 리소스 정리 완료", level="info")
         except Exception as e:
             safe_log("Playwright 리소스 정리 오류", level="warning", error=str(e))
@@ -98,6 +330,124 @@ class PlaywrightBaseScraper(ABC):
             await self.setup()
         return await self.context.new_page()
     
+    @staticmethod
+    def _domain_of(url: Optional[str]) -> str:
+        """URL의 도메인 (없거나 파싱 불가면 빈 문자열 = 기본 컨텍스트)"""
+        if not url:
+            return ""
+        try:
+            return (urlparse(url).hostname or "").lower()
+        except ValueError:
+            return ""
+    
+    async def context_for(self, url: Optional[str] = None) -> BrowserContext:
+        """
+        URL 도메인 전용 브라우저 컨텍스트 반환 (없으면 생성해 캐시)
+        
+        같은 매체의 기사 N개가 하나의 컨텍스트를 쓰므로 쿠키나 봇 챌린지(Cloudflare 등)
+        통과 상태가 이어지고, 다른 매체와는 쿠키가 섞이지 않습니다.
+        
+        Args:
+            url: 대상 URL (생략 시 기본 컨텍스트)
+        
+        Returns:
+            도메인 컨텍스트
+        """
+        if self.context is None:
+            await self.setup()
+        domain = self._domain_of(url)
+        if not domain:
+            return self.context
+        
+        async with self._context_lock:
+            context = self._contexts.get(domain)
+            if context is not None:
+                self._contexts.move_to_end(domain)
+                return context
+            
+            # 상한을 넘으면 사용 중이 아닌 가장 오래된 도메인 컨텍스트부터 닫음
+            if len(self._contexts) >= self.MAX_DOMAIN_CONTEXTS:
+                for old_domain in list(self._contexts):
+                    if self._context_users.get(old_domain, 0) == 0:
+                        await self._close_domain_context(old_domain)
+                        break
+            
+            context = await self._create_context()
+            self._contexts[domain] = context
+            return context
+    
+    async def _close_domain_context(self, domain: str) -> None:
+        """도메인 컨텍스트와 풀에 보관 중인 해당 도메인 페이지 정리"""
+        context = self._contexts.pop(domain)
+        self._context_users.pop(domain, None)
+        self._pooled_count -= len(self._page_pool.pop(domain, ()))
+        try:
+            await context.close()
+        except Exception as e:
+            safe_log("도메인 컨텍스트 종료 오류", level="warning", error=str(e), domain=domain)
+    
+    async def acquire_page(self, url: Optional[str] = None) -> Page:
+        """
+        URL 도메인 컨텍스트의 풀에서 페이지를 꺼내고, 비어 있으면 새 페이지 생성
+        
+        Args:
+            url: 열 페이지의 URL (생략 시 기본 컨텍스트 사용)
+        """
+        domain = self._domain_of(url)
+        context = await self.context_for(url)
+        # 반환 전까지 이 도메인 컨텍스트가 정리되지 않도록 사용 중으로 표시
+        self._context_users[domain] = self._context_users.get(domain, 0) + 1
+        
+        pool = self._page_pool.get(domain)
+        page = None
+        while pool:
+            candidate = pool.pop()
+            self._pooled_count -= 1
+            if not candidate.is_closed():
+                page = candidate
+                break
+        if page is None:
+            try:
+                page = await context.new_page()
+            except Exception:
+                self._context_users[domain] -= 1
+                raise
+        self._page_domains[page] = domain
+        return page
+    
+    async def release_page(self, page: Page) -> None:
+        """페이지를 빈 화면으로 초기화해 풀에 반환 (풀이 가득 찼거나 초기화 실패 시 닫음)"""
+        domain = self._page_domains.pop(page, "")
+        if domain in self._context_users:
+            self._context_users[domain] = max(self._context_users[domain] - 1, 0)
+        if page.is_closed():
+            return
+        if self._pooled_count < self.MAX_POOLED_PAGES:
+            try:
+                await page.goto("about:blank")
+                # 초기화 중 컨텍스트가 정리되었을 수 있으므로 다시 확인
+                if not page.is_closed() and (not domain or domain in self._contexts):
+                    self._page_pool.setdefault(domain, []).append(page)
+                    self._pooled_count += 1
+                    return
+            except Exception:
+                pass
+        await page.close()
+    
+    @asynccontextmanager
+    async def pooled_page(self, url: Optional[str] = None):
+        """
+        풀에서 페이지를 빌려 쓰고 블록을 벗어나면 반환하는 컨텍스트 매니저
+        
+        Args:
+            url: 열 페이지의 URL (생략 시 기본 컨텍스트 사용)
+        """
+        page = await self.acquire_page(url)
+        try:
+            yield page
+        finally:
+            await self.release_page(page)
+    
     async def extract_text_by_selectors(
         self, 
         page: Page, 
@@ -115,13 +465,20 @@ class PlaywrightBaseScraper(ABC):
         Returns:
             추출된 텍스트 또는 None
         """
+        # 후보 중 하나라도 붙을 때까지 한 번만 대기 (셀렉터마다 timeout을 기다리지 않음)
+        try:
+            await page.wait_for_selector(", ".join(selectors), state="attached", timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+        
+        # 이후에는 대기 없이 우선순위 순서대로 확인
         for i, selector in enumerate(selectors, 1):
             try:
-                element = await page.wait_for_selector(selector, timeout=timeout)
+                element = await page.query_selector(selector)
                 if element:
                     text = await element.text_content()
                     if text and len(text.strip()) > 10:
-                        print(f"[DEBUG] ✓ 텍스트 추출 성공 (셀렉터 {i}): {text[:50]}...")
+                        logger.debug("✓ 텍스트 추출 성공 (셀렉터 %s): %s...", i, text[:50])
                         return text.strip()
             except Exception:
                 continue
@@ -145,21 +502,64 @@ class PlaywrightBaseScraper(ABC):
             추출된 링크 목록
         """
         links = []
+        seen = set()  # 순서는 리스트로, 중복 확인은 집합으로 (O(1))
         for i, selector in enumerate(selectors, 1):
             try:
                 await page.wait_for_selector(selector, timeout=timeout)
                 elements = await page.query_selector_all(selector)
                 for element in elements:
                     href = await element.get_attribute('href')
-                    if href and href not in links:
+                    if href and href not in seen:
+                        seen.add(href)
                         links.append(href)
                 if links:
-                    print(f"[DEBUG] ✓ 링크 추출 성공 (셀렉터 {i}): {len(links)}개")
+                    logger.debug("✓ 링크 추출 성공 (셀렉터 %s): %s개", i, len(links))
                     break
             except Exception:
                 continue
         return links
     
+    async def extract_articles(
+        self,
+        urls: List[str],
+        concurrency: Optional[int] = None
+    ) -> List[Any]:
+        """
+        여러 기사를 동시에 추출
+        
+        Args:
+            urls: 기사 URL 목록
+            concurrency: 최대 동시 처리 수 (기본값: 페이지 풀 크기)
+        
+        Returns:
+            URL 순서대로의 추출 결과 (실패 시 None 또는 예외 객체)
+        """
+        # 캐시 적중분은 바로 채우고, 나머지만 추출 (모두 적중하면 Playwright를 전혀 사용하지 않음)
+        results: List[Any] = [None] * len(urls)
+        pending = []
+        for index, url in enumerate(urls):
+            hit, article = self._get_from_cache(_article_cache_key(url))
+            if hit:
+                results[index] = _copy_article(article)
+            else:
+                pending.append(index)
+        if not pending:
+            return results
+        
+        semaphore = asyncio.Semaphore(concurrency or self.MAX_POOLED_PAGES)
+        
+        async def extract_with_semaphore(url: str):
+            async with semaphore:
+                return await self.extract_article(url)
+        
+        extracted = await asyncio.gather(
+            *[extract_with_semaphore(urls[index]) for index in pending],
+            return_exceptions=True
+        )
+        for index, result in zip(pending, extracted):
+            results[index] = result
+        return results
+    
     @abstractmethod
     async def search_news(self, keyword: str, max_articles: int = 5) -> List[str]:
         """뉴스 검색 (하위 클래스에서 구현)"""
@@ -167,6 +567,6 @@ class PlaywrightBaseScraper(ABC):
     
     @abstractmethod
     async def extract_article(self, url: str) -> Optional[Dict[str, Any]]:
-        """기사 내용 추출 (하위 클래스에서 구현)"""
+        """기사 내용 추출 (하위 클래스에서 구현, @cache_article_result로 캐시 적용)"""
         pass
 
@@ -6,14 +6,35 @@ RSS 피드 + Playwright 하이브리드 방식
 """
 
 import asyncio
-import requests
-import xml.etree.ElementTree as ET
+import io
+import logging
+import re
 from typing import List, Dict, Any, Optional
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 from html import unescape
 
+import aiohttp
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
 from common.utils import safe_log, validate_input, validate_url
-from .playwright_base import PlaywrightBaseScraper
+from .playwright_base import PlaywrightBaseScraper, cache_article_result
+
+logger = logging.getLogger(__name__)
+
+# RSS 파서 (lxml이 있으면 libxml2 기반 파서 사용, 없으면 표준 라이브러리)
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
+# 정적 HTML 파서 (선택적, 없으면 모든 기사를 Playwright로 추출)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
 
 
 # 다양한 뉴스 사이트에서 동작하는 범용 셀렉터
@@ -44,9 +65,143 @@ ARTICLE_SELECTORS = {
 }
 
 
+# 브라우저 없이 처리할 수 없는 구글 뉴스 호스트 (JS 리다이렉션)
+GOOGLE_NEWS_HOST = "news.google.com"
+
+REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+# 정적 파싱 시 본문 텍스트에서 제외할 태그 (렌더링된 innerText처럼 보이는 텍스트만 남김)
+NON_CONTENT_TAGS = ["script", "style", "noscript"]
+
+# 정적 추출 시 읽을 최대 HTML 크기 (광고/스크립트로 비대한 페이지의 전체 다운로드 방지)
+MAX_STATIC_HTML_BYTES = 2 * 1024 * 1024
+
+# 스트리밍 수신 청크 크기
+STATIC_READ_CHUNK_BYTES = 64 * 1024
+
+# Content-Type 헤더에 charset이 없을 때 문서 앞부분의 <meta> 선언에서 인코딩 확인 (EUC-KR 매체 등)
+META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_:.-]+)""", re.IGNORECASE)
+META_CHARSET_SCAN_BYTES = 4096
+
+
 class PlaywrightGoogleScraper(PlaywrightBaseScraper):
     """Playwright 기반 구글 뉴스 크롤러"""
     
+    def __init__(self):
+        """초기화"""
+        super().__init__()
+        self._http: Optional[aiohttp.ClientSession] = None
+    
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """공유 HTTP 세션 반환 (RSS/리다이렉션/기사 요청이 keep-alive 연결 풀을 재사용)"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                headers=REQUEST_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._http
+    
+    async def cleanup(self) -> None:
+        """HTTP 세션과 브라우저 리소스 정리"""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+        await super().cleanup()
+    
+    async def _resolve_url(self, url: str) -> str:
+        """HEAD 요청으로 HTTP 리다이렉션을 따라가 최종 URL 반환 (실패 시 원본 URL)"""
+        try:
+            http = await self._get_http()
+            async with http.head(url, allow_redirects=True,
+                                 timeout=aiohttp.ClientTimeout(total=10)) as response:
+                return str(response.url)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return url
+    
+    @staticmethod
+    def _decode_html(body: bytes, charset: Optional[str]) -> str:
+        """
+        HTML 바이트 디코딩
+
+        헤더 charset → <meta> charset → UTF-8 순으로 시도하며,
+        알 수 없는 인코딩 이름(LookupError)은 건너뜁니다.
+        """
+        candidates = [charset]
+        match = META_CHARSET_RE.search(body[:META_CHARSET_SCAN_BYTES])
+        if match:
+            candidates.append(match.group(1).decode("ascii"))
+        candidates.append("utf-8")
+        for encoding in candidates:
+            if not encoding:
+                continue
+            try:
+                return body.decode(encoding, errors="replace")
+            except LookupError:
+                continue
+        return body.decode("utf-8", errors="replace")
+    
+    @staticmethod
+    def _select_text(tree: "LexborHTMLParser", selectors: List[str]) -> Optional[str]:
+        """셀렉터 우선순위대로 첫 매칭 요소의 텍스트 반환 (extract_text_by_selectors와 동일 기준)"""
+        for selector in selectors:
+            node = tree.css_first(selector)
+            if node is not None:
+                text = node.text(separator=" ").strip()
+                if len(text) > 10:
+                    return text
+        return None
+    
+    async def _fetch_static_article(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        브라우저 없이 HTTP 요청과 정적 HTML 파싱으로 기사 추출
+        
+        JS 렌더링이 필요한 페이지라 본문이 50자 이하면 None을 반환하여
+        Playwright 경로로 넘깁니다.
+        """
+        try:
+            http = await self._get_http()
+            async with http.get(url) as response:
+                response.raise_for_status()
+                # HTML이 아니면(PDF, 이미지 등) 본문을 받지 않고 건너뜀
+                if response.content_type != "text/html":
+                    return None
+                # 본문 추출에 필요한 앞부분까지만 스트리밍으로 수신
+                # (read(n)은 버퍼에 있는 만큼만 반환하므로 EOF 또는 상한까지 반복 수신)
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(STATIC_READ_CHUNK_BYTES):
+                    body += chunk
+                    if len(body) >= MAX_STATIC_HTML_BYTES:
+                        break
+                html_text = self._decode_html(bytes(body[:MAX_STATIC_HTML_BYTES]), response.charset)
+                final_url = str(response.url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            safe_log("정적 기사 요청 실패", level="warning", error=str(e), url=url)
+            return None
+        
+        tree = LexborHTMLParser(html_text)
+        # selectolax의 text()는 인라인 JS/CSS도 포함하므로 셀렉터 조회 전에 제거
+        tree.strip_tags(NON_CONTENT_TAGS)
+        content = self._select_text(tree, ARTICLE_SELECTORS["content"])
+        if not content or len(content) <= 50:
+            return None
+        
+        title = self._select_text(tree, ARTICLE_SELECTORS["title"])
+        if not title:
+            title_node = tree.css_first("title")
+            title = title_node.text().strip() if title_node is not None else ""
+            # 사이트명 제거
+            if ' - ' in title:
+                title = title.split(' - ')[0].strip()
+        if not title:
+            return None
+        
+        return {
+            "title": title,
+            "content": content[:3000],  # 최대 3000자
+            "url": final_url,
+            "source": "구글",
+        }
+    
     async def search_news(self, keyword: str, max_articles: int = 5) -> List[str]:
         """
         구글 뉴스 RSS 피드에서 검색 (Selenium 불필요)
@@ -62,44 +217,45 @@ class PlaywrightGoogleScraper(PlaywrightBaseScraper):
             return []
         
         article_urls = []
+        seen = set()  # 순서는 리스트로, 중복 확인은 집합으로
         
         try:
             # 구글 뉴스 RSS 피드
             encoded_keyword = quote(keyword)
             rss_url = f"https://news.google.com/rss/search?q={encoded_keyword}&hl=ko&gl=KR&ceid=KR:ko"
             
-            print(f"[DEBUG] 구글 뉴스 RSS 피드 요청: {keyword}")
+            logger.debug("구글 뉴스 RSS 피드 요청: %s", keyword)
             safe_log("구글 뉴스 RSS 피드 요청", level="info", keyword=keyword)
             
-            # RSS 피드 요청 (비동기로 처리)
-            response = await asyncio.to_thread(
-                requests.get,
-                rss_url,
-                headers={'User-Agent': 'Mozilla/5.0'},
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            # XML 파싱
-            root = ET.fromstring(response.content)
-            channel = root.find('channel')
-            
-            if channel is None:
-                return []
+            # RSS 피드 요청 (공유 세션으로 비동기 처리)
+            http = await self._get_http()
+            async with http.get(rss_url) as response:
+                response.raise_for_status()
+                body = await response.read()
             
-            # 뉴스 아이템 추출
-            for item in channel.findall('item'):
-                if len(article_urls) >= max_articles:
-                    break
+            # XML 스트리밍 파싱 (필요한 개수를 채우면 나머지 item은 파싱하지 않음)
+            for _, item in ET.iterparse(io.BytesIO(body), events=('end',)):
+                if item.tag != 'item':
+                    continue
                 
                 link = item.find('link')
                 if link is not None and link.text:
                     url = link.text.strip()
                     # 구글 리다이렉션 URL도 포함 (나중에 실제 URL로 변환)
-                    if url and url not in article_urls:
+                    if url and url not in seen:
+                        seen.add(url)
                         article_urls.append(url)
+                
+                item.clear()  # 처리한 item 메모리 해제
+                if len(article_urls) >= max_articles:
+                    break
+            
+            # 리다이렉션 URL을 병렬 HEAD 요청으로 실제 기사 URL로 변환
+            article_urls = list(dict.fromkeys(await asyncio.gather(
+                *(self._resolve_url(url) for url in article_urls)
+            )))
             
-            print(f"[DEBUG] ✓ 구글 뉴스 {len(article_urls)}개 URL 수집")
+            logger.debug("✓ 구글 뉴스 %s개 URL 수집", len(article_urls))
             safe_log("구글 뉴스 URL 수집 완료", level="info", count=len(article_urls))
             
         except Exception as e:
@@ -107,6 +263,7 @@ class PlaywrightGoogleScraper(PlaywrightBaseScraper):
         
         return article_urls[:max_articles]
     
+    @cache_article_result
     async def extract_article(self, url: str) -> Optional[Dict[str, Any]]:
         """
         기사 내용 추출 (구글 리다이렉션 URL 처리)
@@ -117,43 +274,55 @@ class PlaywrightGoogleScraper(PlaywrightBaseScraper):
         Returns:
             기사 정보 딕셔너리
         """
-        await self.setup()
-        page = await self.new_page()
+        # 이미 실제 기사 URL이면 브라우저 없이 정적 추출을 먼저 시도
+        if SELECTOLAX_AVAILABLE and urlparse(url).hostname != GOOGLE_NEWS_HOST:
+            article = await self._fetch_static_article(url)
+            if article:
+                logger.debug("✓ 구글 기사 정적 추출 성공: %s...", article['title'][:30])
+                return article
         
-        try:
-            print(f"[DEBUG] 구글 기사 추출: {url[:60]}...")
-            
-            # 페이지 로드 (구글 리다이렉션 자동 처리)
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(1000)
-            
-            # 실제 URL 가져오기 (리다이렉션 후)
-            actual_url = page.url
-            
-            # 제목 추출
-            title = await self.extract_text_by_selectors(page, ARTICLE_SELECTORS["title"])
-            if not title:
-                title = await page.title()
-                # 사이트명 제거
-                if title and ' - ' in title:
-                    title = title.split(' - ')[0].strip()
-            
-            # 본문 추출
-            content = await self.extract_text_by_selectors(page, ARTICLE_SELECTORS["content"])
-            
-            if title and content and len(content) > 50:
-                print(f"[DEBUG] ✓ 구글 기사 추출 성공: {title[:30]}...")
-                return {
-                    "title": title,
-                    "content": content[:3000],  # 최대 3000자
-                    "url": actual_url,
-                    "source": "구글",
-                }
-            
-        except Exception as e:
-            safe_log("구글 기사 추출 오류", level="error", error=str(e), url=url)
-        finally:
-            await page.close()
+        async with self.pooled_page(url) as page:
+            try:
+                logger.debug("구글 기사 추출: %s...", url[:60])
+                
+                # 페이지 로드 (구글 리다이렉션 자동 처리)
+                await page.goto(url, wait_until="domcontentloaded")
+                # 고정 대기 대신 구글 중간 페이지를 벗어나는 즉시 진행
+                if urlparse(page.url).hostname == GOOGLE_NEWS_HOST:
+                    try:
+                        await page.wait_for_url(
+                            lambda u: urlparse(u).hostname != GOOGLE_NEWS_HOST,
+                            wait_until="domcontentloaded",
+                            timeout=5000,
+                        )
+                    except PlaywrightTimeoutError:
+                        pass
+                
+                # 실제 URL 가져오기 (리다이렉션 후)
+                actual_url = page.url
+                
+                # 제목 추출
+                title = await self.extract_text_by_selectors(page, ARTICLE_SELECTORS["title"])
+                if not title:
+                    title = await page.title()
+                    # 사이트명 제거
+                    if title and ' - ' in title:
+                        title = title.split(' - ')[0].strip()
+                
+                # 본문 추출
+                content = await self.extract_text_by_selectors(page, ARTICLE_SELECTORS["content"])
+                
+                if title and content and len(content) > 50:
+                    logger.debug("✓ 구글 기사 추출 성공: %s...", title[:30])
+                    return {
+                        "title": title,
+                        "content": content[:3000],  # 최대 3000자
+                        "url": actual_url,
+                        "source": "구글",
+                    }
+                
+            except Exception as e:
+                safe_log("구글 기사 추출 오류", level="error", error=str(e), url=url)
         
         return None
 
@@ -4,12 +4,17 @@ Playwright Naver News Scraper
 Playwright 기반 네이버 뉴스 비동기 크롤러
 """
 
-import asyncio
+import logging
+import re
 from typing import List, Dict, Any, Optional
 from urllib.parse import quote
 
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
 from common.utils import safe_log, validate_input, validate_url
-from .playwright_base import PlaywrightBaseScraper
+from .playwright_base import PlaywrightBaseScraper, cache_article_result
+
+logger = logging.getLogger(__name__)
 
 
 # 네이버 뉴스 CSS Selector 상수 (2024년 12월 기준)
@@ -63,6 +68,86 @@ NAVER_SELECTORS = {
     ],
 }
 
+# 뉴스 링크 셀렉터를 하나의 CSS 셀렉터 그룹으로 결합 (브라우저가 한 번에 평가)
+NEWS_LINK_SELECTOR = ", ".join(NAVER_SELECTORS["news_link"])
+
+# 매칭된 링크의 href를 한 번의 호출로 수집 (중복은 브라우저에서 제거, 문서 순서 유지)
+COLLECT_HREFS_JS = "els => [...new Set(els.map(e => e.href))].filter(Boolean)"
+
+# 이미지 셀렉터별 후보 속성과 캡션을 한 번의 호출로 수집
+# (이미지마다 get_attribute/부모 조회/캡션 조회로 왕복하지 않도록 브라우저에서 처리)
+# src는 속성값 대신 브라우저가 <base>까지 반영해 해석한 절대 URL(el.src)을 사용
+IMAGE_CANDIDATES_JS = """
+selectors => {
+    const resolve = raw => {
+        try { return raw ? new URL(raw, document.baseURI).href : null; } catch (e) { return null; }
+    };
+    return selectors.map(sel => Array.from(document.querySelectorAll(sel), el => {
+        const parent = el.parentElement;
+        const captionEl = parent && parent.querySelector('em, span.img_desc, figcaption');
+        return {
+            src: el.src || null,
+            dataSrc: resolve(el.getAttribute('data-src')),
+            alt: el.getAttribute('alt'),
+            width: el.getAttribute('width'),
+            height: el.getAttribute('height'),
+            caption: captionEl ? captionEl.innerText : '',
+        };
+    }));
+}
+"""
+
+# 테이블 셀렉터 우선순위대로 HTML/캡션/행·열 수를 한 번의 호출로 수집
+# (최소 2행 미만 테이블은 제외하고, 결과가 나온 첫 셀렉터에서 멈춤)
+TABLES_JS = """
+([selectors, maxTables]) => {
+    for (const sel of selectors) {
+        const out = [];
+        const elements = document.querySelectorAll(sel);
+        for (let i = 0; i < elements.length && out.length < maxTables; i++) {
+            const el = elements[i];
+            const rows = el.querySelectorAll('tr').length;
+            if (rows < 2) continue;
+            const firstRow = el.querySelector('tr');
+            const captionEl = el.querySelector('caption');
+            out.push({
+                html: el.innerHTML.slice(0, 5000),
+                caption: captionEl ? captionEl.innerText : '',
+                rows: rows,
+                cols: firstRow ? firstRow.querySelectorAll('td, th').length : 0,
+                order: i,
+            });
+        }
+        if (out.length) return out;
+    }
+    return [];
+}
+"""
+
+# 이미지 URL 필터 (호출마다 리스트를 만들지 않도록 모듈 상수로 정의)
+# 제외할 패턴 (광고, 아이콘, 로고 등)
+IMAGE_EXCLUDE_PATTERNS = (
+    "icon", "logo", "banner", "ad_", "advert",
+    "btn_", "button", "sprite", "blank", "spacer",
+    "1x1", "pixel", ".gif",  # 작은 투명 이미지
+    "naver.pstatic.net/static",  # 네이버 정적 리소스
+)
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+NAVER_IMAGE_HOSTS = ('imgnews.pstatic.net', 'image.news.naver.com')
+
+# 네이버 뉴스 기사 URL 패턴
+NAVER_ARTICLE_URL_PATTERNS = (
+    "n.news.naver.com/mnews/article/",
+    "news.naver.com/main/read",
+    "n.news.naver.com/article/",
+)
+
+# 위 패턴들을 각각 하나의 정규식 alternation으로 컴파일 (패턴별 부분 문자열 검사 반복 제거)
+IMAGE_EXCLUDE_RE = re.compile("|".join(map(re.escape, IMAGE_EXCLUDE_PATTERNS)), re.IGNORECASE)
+IMAGE_EXTENSION_RE = re.compile("|".join(map(re.escape, IMAGE_EXTENSIONS)), re.IGNORECASE)
+NAVER_IMAGE_HOST_RE = re.compile("|".join(map(re.escape, NAVER_IMAGE_HOSTS)), re.IGNORECASE)
+NAVER_ARTICLE_URL_RE = re.compile("|".join(map(re.escape, NAVER_ARTICLE_URL_PATTERNS)))
+
 
 class PlaywrightNaverScraper(PlaywrightBaseScraper):
     """Playwright 기반 네이버 뉴스 크롤러"""
@@ -81,48 +166,44 @@ class PlaywrightNaverScraper(PlaywrightBaseScraper):
         if not validate_input(keyword, max_length=100):
             return []
         
-        await self.setup()
-        page = await self.new_page()
         article_urls = []
         
-        try:
-            # 네이버 뉴스 검색 URL
-            encoded_keyword = quote(keyword)
-            search_url = f"https://search.naver.com/search.naver?where=news&query={encoded_keyword}&sort=1"
-            
-            print(f"[DEBUG] 네이버 뉴스 검색: {keyword}")
-            safe_log("네이버 뉴스 검색 시작", level="info", keyword=keyword)
-            
-            # 페이지 로드
-            await page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(1000)  # 동적 콘텐츠 로딩 대기
-            
-            # 뉴스 링크 추출
-            for selector in NAVER_SELECTORS["news_link"]:
+        async with self.pooled_page() as page:
+            try:
+                # 네이버 뉴스 검색 URL
+                encoded_keyword = quote(keyword)
+                search_url = f"https://search.naver.com/search.naver?where=news&query={encoded_keyword}&sort=1"
+                
+                logger.debug("네이버 뉴스 검색: %s", keyword)
+                safe_log("네이버 뉴스 검색 시작", level="info", keyword=keyword)
+                
+                # 페이지 로드
+                await page.goto(search_url, wait_until="domcontentloaded")
+                # 고정 대기 대신 뉴스 링크가 붙는 즉시 진행 (결과가 없으면 최대 2초)
                 try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements:
-                        href = await element.get_attribute('href')
-                        if href and self._is_valid_naver_url(href):
-                            if href not in article_urls:
-                                article_urls.append(href)
-                                if len(article_urls) >= max_articles:
-                                    break
-                    if article_urls:
-                        break
-                except Exception:
-                    continue
-            
-            print(f"[DEBUG] ✓ 네이버 뉴스 {len(article_urls)}개 URL 수집")
-            safe_log("네이버 뉴스 URL 수집 완료", level="info", count=len(article_urls))
-            
-        except Exception as e:
-            safe_log("네이버 뉴스 검색 오류", level="error", error=str(e))
-        finally:
-            await page.close()
+                    await page.wait_for_selector(NEWS_LINK_SELECTOR, state="attached", timeout=2000)
+                except PlaywrightTimeoutError:
+                    pass
+                
+                # 통합 셀렉터로 후보 링크의 href를 한 번에 수집
+                # (셀렉터별 query_selector_all과 요소별 get_attribute 왕복을 한 번의 호출로 대체)
+                hrefs = await page.eval_on_selector_all(NEWS_LINK_SELECTOR, COLLECT_HREFS_JS)
+                # hrefs는 브라우저에서 이미 중복 제거됨
+                for href in hrefs:
+                    if self._is_valid_naver_url(href):
+                        article_urls.append(href)
+                        if len(article_urls) >= max_articles:
+                            break
+                
+                logger.debug("✓ 네이버 뉴스 %s개 URL 수집", len(article_urls))
+                safe_log("네이버 뉴스 URL 수집 완료", level="info", count=len(article_urls))
+                
+            except Exception as e:
+                safe_log("네이버 뉴스 검색 오류", level="error", error=str(e))
         
         return article_urls[:max_articles]
     
+    @cache_article_result
     async def extract_article(self, url: str) -> Optional[Dict[str, Any]]:
         """
         네이버 뉴스 기사 내용 추출 (이미지, 테이블 포함)
@@ -136,45 +217,41 @@ class PlaywrightNaverScraper(PlaywrightBaseScraper):
         if not validate_url(url):
             return None
         
-        await self.setup()
-        page = await self.new_page()
-        
-        try:
-            print(f"[DEBUG] 네이버 기사 추출: {url[:60]}...")
-            
-            # 페이지 로드
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(500)
-            
-            # 제목 추출
-            title = await self.extract_text_by_selectors(page, NAVER_SELECTORS["title"])
-            if not title:
-                title = await page.title()
-            
-            # 본문 추출
-            content = await self.extract_text_by_selectors(page, NAVER_SELECTORS["content"])
-            
-            # 이미지 추출
-            images = await self._extract_images(page)
-            
-            # 테이블 추출
-            tables = await self._extract_tables(page)
-            
-            if title and content and len(content) > 50:
-                print(f"[DEBUG] ✓ 네이버 기사 추출 성공: {title[:30]}... (이미지: {len(images)}개, 테이블: {len(tables)}개)")
-                return {
-                    "title": title,
-                    "content": content[:3000],  # 최대 3000자
-                    "url": url,
-                    "source": "네이버",
-                    "images": images,
-                    "tables": tables,
-                }
-            
-        except Exception as e:
-            safe_log("네이버 기사 추출 오류", level="error", error=str(e), url=url)
-        finally:
-            await page.close()
+        async with self.pooled_page(url) as page:
+            try:
+                logger.debug("네이버 기사 추출: %s...", url[:60])
+                
+                # 페이지 로드
+                # 제목/본문 대기는 extract_text_by_selectors가 셀렉터 기준으로 처리
+                await page.goto(url, wait_until="domcontentloaded")
+                
+                # 제목 추출
+                title = await self.extract_text_by_selectors(page, NAVER_SELECTORS["title"])
+                if not title:
+                    title = await page.title()
+                
+                # 본문 추출
+                content = await self.extract_text_by_selectors(page, NAVER_SELECTORS["content"])
+                
+                # 이미지 추출
+                images = await self._extract_images(page)
+                
+                # 테이블 추출
+                tables = await self._extract_tables(page)
+                
+                if title and content and len(content) > 50:
+                    logger.debug("✓ 네이버 기사 추출 성공: %s... (이미지: %s개, 테이블: %s개)", title[:30], len(images), len(tables))
+                    return {
+                        "title": title,
+                        "content": content[:3000],  # 최대 3000자
+                        "url": url,
+                        "source": "네이버",
+                        "images": images,
+                        "tables": tables,
+                    }
+                
+            except Exception as e:
+                safe_log("네이버 기사 추출 오류", level="error", error=str(e), url=url)
         
         return None
     
@@ -188,54 +265,34 @@ class PlaywrightNaverScraper(PlaywrightBaseScraper):
         images = []
         
         try:
-            for selector in NAVER_SELECTORS["images"]:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for i, element in enumerate(elements):
-                        if len(images) >= 10:  # 최대 10개 이미지
-                            break
-                        
-                        img_src = await element.get_attribute('src')
-                        if not img_src or not self._is_valid_image_url(img_src):
-                            # data-src 속성 확인 (lazy loading)
-                            img_src = await element.get_attribute('data-src')
-                        
-                        if img_src and self._is_valid_image_url(img_src):
-                            # 상대 경로를 절대 경로로 변환
-                            if img_src.startswith('//'):
-                                img_src = 'https:' + img_src
-                            elif img_src.startswith('/'):
-                                img_src = 'https://n.news.naver.com' + img_src
-                            
-                            alt_text = await element.get_attribute('alt') or ""
-                            
-                            # 이미지 크기 추출
-                            width = await element.get_attribute('width')
-                            height = await element.get_attribute('height')
-                            
-                            # 캡션 추출 (부모 요소에서 찾기)
-                            caption = ""
-                            try:
-                                parent = await element.evaluate_handle("el => el.parentElement")
-                                caption_el = await parent.query_selector("em, span.img_desc, figcaption")
-                                if caption_el:
-                                    caption = await caption_el.inner_text()
-                            except:
-                                pass
-                            
-                            images.append({
-                                "url": img_src,
-                                "alt": alt_text,
-                                "caption": caption,
-                                "width": int(width) if width and width.isdigit() else None,
-                                "height": int(height) if height and height.isdigit() else None,
-                                "order": i,
-                            })
-                    
-                    if images:
+            # 셀렉터 우선순위대로, 유효한 이미지가 나온 첫 셀렉터의 결과만 사용
+            candidates_by_selector = await page.evaluate(
+                IMAGE_CANDIDATES_JS, NAVER_SELECTORS["images"]
+            )
+            for candidates in candidates_by_selector:
+                for i, candidate in enumerate(candidates):
+                    if len(images) >= 10:  # 최대 10개 이미지
                         break
-                except Exception:
-                    continue
+                    
+                    img_src = candidate["src"]
+                    if not img_src or not self._is_valid_image_url(img_src):
+                        # data-src 속성 확인 (lazy loading)
+                        img_src = candidate["dataSrc"]
+                    
+                    if img_src and self._is_valid_image_url(img_src):
+                        width = candidate["width"]
+                        height = candidate["height"]
+                        images.append({
+                            "url": img_src,
+                            "alt": candidate["alt"] or "",
+                            "caption": candidate["caption"],
+                            "width": int(width) if width and width.isdigit() else None,
+                            "height": int(height) if height and height.isdigit() else None,
+                            "order": i,
+                        })
+                
+                if images:
+                    break
         except Exception as e:
             safe_log("이미지 추출 오류", level="warning", error=str(e))
         
@@ -251,50 +308,8 @@ class PlaywrightNaverScraper(PlaywrightBaseScraper):
         tables = []
         
         try:
-            for selector in NAVER_SELECTORS["tables"]:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for i, element in enumerate(elements):
-                        if len(tables) >= 5:  # 최대 5개 테이블
-                            break
-                        
-                        # 테이블 HTML 추출
-                        table_html = await element.inner_html()
-                        
-                        # 테이블이 너무 작으면 스킵 (최소 2행)
-                        row_count = await element.evaluate("el => el.querySelectorAll('tr').length")
-                        if row_count < 2:
-                            continue
-                        
-                        # 열 개수
-                        col_count = await element.evaluate("""
-                            el => {
-                                const firstRow = el.querySelector('tr');
-                                return firstRow ? firstRow.querySelectorAll('td, th').length : 0;
-                            }
-                        """)
-                        
-                        # 캡션 추출
-                        caption = ""
-                        try:
-                            caption_el = await element.query_selector("caption")
-                            if caption_el:
-                                caption = await caption_el.inner_text()
-                        except:
-                            pass
-                        
-                        tables.append({
-                            "html": table_html[:5000],  # 최대 5000자
-                            "caption": caption,
-                            "rows": row_count,
-                            "cols": col_count,
-                            "order": i,
-                        })
-                    
-                    if tables:
-                        break
-                except Exception:
-                    continue
+            # 최대 5개 테이블, HTML은 최대 5000자
+            tables = await page.evaluate(TABLES_JS, [NAVER_SELECTORS["tables"], 5])
         except Exception as e:
             safe_log("테이블 추출 오류", level="warning", error=str(e))
         
@@ -305,35 +320,13 @@ class PlaywrightNaverScraper(PlaywrightBaseScraper):
         if not url:
             return False
         
-        # 제외할 패턴 (광고, 아이콘, 로고 등)
-        exclude_patterns = [
-            "icon", "logo", "banner", "ad_", "advert",
-            "btn_", "button", "sprite", "blank", "spacer",
-            "1x1", "pixel", ".gif",  # 작은 투명 이미지
-            "naver.pstatic.net/static",  # 네이버 정적 리소스
-        ]
-        
-        url_lower = url.lower()
-        for pattern in exclude_patterns:
-            if pattern in url_lower:
-                return False
-        
-        # 이미지 확장자 확인
-        valid_extensions = ['.jpg', '.jpeg', '.png', '.webp']
-        has_valid_ext = any(ext in url_lower for ext in valid_extensions)
+        if IMAGE_EXCLUDE_RE.search(url):
+            return False
         
         # imgnews.pstatic.net (네이버 뉴스 이미지 서버)는 확장자 없이도 허용
-        if 'imgnews.pstatic.net' in url_lower or 'image.news.naver.com' in url_lower:
-            return True
-        
-        return has_valid_ext
+        # 그 외에는 이미지 확장자 확인
+        return bool(NAVER_IMAGE_HOST_RE.search(url) or IMAGE_EXTENSION_RE.search(url))
     
     def _is_valid_naver_url(self, url: str) -> bool:
         """유효한 네이버 뉴스 URL인지 확인"""
-        valid_patterns = [
-            "n.news.naver.com/mnews/article/",
-            "news.naver.com/main/read",
-            "n.news.naver.com/article/",
-        ]
-        return any(pattern in url for pattern in valid_patterns)
-
+        return NAVER_ARTICLE_URL_RE.search(url) is not None
@@ -11,13 +11,21 @@ Playwright 기반 비동기 병렬 뉴스 크롤러
 """
 
 import asyncio
+import logging
 from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
 
 from common.utils import safe_log, validate_input
 from .playwright_naver import PlaywrightNaverScraper
 from .playwright_google import PlaywrightGoogleScraper
 
+logger = logging.getLogger(__name__)
+
+# 소스 매핑 (입력 이름 → 내부 소스 이름)
+SOURCE_MAPPING = {
+    "네이버": "네이버", "naver": "네이버",
+    "구글": "구글", "google": "구글",
+}
+
 
 class PlaywrightNewsScraper:
     """
@@ -34,6 +42,19 @@ class PlaywrightNewsScraper:
         self.naver_scraper = PlaywrightNaverScraper()
         self.google_scraper = PlaywrightGoogleScraper()
     
+    async def setup(self) -> None:
+        """네이버/구글 스크래퍼의 브라우저 컨텍스트를 미리 준비 (첫 요청의 브라우저 실행 지연 제거)"""
+        await asyncio.gather(self.naver_scraper.setup(), self.google_scraper.setup())
+    
+    @staticmethod
+    def _normalize_sources(sources: List[str]) -> List[str]:
+        """소스 이름을 정규화하고 중복 제거 (유효한 소스가 없으면 네이버)"""
+        # dict.fromkeys로 입력 순서를 유지하며 중복 제거
+        valid_sources = list(dict.fromkeys(
+            normalized for normalized in map(SOURCE_MAPPING.get, sources) if normalized
+        ))
+        return valid_sources or ["네이버"]
+    
     async def search_news_parallel(
         self, 
         keyword: str, 
@@ -52,48 +73,29 @@ class PlaywrightNewsScraper:
             소스별 기사 URL 딕셔너리
         """
         results = {"네이버": [], "구글": []}
-        tasks = []
         
-        # 소스 매핑
-        source_mapping = {
-            "네이버": "네이버", "naver": "네이버",
-            "구글": "구글", "google": "구글",
-        }
+        valid_sources = self._normalize_sources(sources)
         
-        valid_sources = []
-        for source in sources:
-            normalized = source_mapping.get(source)
-            if normalized and normalized not in valid_sources:
-                valid_sources.append(normalized)
-        
-        if not valid_sources:
-            valid_sources = ["네이버"]
-        
-        print(f"[DEBUG] 병렬 뉴스 검색 시작: {keyword}, 소스: {valid_sources}")
+        logger.debug("병렬 뉴스 검색 시작: %s, 소스: %s", keyword, valid_sources)
         safe_log("병렬 뉴스 검색 시작", level="info", keyword=keyword, sources=valid_sources)
         
-        # 병렬로 검색 태스크 생성
+        # 병렬로 검색 태스크 생성 {소스: 코루틴}
+        searches = {}
         if "네이버" in valid_sources:
-            tasks.append(("네이버", self.naver_scraper.search_news(keyword, max_articles)))
+            searches["네이버"] = self.naver_scraper.search_news(keyword, max_articles)
         if "구글" in valid_sources:
-            tasks.append(("구글", self.google_scraper.search_news(keyword, max_articles)))
+            searches["구글"] = self.google_scraper.search_news(keyword, max_articles)
         
-        # 병렬 실행
-        if tasks:
-            task_results = await asyncio.gather(
-                *[task[1] for task in tasks],
-                return_exceptions=True
-            )
-            
-            for i, (source, _) in enumerate(tasks):
-                if isinstance(task_results[i], Exception):
-                    safe_log(f"{source} 검색 실패", level="error", error=str(task_results[i]))
-                    results[source] = []
-                else:
-                    results[source] = task_results[i]
+        # 병렬 실행 (결과는 searches 순서와 같음)
+        search_results = await asyncio.gather(*searches.values(), return_exceptions=True)
+        for source, result in zip(searches, search_results):
+            if isinstance(result, Exception):
+                safe_log(f"{source} 검색 실패", level="error", error=str(result))
+            else:
+                results[source] = result
         
         total_urls = sum(len(urls) for urls in results.values())
-        print(f"[DEBUG] ✓ 병렬 검색 완료: 총 {total_urls}개 URL")
+        logger.debug("✓ 병렬 검색 완료: 총 %s개 URL", total_urls)
         safe_log("병렬 검색 완료", level="info", total_urls=total_urls)
         
         return results
@@ -114,41 +116,28 @@ class PlaywrightNewsScraper:
             기사 정보 목록
         """
         articles = []
-        tasks = []
-        
-        # 모든 URL에 대해 태스크 생성
-        for source, urls in url_map.items():
-            scraper = self.naver_scraper if source == "네이버" else self.google_scraper
-            for url in urls:
-                tasks.append((source, url, scraper.extract_article(url)))
-        
-        print(f"[DEBUG] 병렬 기사 추출 시작: {len(tasks)}개 기사")
-        safe_log("병렬 기사 추출 시작", level="info", count=len(tasks))
-        
-        # 세마포어로 동시 처리 수 제한
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def extract_with_semaphore(source: str, url: str, coro):
-            async with semaphore:
-                try:
-                    result = await coro
-                    return result
-                except Exception as e:
-                    safe_log("기사 추출 실패", level="warning", error=str(e), url=url)
-                    return None
-        
-        # 병렬 실행
-        results = await asyncio.gather(
-            *[extract_with_semaphore(s, u, c) for s, u, c in tasks],
-            return_exceptions=True
-        )
+        sources = [(source, urls) for source, urls in url_map.items() if urls]
+        total = sum(len(urls) for _, urls in sources)
+        
+        logger.debug("병렬 기사 추출 시작: %s개 기사", total)
+        safe_log("병렬 기사 추출 시작", level="info", count=total)
+        
+        # 소스별 스크래퍼가 각자의 페이지 풀 크기만큼 동시에 추출
+        source_results = await asyncio.gather(*[
+            (self.naver_scraper if source == "네이버" else self.google_scraper)
+            .extract_articles(urls, max_concurrent)
+            for source, urls in sources
+        ])
         
         # 결과 필터링 (None과 Exception 제외)
-        for result in results:
-            if result and not isinstance(result, Exception):
-                articles.append(result)
+        for (_, urls), source_result in zip(sources, source_results):
+            for url, result in zip(urls, source_result):
+                if isinstance(result, Exception):
+                    safe_log("기사 추출 실패", level="warning", error=str(result), url=url)
+                elif result:
+                    articles.append(result)
         
-        print(f"[DEBUG] ✓ 병렬 기사 추출 완료: {len(articles)}개 성공")
+        logger.debug("✓ 병렬 기사 추출 완료: %s개 성공", len(articles))
         safe_log("병렬 기사 추출 완료", level="info", success_count=len(articles))
         
         return articles
@@ -170,13 +159,33 @@ class PlaywrightNewsScraper:
         Returns:
             기사 정보 목록
         """
-        # 1. 병렬 검색
-        url_map = await self.search_news_parallel(keyword, sources, max_articles)
+        valid_sources = self._normalize_sources(sources)
+        logger.debug("크롤링 파이프라인 시작: %s, 소스: %s", keyword, valid_sources)
+        safe_log("크롤링 파이프라인 시작", level="info", keyword=keyword, sources=valid_sources)
         
-        # 2. 병렬 추출
-        articles = await self.extract_articles_parallel(url_map)
+        # 소스별로 검색 → 추출을 이어서 실행
+        # (모든 소스의 검색이 끝날 때까지 기다리지 않고, 먼저 끝난 소스부터 추출 시작)
+        source_articles = await asyncio.gather(*[
+            self._search_and_extract(source, keyword, max_articles)
+            for source in valid_sources
+        ])
         
-        return articles
+        return [article for articles in source_articles for article in articles]
+    
+    async def _search_and_extract(
+        self,
+        source: str,
+        keyword: str,
+        max_articles: int
+    ) -> List[Dict[str, Any]]:
+        """한 소스의 검색 결과가 나오는 즉시 해당 소스의 기사 추출"""
+        scraper = self.naver_scraper if source == "네이버" else self.google_scraper
+        try:
+            urls = await scraper.search_news(keyword, max_articles)
+        except Exception as e:
+            safe_log(f"{source} 검색 실패", level="error", error=str(e))
+            return []
+        return await self.extract_articles_parallel({source: urls})
     
     async def cleanup(self):
         """리소스 정리"""
@@ -195,18 +204,41 @@ class PlaywrightNewsScraperSync:
     기존 동기 코드에서 Playwright 비동기 스크래퍼를 사용할 수 있게 해줍니다.
     """
     
-    def __init__(self):
+    def __init__(self, warmup: bool = False):
+        """
+        초기화
+        
+        Args:
+            warmup: True면 생성 시 브라우저를 미리 실행 (첫 호출 지연 제거)
+        """
         self._scraper = PlaywrightNewsScraper()
         self._loop = None
+        if warmup:
+            self.warmup()
     
-    def _get_loop(self):
-        """이벤트 루프 가져오기"""
+    def warmup(self) -> None:
+        """브라우저를 미리 실행 (이후 호출은 같은 루프에서 준비된 브라우저와 컨텍스트 재사용)"""
+        self._run(self._scraper.setup())
+    
+    def _run(self, coro):
+        """
+        전용 이벤트 루프에서 코루틴 실행
+        
+        브라우저/컨텍스트가 생성된 루프에 묶이므로 호출마다 asyncio.run으로 새 루프를 만들지 않고
+        cleanup() 전까지 같은 루프를 재사용합니다.
+        """
         try:
-            return asyncio.get_running_loop()
+            asyncio.get_running_loop()
         except RuntimeError:
-            if self._loop is None:
-                self._loop = asyncio.new_event_loop()
-            return self._loop
+            pass
+        else:
+            coro.close()
+            raise RuntimeError(
+                "실행 중인 이벤트 루프 안에서는 동기 래퍼 대신 PlaywrightNewsScraper를 직접 await 하세요"
+            )
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
     
     def search_news(self, keyword: str, sources: List[str], max_articles: int = 5) -> List[str]:
         """동기 방식 뉴스 검색"""
@@ -218,8 +250,7 @@ class PlaywrightNewsScraperSync:
                 all_urls.extend(urls)
             return all_urls
         
-        loop = self._get_loop()
-        return loop.run_until_complete(_search())
+        return self._run(_search())
     
     def scrape_article(self, url: str, source: str = "네이버") -> Optional[Dict[str, Any]]:
         """동기 방식 기사 추출"""
@@ -229,17 +260,17 @@ class PlaywrightNewsScraperSync:
             else:
                 return await self._scraper.google_scraper.extract_article(url)
         
-        loop = self._get_loop()
-        return loop.run_until_complete(_extract())
+        return self._run(_extract())
     
     def cleanup(self):
         """리소스 정리"""
-        async def _cleanup():
-            await self._scraper.cleanup()
+        if self._loop is None:
+            return  # 한 번도 실행하지 않았으면 정리할 리소스 없음
         
-        loop = self._get_loop()
-        loop.run_until_complete(_cleanup())
-        if self._loop:
+        try:
+            self._run(self._scraper.cleanup())
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        finally:
             self._loop.close()
             self._loop = None
 
@@ -1,7 +1,7 @@
 """
 News Scraper Tool
 
-Selenium을 이용한 뉴스 크롤링 Tool 구현
+Selenium을 이용한 뉴스 크롤링 Tool 구현 (CRAWLER_BACKEND=playwright 설정 시 Playwright 사용)
 네이버 뉴스와 구글 뉴스 지원
 보안 가이드라인: robots.txt 준수, Rate Limit 준수, User-Agent 설정
 
@@ -9,16 +9,352 @@ Selenium을 이용한 뉴스 크롤링 Tool 구현
 통합 인터페이스를 제공합니다.
 """
 
-import time
-from typing import List, Dict, Any, Optional
+import asyncio
+import dataclasses
+import hashlib
+import multiprocessing.util
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from enum import Enum
+from types import MappingProxyType
+from urllib.parse import urlparse
 
+import aiohttp
 from langchain.tools import tool
 
+from common.config import get_config
+from common.dedup import URLBloom
+from common.models import SentimentType
+from common.rate_limit import TokenBucket
+from common.retry import RetryableError, parse_retry_after, retry
 from common.utils import safe_log, validate_input, validate_url
-from .models import NewsArticle
+from .base_scraper import BaseNewsScraper
+from .models import Comment, NewsArticle
 from .naver_scraper import NaverNewsScraper
-from .google_scraper import GoogleNewsScraper
+from .google_scraper import GoogleNewsScraper, SELECTOLAX_AVAILABLE, parse_article_html
+
+# JSON 직렬화 (orjson이 있으면 C 구현 사용, 없으면 표준 라이브러리)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# 기사 디스크 캐시 (선택적, 없으면 매번 새로 스크레이핑)
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# 시스템 자원 모니터링 (선택적, 없으면 Selenium 동시 추출 수 고정)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Playwright 백엔드 (선택적, CRAWLER_BACKEND=playwright일 때 사용)
+try:
+    from .playwright_scraper import PlaywrightNewsScraper
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+# 브라우저 없이 처리할 수 없는 구글 뉴스 호스트 (JS 리다이렉션)
+GOOGLE_NEWS_HOST = "news.google.com"
+
+# 호스트당 동시 정적 요청 수
+STATIC_CONCURRENCY_PER_HOST = 64
+
+# 정적 추출 연결 풀 전체 크기 (기본값 100이면 여러 호스트 동시 요청 시 연결 대기 발생)
+STATIC_MAX_CONNECTIONS = 256
+
+STATIC_REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+# 재시도할 HTTP 상태 코드 (일시적 과부하/차단)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# 정적 요청 최대 시도 횟수
+STATIC_FETCH_TRIES = 4
+
+# 429 응답에 Retry-After가 없을 때 해당 호스트의 Selenium 요청을 쉬는 시간 (초)
+DEFAULT_THROTTLE_DELAY = 5.0
+
+
+@retry((RetryableError, aiohttp.ClientConnectionError, asyncio.TimeoutError),
+       tries=STATIC_FETCH_TRIES, base=0.5, cap=10.0)
+async def _fetch_html(session: aiohttp.ClientSession, url: str) -> Optional[str]:
+    """기사 HTML 요청 (429/5xx와 연결 오류는 백오프 후 재시도, HTML이 아니면 None)"""
+    async with session.get(url) as response:
+        if response.status in RETRY_STATUSES:
+            raise RetryableError(
+                f"HTTP {response.status}",
+                status=response.status,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+        response.raise_for_status()
+        if response.content_type != "text/html":
+            return None
+        return await response.text(errors="replace")
+
+
+async def _fetch_and_parse(session: aiohttp.ClientSession, url: str,
+                           semaphores: Dict[str, asyncio.Semaphore],
+                           throttled: Dict[str, float]) -> Optional[Dict[str, str]]:
+    """
+    단일 기사를 HTTP로 받아 정적 파싱 (실패 시 None)
+
+    재시도 후에도 429면 throttled[host]에 서버가 요청한 대기 시간을 기록합니다.
+    """
+    host = urlparse(url).netloc
+    semaphore = semaphores.setdefault(host, asyncio.Semaphore(STATIC_CONCURRENCY_PER_HOST))
+    async with semaphore:
+        try:
+            html_text = await _fetch_html(session, url)
+        except RetryableError as e:
+            if e.status == 429:
+                throttled[host] = max(throttled.get(host, 0.0), e.retry_after or DEFAULT_THROTTLE_DELAY)
+            safe_log("정적 기사 요청 실패", level="warning", error=str(e), url=url)
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            safe_log("정적 기사 요청 실패", level="warning", error=str(e), url=url)
+            return None
+    if html_text is None:
+        return None
+    return parse_article_html(html_text)
+
+
+async def _scrape_all(urls: List[str],
+                      throttled: Dict[str, float]) -> List[Optional[Dict[str, str]]]:
+    """여러 기사를 동시에 정적 추출 (결과는 urls 순서, 실패 항목은 None)"""
+    semaphores: Dict[str, asyncio.Semaphore] = {}
+    # 한 세션의 keep-alive 연결 풀을 모든 기사 요청이 공유 (호스트당 TLS 핸드셰이크는 연결마다 1회)
+    connector = aiohttp.TCPConnector(
+        limit=STATIC_MAX_CONNECTIONS,
+        limit_per_host=STATIC_CONCURRENCY_PER_HOST,
+        ttl_dns_cache=300,
+    )
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers=STATIC_REQUEST_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=15),
+    ) as session:
+        tasks = [asyncio.create_task(_fetch_and_parse(session, url, semaphores, throttled)) for url in urls]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    return [None if isinstance(result, BaseException) else result for result in results]
+
+
+def _needs_browser(url: str, source: str) -> bool:
+    """
+    Selenium이 필요한 기사인지 판단
+
+    네이버 기사는 댓글이 JS로 로드되므로 항상 Selenium을 사용하고,
+    구글 뉴스 리다이렉션 URL도 브라우저가 필요합니다.
+    """
+    return source == "naver" or urlparse(url).netloc == GOOGLE_NEWS_HOST
+
+
+def _in_running_loop() -> bool:
+    """이벤트 루프 안에서 호출되었는지 확인 (이 경우 asyncio.run 사용 불가)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _scrape_static(urls: List[str], throttled: Dict[str, float]) -> Dict[str, Dict[str, str]]:
+    """
+    정적 추출 파이프라인 실행 후 성공한 기사만 URL별로 반환
+
+    429로 실패한 호스트는 throttled에 대기 시간(초)이 기록됩니다.
+    """
+    # 이미 이벤트 루프 안에서 호출되면 Selenium으로 처리
+    if not urls or not SELECTOLAX_AVAILABLE or _in_running_loop():
+        return {}
+    results = asyncio.run(_scrape_all(urls, throttled))
+    return {url: result for url, result in zip(urls, results) if result}
+
+
+# Playwright 결과의 소스 표기 → NewsArticle 소스 코드
+PLAYWRIGHT_SOURCE_CODES = {"네이버": "naver", "구글": "google"}
+
+
+def _use_playwright() -> bool:
+    """scrape_news를 Playwright 백엔드로 실행할지 여부"""
+    return get_config().CRAWLER_BACKEND == "playwright" and PLAYWRIGHT_AVAILABLE and not _in_running_loop()
+
+
+async def _scrape_with_playwright(keyword: str, sources: List[str],
+                                  max_articles: int) -> List[NewsArticle]:
+    """Playwright 공유 브라우저로 검색과 기사 추출을 모두 비동기 실행"""
+    scraper = PlaywrightNewsScraper()
+    try:
+        results = await scraper.scrape_all(keyword, sources, max_articles)
+    finally:
+        # 마지막 사용자가 해제하면 공유 브라우저도 종료됨 (asyncio.run 루프가 닫히기 전에 정리)
+        await scraper.cleanup()
+
+    return [
+        NewsArticle(
+            url=result.get("url", ""),
+            title=result.get("title", ""),
+            content=result.get("content", ""),
+            source=PLAYWRIGHT_SOURCE_CODES.get(result.get("source"), result.get("source")),
+            extraction_method=result.get("extraction_method", "playwright"),
+        )
+        for result in results
+    ]
+
+
+# 기사 디스크 캐시 설정 (발행된 기사 본문은 거의 바뀌지 않으므로 일주일 보관)
+ARTICLE_CACHE_DIR = os.path.expanduser("~/.cache/aiagentcrawl/articles")
+ARTICLE_CACHE_SIZE_LIMIT = 1 << 30
+ARTICLE_CACHE_TTL = 86400 * 7
+
+# 추출 결과 형식/기준이 바뀌면 올려서 이전 캐시 항목을 무효화
+# (2: 정적 파싱 본문에 섞여 저장된 script/style 텍스트 제거)
+ARTICLE_CACHE_VERSION = 2
+
+# 추출 실패 시 크롤러가 채우는 본문 (캐시하지 않음)
+FAILED_CONTENTS = frozenset({"추출 실패", "본문 추출 실패", "유효하지 않은 URL"})
+
+
+def _article_cache_key(url: str) -> str:
+    """기사 캐시 키 (캐시 버전 + URL 해시)"""
+    return hashlib.blake2b(f"{ARTICLE_CACHE_VERSION}:{url}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """표준 json 폴백용 직렬화 (orjson은 datetime/Enum을 직접 처리)"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+def _dumps(data: Any) -> bytes:
+    """JSON 직렬화 (UTF-8 바이트)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """JSON 역직렬화"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _article_to_payload(article: NewsArticle) -> bytes:
+    """NewsArticle 전체 필드를 캐시용 JSON으로 변환 (to_dict는 본문을 자르므로 사용하지 않음)"""
+    return _dumps(dataclasses.asdict(article))
+
+
+def _article_from_payload(payload: bytes) -> NewsArticle:
+    """캐시에 저장된 JSON에서 NewsArticle 복원"""
+    data = _loads(payload)
+    comments = []
+    for comment in data.get("comments", ()):
+        if comment.get("timestamp"):
+            comment["timestamp"] = datetime.fromisoformat(comment["timestamp"])
+        if comment.get("sentiment"):
+            comment["sentiment"] = SentimentType(comment["sentiment"])
+        comments.append(Comment(**comment))
+    data["comments"] = comments
+    if data.get("published_date"):
+        data["published_date"] = datetime.fromisoformat(data["published_date"])
+    return NewsArticle(**data)
+
+
+# Selenium 워커 프로세스 수 (프로세스마다 헤드리스 Chrome 1개를 네이버/구글 크롤러가 공유)
+# 시작 동시 추출 수에서 메모리/CPU 여유에 따라 최소~최대 사이로 자동 조절
+SELENIUM_WORKERS = 2
+SELENIUM_MIN_WORKERS = 1
+SELENIUM_MAX_WORKERS = 4
+
+# 동시 추출 수 조절 기준 (%)
+MEMORY_HIGH_PERCENT = 85
+CPU_HIGH_PERCENT = 70
+
+SCRAPER_CLASSES = {
+    "naver": NaverNewsScraper,
+    "google": GoogleNewsScraper,
+}
+
+# 워커 프로세스별 크롤러 인스턴스 (WebDriver는 스레드 안전하지 않으므로 프로세스마다 소유)
+_WORKER_SCRAPERS: Dict[str, BaseNewsScraper] = {}
+
+
+def _cleanup_worker() -> None:
+    """워커 프로세스 종료 시 WebDriver 정리 (크롤러들이 공유하는 드라이버는 한 번만 종료)"""
+    quit_drivers = set()
+    for scraper in _WORKER_SCRAPERS.values():
+        if scraper.driver is None:
+            continue
+        if id(scraper.driver) in quit_drivers:
+            scraper.driver = None
+            continue
+        quit_drivers.add(id(scraper.driver))
+        try:
+            scraper.cleanup()
+        except Exception as e:
+            safe_log("워커 크롤러 정리 오류", level="warning", error=str(e))
+    _WORKER_SCRAPERS.clear()
+
+
+def _init_worker() -> None:
+    """워커 프로세스 초기화 (프로세스 종료 시 드라이버 정리 등록)"""
+    # 워커 프로세스는 atexit 핸들러를 실행하지 않으므로 multiprocessing 종료 훅 사용
+    multiprocessing.util.Finalize(None, _cleanup_worker, exitpriority=10)
+
+
+def _worker_scraper(source: str) -> BaseNewsScraper:
+    """
+    워커 프로세스의 소스별 크롤러 반환 (지연 초기화)
+
+    다른 소스의 크롤러가 이미 드라이버를 띄웠으면 그 드라이버를 함께 사용하여
+    프로세스당 Chrome을 하나만 실행합니다.
+    """
+    scraper = _WORKER_SCRAPERS.get(source)
+    if scraper is None:
+        scraper = _WORKER_SCRAPERS[source] = SCRAPER_CLASSES[source]()
+    if scraper.driver is None:
+        scraper.driver = next(
+            (other.driver for other in _WORKER_SCRAPERS.values() if other.driver is not None),
+            None,
+        )
+    return scraper
+
+
+def _worker_search(source: str, keyword: str, max_articles: int) -> List[str]:
+    """워커 프로세스에서 기사 URL 검색"""
+    return _worker_scraper(source).search_news(keyword, max_articles)
+
+
+def _failed_article(url: str, source: str) -> NewsArticle:
+    """워커 오류로 추출하지 못한 기사 (크롤러의 추출 실패 결과와 같은 형태)"""
+    return NewsArticle(
+        url=url,
+        title="추출 실패",
+        content="추출 실패",
+        source=source,
+        extraction_method="selenium",
+    )
+
+
+def _worker_scrape(url: str, source: str) -> NewsArticle:
+    """워커 프로세스에서 단일 기사 스크레이핑"""
+    return _worker_scraper(source).scrape_article(url)
 
 
 class NewsSource(str, Enum):
@@ -27,30 +363,155 @@ class NewsSource(str, Enum):
     GOOGLE = "구글"
 
 
+# 소스 매핑 (다양한 이름 지원)
+_SOURCE_MAPPING = MappingProxyType({
+    "네이버": NewsSource.NAVER.value,
+    "naver": NewsSource.NAVER.value,
+    "구글": NewsSource.GOOGLE.value,
+    "google": NewsSource.GOOGLE.value,
+})
+
+# 정규화된 소스 → 검색 메서드 이름
+_DISPATCH = MappingProxyType({
+    NewsSource.NAVER.value: "search_naver_news",
+    NewsSource.GOOGLE.value: "search_google_news",
+})
+
+
+# 호스트(또는 상위 도메인) → 크롤러 소스 코드
+_HOST_DISPATCH = MappingProxyType({
+    "naver.com": "naver",
+    "news.google.com": "google",
+})
+
+
 class NewsScraperTool:
     """
     뉴스 스크레이퍼 Tool 클래스 (통합 인터페이스)
     
-    분리된 크롤러(NaverNewsScraper, GoogleNewsScraper)를 사용하여
-    여러 뉴스 소스에서 뉴스를 수집합니다.
+    분리된 크롤러(NaverNewsScraper, GoogleNewsScraper)를 워커 프로세스에서
+    실행하여 여러 뉴스 소스에서 뉴스를 수집합니다.
     """
 
-    def __init__(self):
-        """초기화"""
-        self.naver_scraper: Optional[NaverNewsScraper] = None
-        self.google_scraper: Optional[GoogleNewsScraper] = None
+    def __init__(self, requests_per_second: float = 1.0, burst: float = 1.0,
+                 max_workers: int = SELENIUM_MAX_WORKERS):
+        """
+        초기화
 
-    def _get_naver_scraper(self) -> NaverNewsScraper:
-        """네이버 크롤러 인스턴스 반환 (지연 초기화)"""
-        if self.naver_scraper is None:
-            self.naver_scraper = NaverNewsScraper()
-        return self.naver_scraper
+        Args:
+            requests_per_second: 호스트당 허용 요청 속도
+            burst: 호스트당 대기 없이 허용되는 연속 요청 수
+            max_workers: Selenium 워커 프로세스 최대 수
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_workers = max_workers
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._seen: Optional[URLBloom] = None
+        self._cache: Optional["diskcache.Cache"] = None
+
+    @staticmethod
+    def source_of(url: str) -> str:
+        """
+        URL 호스트로 크롤러 소스 판단
 
-    def _get_google_scraper(self) -> GoogleNewsScraper:
-        """구글 크롤러 인스턴스 반환 (지연 초기화)"""
-        if self.google_scraper is None:
-            self.google_scraper = GoogleNewsScraper()
-        return self.google_scraper
+        호스트와 상위 도메인을 차례로 _HOST_DISPATCH에서 찾고(m.news.naver.com → naver.com),
+        해당하지 않는 언론사 사이트는 범용 추출기를 쓰는 "google"로 처리합니다.
+        """
+        labels = (urlparse(url).hostname or "").split(".")
+        for i in range(len(labels) - 1):
+            source = _HOST_DISPATCH.get(".".join(labels[i:]))
+            if source is not None:
+                return source
+        return "google"
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Selenium 워커 프로세스 풀 반환 (지연 초기화, 정적 추출만 하면 프로세스를 띄우지 않음)"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker)
+        return self._pool
+
+    def _reset_pool(self) -> None:
+        """손상된 워커 풀 폐기 (다음 _get_pool 호출 시 새 풀 생성)"""
+        if self._pool is not None:
+            try:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            except Exception as e:
+                safe_log("Selenium 워커 풀 정리 오류", level="warning", error=str(e))
+            self._pool = None
+
+    def _submit(self, fn, *args) -> Future:
+        """
+        워커 풀에 작업 제출
+
+        워커 프로세스가 비정상 종료되면 풀 전체가 BrokenProcessPool 상태로 남으므로,
+        풀을 새로 만들어 한 번 더 제출합니다.
+        """
+        try:
+            return self._get_pool().submit(fn, *args)
+        except BrokenProcessPool:
+            safe_log("Selenium 워커 풀 손상, 새 풀로 재시작", level="warning")
+            self._reset_pool()
+            return self._get_pool().submit(fn, *args)
+
+    def _article_cache(self) -> Optional["diskcache.Cache"]:
+        """기사 디스크 캐시 반환 (지연 초기화, diskcache가 없으면 None)"""
+        if self._cache is None and DISKCACHE_AVAILABLE:
+            self._cache = diskcache.Cache(ARTICLE_CACHE_DIR, size_limit=ARTICLE_CACHE_SIZE_LIMIT)
+        return self._cache
+
+    def get_cached_article(self, url: str) -> Optional[NewsArticle]:
+        """
+        캐시된 기사 반환
+
+        Args:
+            url: 기사 URL
+
+        Returns:
+            캐시에 있으면 NewsArticle, 없으면 None
+        """
+        cache = self._article_cache()
+        if cache is None or not validate_url(url):
+            return None
+        payload = cache.get(_article_cache_key(url))
+        if not isinstance(payload, bytes):
+            # 없거나 이전 형식(pickle된 dict)으로 저장된 항목
+            return None
+        safe_log("기사 캐시 적중", level="debug", url=url)
+        return _article_from_payload(payload)
+
+    def _store_article(self, article: NewsArticle) -> None:
+        """
+        추출에 성공한 기사를 캐시에 저장
+
+        skip_seen 검색으로 방문 기록을 사용 중이면 기록에도 추가합니다
+        (추출 전에 기록하면 실패한 기사가 이후 실행에서 계속 제외되므로).
+        """
+        if article.content in FAILED_CONTENTS or not validate_url(article.url):
+            return
+        if self._seen is not None:
+            self._seen.check_and_add(article.url)
+        cache = self._article_cache()
+        if cache is not None:
+            cache.set(_article_cache_key(article.url), _article_to_payload(article), expire=ARTICLE_CACHE_TTL)
+
+    def _seen_urls(self) -> URLBloom:
+        """실행 간 URL 방문 기록 반환 (지연 로드)"""
+        if self._seen is None:
+            self._seen = URLBloom()
+        return self._seen
+
+    def _bucket_for(self, url: str) -> TokenBucket:
+        """URL 호스트별 토큰 버킷 반환 (Rate Limit은 호스트 단위로 적용)"""
+        return self._host_bucket(urlparse(url).netloc)
+
+    def _host_bucket(self, host: str) -> TokenBucket:
+        """호스트의 토큰 버킷 반환"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+        return bucket
 
     def search_naver_news(self, keyword: str, max_articles: int = 5) -> List[str]:
         """
@@ -63,8 +524,7 @@ class NewsScraperTool:
         Returns:
             기사 URL 목록
         """
-        scraper = self._get_naver_scraper()
-        return scraper.search_news(keyword, max_articles)
+        return self._submit(_worker_search, "naver", keyword, max_articles).result()
 
     def search_google_news(self, keyword: str, max_articles: int = 5) -> List[str]:
         """
@@ -77,10 +537,10 @@ class NewsScraperTool:
         Returns:
             기사 URL 목록
         """
-        scraper = self._get_google_scraper()
-        return scraper.search_news(keyword, max_articles)
+        return self._submit(_worker_search, "google", keyword, max_articles).result()
 
-    def search_news(self, keyword: str, sources: List[str], max_articles: int = 5) -> List[str]:
+    def search_news(self, keyword: str, sources: List[str], max_articles: int = 5,
+                    skip_seen: bool = False) -> List[str]:
         """
         여러 소스에서 뉴스 검색
         
@@ -88,95 +548,158 @@ class NewsScraperTool:
             keyword: 검색할 키워드
             sources: 뉴스 소스 목록 (["네이버", "구글"])
             max_articles: 소스당 최대 기사 수
+            skip_seen: True면 이전 실행에서 이미 수집한 URL 제외
         
         Returns:
             기사 URL 목록
         """
-        all_urls = []
-        
-        # 소스 매핑 (다양한 이름 지원)
-        source_mapping = {
-            "네이버": "네이버",
-            "naver": "네이버",
-            "구글": "구글",
-            "google": "구글",
-        }
-        
-        # 지원되는 소스만 필터링
-        valid_sources = []
-        for source in sources:
-            normalized_source = source_mapping.get(source, None)
-            if normalized_source:
-                if normalized_source not in valid_sources:
-                    valid_sources.append(normalized_source)
-                if source != normalized_source:
-                    safe_log(f"소스 매핑: {source} -> {normalized_source}", level="info")
-            else:
-                safe_log("지원하지 않는 뉴스 소스", level="warning", source=source)
+        # 지원되는 소스만 한 번에 정규화 (dict로 순서 유지 + 중복 제거)
+        valid_sources = list({_SOURCE_MAPPING[s]: None for s in sources if s in _SOURCE_MAPPING})
+        unsupported = [s for s in sources if s not in _SOURCE_MAPPING]
+        if unsupported:
+            safe_log("지원하지 않는 뉴스 소스", level="warning", sources=unsupported)
         
         # 지원되는 소스가 없으면 네이버를 기본값으로 사용
         if not valid_sources:
-            valid_sources = ["네이버"]
+            valid_sources = [NewsSource.NAVER.value]
             safe_log("지원되는 소스가 없어 네이버를 기본값으로 사용", level="info")
         
-        for source in valid_sources:
-            try:
-                if source == "네이버" or source == NewsSource.NAVER.value:
-                    urls = self.search_naver_news(keyword, max_articles)
-                    all_urls.extend(urls)
-                elif source == "구글" or source == NewsSource.GOOGLE.value:
-                    urls = self.search_google_news(keyword, max_articles)
-                    all_urls.extend(urls)
-                else:
-                    safe_log("지원하지 않는 뉴스 소스", level="warning", source=source)
-            except Exception as e:
-                safe_log(f"{source} 뉴스 검색 실패", level="error", error=str(e))
+        def _gen_urls() -> Iterator[str]:
+            """소스별 검색 결과를 중간 리스트 없이 차례로 내보냄"""
+            for source in valid_sources:
+                try:
+                    yield from getattr(self, _DISPATCH[source])(keyword, max_articles)
+                except Exception as e:
+                    safe_log(f"{source} 뉴스 검색 실패", level="error", error=str(e))
+
+        # 중복 제거 (호출 내 중복은 집합으로 정확히, 실행 간 중복은 URL 기록으로)
+        seen = set()
+        unique_urls = []
+        for url in _gen_urls():
+            if url in seen:
                 continue
-
-        # 중복 제거
-        unique_urls = list(dict.fromkeys(all_urls))  # 순서 유지하면서 중복 제거
+            seen.add(url)
+            # 방문 기록은 추출에 성공한 뒤(_store_article)에 추가
+            if skip_seen and url in self._seen_urls():
+                continue
+            unique_urls.append(url)
         safe_log("전체 기사 URL 수집 완료", level="info", total=len(unique_urls), sources=valid_sources)
         return unique_urls
 
 
-    def scrape_article(self, url: str, source: str = "naver") -> NewsArticle:
+    def submit_article(self, url: str, source: str = "naver") -> "Future[NewsArticle]":
         """
-        단일 기사 스크레이핑
-        
+        단일 기사 스크레이핑을 워커 프로세스에 제출
+
         Args:
             url: 기사 URL
             source: 뉴스 소스 ("naver" 또는 "google")
-        
+
         Returns:
-            NewsArticle 객체
+            NewsArticle을 결과로 갖는 Future
         """
         safe_log("기사 스크레이핑 시작", level="info", url=url, source=source)
 
         # 소스에 따라 적절한 크롤러 사용
-        if source == "naver":
-            scraper = self._get_naver_scraper()
-        elif source == "google":
-            scraper = self._get_google_scraper()
-        else:
+        if source not in SCRAPER_CLASSES:
             # 기본값으로 네이버 사용
             safe_log(f"알 수 없는 소스 '{source}', 네이버로 대체", level="warning")
-            scraper = self._get_naver_scraper()
+            source = "naver"
 
-        return scraper.scrape_article(url)
+        return self._submit(_worker_scrape, url, source)
 
-    def cleanup(self):
-        """리소스 정리"""
-        if self.naver_scraper:
-            try:
-                self.naver_scraper.cleanup()
-            except Exception as e:
-                safe_log("네이버 크롤러 정리 오류", level="warning", error=str(e))
+    def _scale_concurrency(self, concurrency: int, backlog: int) -> int:
+        """
+        시스템 자원 사용률로 다음 동시 추출 수 결정
+
+        메모리 사용률이 높으면 줄이고, 대기 작업이 있고 CPU 여유가 있으면 늘립니다.
+        """
+        if not PSUTIL_AVAILABLE:
+            return concurrency
+        if psutil.virtual_memory().percent >= MEMORY_HIGH_PERCENT:
+            return max(SELENIUM_MIN_WORKERS, concurrency - 1)
+        if backlog and psutil.cpu_percent(interval=None) < CPU_HIGH_PERCENT:
+            return min(self.max_workers, concurrency + 1)
+        return concurrency
+
+    def scrape_articles(self, jobs: List[Tuple[str, str]]) -> Iterator[Tuple[int, NewsArticle]]:
+        """
+        여러 기사를 Selenium 워커로 추출 (동시 추출 수 자동 조절)
+
+        작업이 하나 끝날 때마다 자원 사용률을 보고 동시 추출 수를 조절하며,
+        추출한 기사는 캐시에 저장됩니다.
+
+        Args:
+            jobs: (URL, 소스) 목록
+
+        Yields:
+            완료된 순서대로 (jobs 인덱스, NewsArticle)
+        """
+        backlog = deque(enumerate(jobs))
+        in_flight: Dict["Future[NewsArticle]", int] = {}
+        concurrency = min(SELENIUM_WORKERS, self.max_workers)
+
+        while backlog or in_flight:
+            while backlog and len(in_flight) < concurrency:
+                index, (url, source) = backlog.popleft()
+                # Rate Limit 준수 (같은 호스트에 대해서만 대기)
+                self._bucket_for(url).acquire()
+                try:
+                    in_flight[self.submit_article(url, source)] = index
+                except Exception as e:
+                    # 제출 실패도 해당 기사만 실패로 처리하고 나머지 작업은 계속 진행
+                    safe_log("기사 추출 작업 제출 오류", level="warning", error=str(e), url=url)
+                    yield index, _failed_article(url, source)
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                try:
+                    article = future.result()
+                except Exception as e:
+                    # 워커 예외나 BrokenProcessPool이 나머지 기사까지 버리지 않도록 기사별 실패로 처리
+                    url, source = jobs[index]
+                    safe_log("기사 추출 워커 오류", level="warning", error=str(e), url=url)
+                    if isinstance(e, BrokenProcessPool):
+                        self._reset_pool()
+                    article = _failed_article(url, source)
+                self._store_article(article)
+                yield index, article
+
+            concurrency = self._scale_concurrency(concurrency, len(backlog))
+
+    def scrape_article(self, url: str, source: str = "naver") -> NewsArticle:
+        """
+        단일 기사 스크레이핑
+        
+        Args:
+            url: 기사 URL
+            source: 뉴스 소스 ("naver" 또는 "google")
         
-        if self.google_scraper:
+        Returns:
+            NewsArticle 객체
+        """
+        article = self.get_cached_article(url)
+        if article is None:
+            article = self.submit_article(url, source).result()
+            self._store_article(article)
+        return article
+
+    def cleanup(self):
+        """리소스 정리 (워커 프로세스 종료 시 각 프로세스의 WebDriver도 정리됨)"""
+        if self._pool is not None:
             try:
-                self.google_scraper.cleanup()
+                self._pool.shutdown(wait=True)
             except Exception as e:
-                safe_log("구글 크롤러 정리 오류", level="warning", error=str(e))
+                safe_log("Selenium 워커 풀 정리 오류", level="warning", error=str(e))
+            self._pool = None
+
+        if self._seen is not None:
+            self._seen.save()
+
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
 
 
 @tool
@@ -205,8 +728,24 @@ def scrape_news(keyword: str, sources: List[str] = None, max_articles: int = 3)
                 "keyword": keyword
             }]
 
+        # Playwright 백엔드: 드라이버 기동 비용 없이 하나의 브라우저에서 검색/추출을 동시 실행
+        if _use_playwright():
+            articles = asyncio.run(_scrape_with_playwright(keyword, sources, max_articles))
+            if not articles:
+                return [{
+                    "error": f"'{keyword}' 키워드로 기사를 찾을 수 없습니다.",
+                    "keyword": keyword,
+                    "sources": sources
+                }]
+            scraped_articles = []
+            for article in articles:
+                article_dict = article.to_dict()
+                article_dict["keyword"] = keyword
+                scraped_articles.append(article_dict)
+            return scraped_articles
+
         # 1단계: 뉴스 소스에서 기사 URL 검색
-        article_urls = scraper.search_news(keyword, sources, max_articles)
+        article_urls = scraper.search_news(keyword, sources, max_articles, get_config().CRAWLER_SKIP_SEEN)
 
         if not article_urls:
             return [{
@@ -216,21 +755,58 @@ def scrape_news(keyword: str, sources: List[str] = None, max_articles: int = 3)
             }]
 
         # 2단계: 각 기사 상세 정보 추출
-        scraped_articles = []
+        # URL 호스트에서 소스 판단
+        url_sources = [(url, scraper.source_of(url)) for url in article_urls]
+
+        scraped_articles: List[Optional[Dict[str, Any]]] = [None] * len(url_sources)
 
-        for i, url in enumerate(article_urls, 1):
-            safe_log(f"기사 처리 중 ({i}/{len(article_urls)})", level="info")
+        # 캐시된 기사는 네트워크 요청 없이 바로 사용
+        pending = []
+        for i, (url, source) in enumerate(url_sources):
+            cached = scraper.get_cached_article(url)
+            if cached is not None:
+                scraped_articles[i] = cached.to_dict()
+            else:
+                pending.append((i, url, source))
+
+        # 브라우저가 필요 없는 기사는 HTTP + 정적 파싱으로 동시에 추출
+        throttled: Dict[str, float] = {}
+        static_articles = _scrape_static(
+            [url for _, url, source in pending if not _needs_browser(url, source)],
+            throttled,
+        )
+        safe_log("정적 추출 완료", level="info", total=len(static_articles))
+
+        # 429를 받은 호스트는 Selenium 폴백 전에 서버가 요청한 시간만큼 쉼
+        for host, delay in throttled.items():
+            safe_log("요청 제한 응답으로 호스트 대기", level="warning", host=host, delay=delay)
+            scraper._host_bucket(host).pause(delay)
+
+        browser_jobs = []
+
+        for i, url, source in pending:
+            static = static_articles.get(url)
+            if static is not None:
+                article = NewsArticle(
+                    url=url,
+                    title=static["title"],
+                    content=static["content"],
+                    source=source,
+                    extraction_method="static",
+                )
+                scraper._store_article(article)
+                scraped_articles[i] = article.to_dict()
+            else:
+                # 정적 파싱 실패 또는 JS가 필요한 기사는 Selenium 워커로 추출
+                browser_jobs.append((i, url, source))
 
-            # URL에서 소스 판단
-            source = "naver" if "naver.com" in url else "google"
+        jobs = [(url, source) for _, url, source in browser_jobs]
+        for done, (job_index, article) in enumerate(scraper.scrape_articles(jobs), 1):
+            safe_log(f"기사 처리 중 ({done}/{len(jobs)})", level="info")
+            scraped_articles[browser_jobs[job_index][0]] = article.to_dict()
 
-            article = scraper.scrape_article(url, source)
-            article_dict = article.to_dict()
+        for article_dict in scraped_articles:
             article_dict["keyword"] = keyword
-            scraped_articles.append(article_dict)
-
-            # Rate Limit 준수
-            time.sleep(1)
 
         return scraped_articles
 
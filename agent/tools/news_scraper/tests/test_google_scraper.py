@@ -0,0 +1,48 @@
+"""
+구글 크롤러 HTML 파싱 테스트
+"""
+
+import pytest
+
+pytest.importorskip("selectolax")
+
+from agent.tools.news_scraper.google_scraper import parse_article_html
+
+
+BODY = "정상적인 기사 본문입니다. " * 5
+
+
+def test_parse_article_html_extracts_title_and_content():
+    html = f"<html><title>기사 제목 - 언론사</title><body><article><p>{BODY}</p></article></body></html>"
+
+    result = parse_article_html(html)
+
+    assert result == {"title": "기사 제목", "content": BODY.strip()}
+
+
+def test_parse_article_html_ignores_inline_script_in_article():
+    script = 'var x="' + "a" * 200 + '";'
+    html = (
+        "<html><head><title>기사 제목</title></head><body>"
+        f"<article><script>{script}</script><style>.a{{color:red}}</style>"
+        f"<noscript>자바스크립트를 켜주세요</noscript>{BODY}</article>"
+        "</body></html>"
+    )
+
+    result = parse_article_html(html)
+
+    assert result is not None
+    assert "var x" not in result["content"]
+    assert "color:red" not in result["content"]
+    assert "자바스크립트" not in result["content"]
+    assert result["content"] == BODY.strip()
+
+
+def test_parse_article_html_script_only_body_is_not_content():
+    html = (
+        "<html><head><title>기사 제목</title></head><body><div class='content'>"
+        '<script>var x="' + "a" * 200 + '";</script>short'
+        "</div></body></html>"
+    )
+
+    assert parse_article_html(html) is None
@@ -0,0 +1,62 @@
+"""
+Playwright 공유 브라우저 이벤트 루프 전환 테스트
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from agent.tools.news_scraper import playwright_base
+
+
+def fake_playwright(pid):
+    proc = SimpleNamespace(pid=pid)
+    connection = SimpleNamespace(_transport=SimpleNamespace(_proc=proc))
+    return SimpleNamespace(_impl_obj=SimpleNamespace(_connection=connection))
+
+
+@pytest.fixture
+def shared(monkeypatch):
+    state = {"loop": None, "lock": None, "playwright": None, "browser": None, "users": 0}
+    monkeypatch.setattr(playwright_base, "_SHARED", state)
+    return state
+
+
+async def get_lock():
+    return playwright_base._shared_lock()
+
+
+def test_closed_loop_browser_is_killed_before_restart(shared, monkeypatch):
+    killed = []
+    monkeypatch.setattr(playwright_base.os, "kill", lambda pid, sig: killed.append(pid))
+    old_loop = asyncio.new_event_loop()
+    old_loop.close()
+    shared.update(loop=old_loop, playwright=fake_playwright(4321), browser=object(), users=1)
+
+    asyncio.run(get_lock())
+
+    assert killed == [4321]
+    assert shared["playwright"] is None and shared["browser"] is None and shared["users"] == 0
+
+
+def test_live_loop_browser_is_not_replaced(shared):
+    old_loop = asyncio.new_event_loop()
+    shared.update(loop=old_loop, playwright=fake_playwright(4321), browser=object(), users=1)
+    try:
+        with pytest.raises(RuntimeError, match="shutdown_shared"):
+            asyncio.run(get_lock())
+        assert shared["loop"] is old_loop
+    finally:
+        old_loop.close()
+
+
+def test_loop_switch_without_browser_resets_state(shared):
+    shared.update(loop=asyncio.new_event_loop())
+    shared["loop"].close()
+
+    lock = asyncio.run(get_lock())
+
+    assert shared["lock"] is lock
@@ -0,0 +1,137 @@
+"""
+Playwright 구글 크롤러 정적 추출 테스트
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("selectolax")
+pytest.importorskip("aiohttp")
+
+from agent.tools.news_scraper import playwright_google
+from agent.tools.news_scraper.playwright_google import PlaywrightGoogleScraper
+
+
+BODY = "정적으로 추출한 기사 본문입니다. " * 5
+URL = "https://news.example.com/article/1"
+
+
+class FakeStream:
+    """aiohttp StreamReader 대역"""
+
+    def __init__(self, body: bytes, chunk_size: int = 16):
+        self._body = body
+        self._chunk_size = chunk_size
+        self.consumed = 0
+
+    async def read(self, n=-1):
+        # 실제 StreamReader처럼 버퍼에 있는 한 청크만 반환
+        return self._body[:self._chunk_size]
+
+    async def iter_chunked(self, n):
+        for i in range(0, len(self._body), self._chunk_size):
+            self.consumed += self._chunk_size
+            yield self._body[i:i + self._chunk_size]
+
+
+class FakeResponse:
+    """aiohttp 응답 대역"""
+
+    def __init__(self, body: bytes, charset="utf-8"):
+        self.content_type = "text/html"
+        self.charset = charset
+        self.url = URL
+        self.content = FakeStream(body)
+
+    def raise_for_status(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """aiohttp.ClientSession 대역"""
+
+    closed = False
+
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url):
+        return self.response
+
+
+def fetch(response):
+    scraper = PlaywrightGoogleScraper()
+    scraper._http = FakeSession(response)
+    return asyncio.run(scraper._fetch_static_article(URL))
+
+
+def test_fetch_static_article_ignores_inline_script_and_style():
+    html = (
+        "<html><head><title>정적 기사 - 언론사</title></head><body>"
+        '<article><script>var ads="' + "a" * 200 + '";</script>'
+        f"<style>.a{{color:red}}</style><noscript>noscript</noscript>{BODY}</article>"
+        "</body></html>"
+    )
+
+    article = fetch(FakeResponse(html.encode("utf-8")))
+
+    assert article is not None
+    assert article["title"] == "정적 기사"
+    assert article["content"] == BODY.strip()
+
+
+def test_fetch_static_article_script_only_page_falls_back():
+    html = (
+        "<html><head><title>정적 기사</title></head><body>"
+        '<div class="content"><script>var ads="' + "a" * 200 + '";</script>short</div>'
+        "</body></html>"
+    )
+
+    assert fetch(FakeResponse(html.encode("utf-8"))) is None
+
+
+def test_fetch_static_article_reads_all_chunks():
+    html = f"<html><head><title>정적 기사</title></head><body><article>{BODY}</article></body></html>"
+
+    article = fetch(FakeResponse(html.encode("utf-8")))
+
+    assert article is not None
+    assert article["content"] == BODY.strip()
+
+
+def test_fetch_static_article_stops_at_size_cap(monkeypatch):
+    monkeypatch.setattr(playwright_google, "MAX_STATIC_HTML_BYTES", 64)
+    html = f"<html><head><title>정적 기사</title></head><body><article>{BODY}</article></body></html>"
+    response = FakeResponse(html.encode("utf-8"))
+
+    assert fetch(response) is None
+    assert response.content.consumed <= 64 + response.content._chunk_size
+
+
+def test_fetch_static_article_detects_meta_charset():
+    html = (
+        '<html><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr">'
+        f"<title>정적 기사</title></head><body><article>{BODY}</article></body></html>"
+    )
+
+    article = fetch(FakeResponse(html.encode("euc-kr"), charset=None))
+
+    assert article is not None
+    assert article["title"] == "정적 기사"
+    assert article["content"] == BODY.strip()
+
+
+def test_fetch_static_article_unknown_charset_falls_back():
+    html = f"<html><head><title>정적 기사</title></head><body><article>{BODY}</article></body></html>"
+
+    article = fetch(FakeResponse(html.encode("utf-8"), charset="x-unknown-charset"))
+
+    assert article is not None
+    assert article["content"] == BODY.strip()
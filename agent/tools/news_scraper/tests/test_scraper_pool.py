@@ -0,0 +1,106 @@
+"""
+NewsScraperTool Selenium 워커 추출 테스트
+"""
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+from agent.tools.news_scraper import scraper as scraper_module
+from agent.tools.news_scraper.models import NewsArticle
+from agent.tools.news_scraper.scraper import NewsScraperTool
+
+
+def done_future(result=None, exception=None):
+    future = Future()
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+
+def test_scrape_articles_keeps_other_articles_when_worker_fails(monkeypatch):
+    monkeypatch.setattr(scraper_module, "PSUTIL_AVAILABLE", False)
+    jobs = [
+        ("https://n.news.naver.com/article/1", "naver"),
+        ("https://n.news.naver.com/article/2", "naver"),
+        ("https://news.google.com/articles/3", "google"),
+    ]
+    outcomes = {
+        jobs[0][0]: done_future(NewsArticle(url=jobs[0][0], title="기사 1", content="본문 1", source="naver")),
+        jobs[1][0]: done_future(exception=BrokenProcessPool("워커 종료")),
+        jobs[2][0]: done_future(exception=RuntimeError("드라이버 오류")),
+    }
+    tool = NewsScraperTool()
+    monkeypatch.setattr(tool, "submit_article", lambda url, source: outcomes[url])
+
+    results = dict(tool.scrape_articles(jobs))
+
+    assert sorted(results) == [0, 1, 2]
+    assert results[0].title == "기사 1"
+    for index in (1, 2):
+        url, source = jobs[index]
+        failed = results[index]
+        assert failed.url == url
+        assert failed.source == source
+        assert failed.title == "추출 실패"
+        assert failed.content == "추출 실패"
+        assert failed.extraction_method == "selenium"
+
+
+def test_scrape_articles_continues_when_submit_fails(monkeypatch):
+    monkeypatch.setattr(scraper_module, "PSUTIL_AVAILABLE", False)
+    jobs = [
+        ("https://n.news.naver.com/article/1", "naver"),
+        ("https://n.news.naver.com/article/2", "naver"),
+        ("https://n.news.naver.com/article/3", "naver"),
+    ]
+    tool = NewsScraperTool()
+
+    def submit_article(url, source):
+        if url == jobs[1][0]:
+            raise BrokenProcessPool("워커 종료")
+        return done_future(NewsArticle(url=url, title="기사", content="본문", source=source))
+
+    monkeypatch.setattr(tool, "submit_article", submit_article)
+
+    results = dict(tool.scrape_articles(jobs))
+
+    assert sorted(results) == [0, 1, 2]
+    assert results[0].title == results[2].title == "기사"
+    assert results[1].url == jobs[1][0]
+    assert results[1].title == "추출 실패"
+    assert results[1].content == "추출 실패"
+
+
+class FakePool:
+    """ProcessPoolExecutor 대역 (broken이면 submit에서 BrokenProcessPool)"""
+
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        self.broken = False
+        self.shut_down = False
+        FakePool.instances.append(self)
+
+    def submit(self, fn, *args):
+        if self.broken:
+            raise BrokenProcessPool("워커 종료")
+        return done_future(fn.__name__)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_broken_pool_is_replaced_on_next_submit(monkeypatch):
+    FakePool.instances = []
+    monkeypatch.setattr(scraper_module, "ProcessPoolExecutor", FakePool)
+    tool = NewsScraperTool()
+    tool._get_pool().broken = True
+
+    future = tool.submit_article("https://n.news.naver.com/article/1", "naver")
+
+    assert future.result() == "_worker_scrape"
+    broken, fresh = FakePool.instances
+    assert broken.shut_down
+    assert tool._pool is fresh
@@ -0,0 +1,151 @@
+"""
+scrape_news 정적 추출 경로 및 기사 캐시 테스트
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("selectolax")
+
+from agent.tools.news_scraper import scraper as scraper_module
+from common import dedup
+from common.dedup import URLBloom
+from agent.tools.news_scraper.models import Comment, NewsArticle
+from agent.tools.news_scraper.scraper import NewsScraperTool, _fetch_and_parse
+
+
+BODY = "정적으로 추출한 기사 본문입니다. " * 5
+URL = "https://news.example.com/article/1"
+
+
+class FakeResponse:
+    """aiohttp 응답 대역"""
+
+    def __init__(self, html: str, status: int = 200):
+        self.status = status
+        self.content_type = "text/html"
+        self.headers = {}
+        self._html = html
+
+    def raise_for_status(self):
+        pass
+
+    async def text(self, errors="strict"):
+        return self._html
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """aiohttp.ClientSession 대역 (URL별 고정 HTML 반환)"""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url):
+        return FakeResponse(self.pages[url])
+
+
+class FakeCache:
+    """diskcache.Cache 대역"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None):
+        self.data[key] = value
+
+    def close(self):
+        pass
+
+
+def test_static_path_drops_inline_script_and_style():
+    html = (
+        "<html><head><title>정적 기사 - 언론사</title>"
+        "<style>body{margin:0}</style></head><body>"
+        '<div class="content"><script>var ads="' + "a" * 200 + '";</script>'
+        f"<style>.a{{color:red}}</style>{BODY}</div>"
+        "</body></html>"
+    )
+    session = FakeSession({URL: html})
+
+    result = asyncio.run(_fetch_and_parse(session, URL, {}, {}))
+
+    assert result == {"title": "정적 기사", "content": BODY.strip()}
+
+
+def test_static_path_script_only_page_falls_back():
+    html = (
+        "<html><head><title>정적 기사</title></head><body>"
+        '<article><script>var ads="' + "a" * 200 + '";</script></article>'
+        "</body></html>"
+    )
+    session = FakeSession({URL: html})
+
+    assert asyncio.run(_fetch_and_parse(session, URL, {}, {})) is None
+
+
+def test_article_cache_round_trip_keeps_full_article():
+    tool = NewsScraperTool()
+    tool._cache = FakeCache()
+    article = NewsArticle(
+        url=URL,
+        title="정적 기사",
+        content=BODY * 20,  # to_dict가 자르는 500자보다 길게
+        comments=[Comment(id="1", text="댓글", author="작성자")],
+        source="google",
+        extraction_method="static",
+    )
+
+    tool._store_article(article)
+    cached = tool.get_cached_article(URL)
+
+    assert cached == article
+    assert cached.content == BODY * 20
+
+
+def test_failed_article_is_not_cached():
+    tool = NewsScraperTool()
+    tool._cache = FakeCache()
+
+    tool._store_article(NewsArticle(url=URL, title="추출 실패", content="추출 실패"))
+
+    assert tool._cache.data == {}
+    assert tool.get_cached_article(URL) is None
+
+
+def test_cache_version_bump_invalidates_old_entries(monkeypatch):
+    tool = NewsScraperTool()
+    tool._cache = FakeCache()
+    tool._store_article(NewsArticle(url=URL, title="정적 기사", content=BODY))
+
+    monkeypatch.setattr(scraper_module, "ARTICLE_CACHE_VERSION", scraper_module.ARTICLE_CACHE_VERSION + 1)
+
+    assert tool.get_cached_article(URL) is None
+
+
+def test_skip_seen_records_only_successfully_scraped_urls(monkeypatch):
+    failed_url = "https://news.example.com/article/2"
+    tool = NewsScraperTool()
+    tool._cache = FakeCache()
+    monkeypatch.setattr(dedup, "PYBLOOM_AVAILABLE", False)
+    tool._seen = URLBloom(path=None)
+    monkeypatch.setattr(tool, "search_naver_news", lambda keyword, max_articles: [URL, failed_url])
+
+    # 검색만으로는 기록되지 않음
+    assert tool.search_news("키워드", ["네이버"], skip_seen=True) == [URL, failed_url]
+    assert tool.search_news("키워드", ["네이버"], skip_seen=True) == [URL, failed_url]
+
+    tool._store_article(NewsArticle(url=URL, title="정적 기사", content=BODY))
+    tool._store_article(NewsArticle(url=failed_url, title="추출 실패", content="추출 실패"))
+
+    # 추출에 실패한 기사는 다음 실행에서 다시 시도
+    assert tool.search_news("키워드", ["네이버"], skip_seen=True) == [failed_url]
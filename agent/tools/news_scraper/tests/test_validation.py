@@ -0,0 +1,137 @@
+"""
+배치 검증(TypeAdapter 경로) 테스트
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from agent.tools.news_scraper.models import validation
+from agent.tools.news_scraper.models.validation import (
+    ArticleData, CommentData, validate_comments_batch, validate_comments_batch_json
+)
+
+
+def make_rows(count, invalid_index):
+    posted_at = datetime.now(timezone.utc).isoformat()
+    rows = [
+        {"external_id": f"c{i}", "content": f"댓글 {i}", "posted_at": posted_at}
+        for i in range(count)
+    ]
+    rows[invalid_index]["like_count"] = -1
+    return rows
+
+
+def assert_single_invalid(result, rows, invalid_index):
+    assert result.total_count == len(rows)
+    assert result.valid_count == len(rows) - 1
+    assert result.invalid_count == 1
+    assert all(isinstance(item, CommentData) for item in result.valid_data)
+    assert [item.external_id for item in result.valid_data] == [
+        row["external_id"] for i, row in enumerate(rows) if i != invalid_index
+    ]
+
+    invalid = result.invalid_data[0]
+    assert invalid["index"] == invalid_index
+    assert invalid["data"] == rows[invalid_index]
+    assert [(err["loc"], err["type"]) for err in invalid["errors"]] == [
+        (("like_count",), "greater_than_equal")
+    ]
+    assert invalid["error"].startswith("like_count: ")
+
+
+def test_single_invalid_row_below_parallel_threshold():
+    rows = make_rows(10, invalid_index=7)
+
+    result = validate_comments_batch(rows, max_workers=4)
+
+    assert_single_invalid(result, rows, 7)
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_single_invalid_row_above_parallel_threshold(max_workers):
+    count = validation._PARALLEL_MIN_ROWS * 2 + 1
+    # 두 번째 구간에 넣어 구간 offset 보정까지 확인
+    invalid_index = validation._PARALLEL_MIN_ROWS + 500
+    rows = make_rows(count, invalid_index)
+
+    result = validate_comments_batch(rows, max_workers=max_workers)
+
+    assert_single_invalid(result, rows, invalid_index)
+
+
+def make_article(url):
+    return {
+        "external_id": "a1",
+        "title": "기사 제목",
+        "content": "기사 본문입니다. " * 10,
+        "source_name": "언론사",
+        "original_url": url,
+        "published_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+@pytest.mark.parametrize("url", [
+    "https://example.com",
+    "http://example.com:8080/news/1?id=3&page=2#comments",
+    "HTTPS://n.news.naver.com/article/001/0000001",
+])
+def test_article_url_accepts_full_urls(url):
+    assert ArticleData.model_validate(make_article(url)).original_url == url
+
+
+@pytest.mark.parametrize("url", [
+    "http://exa mple.com",
+    "https://example.com/news 1",
+    "https://example.com/\tpath",
+    "ftp://example.com/file",
+    "https://",
+    "https://:80/path",
+])
+def test_article_url_rejects_malformed_urls(url):
+    with pytest.raises(ValueError):
+        ArticleData.model_validate(make_article(url))
+
+
+def test_naive_timestamp_is_treated_as_utc():
+    rows = make_rows(2, invalid_index=1)
+    rows[0]["posted_at"] = "2020-01-01T00:00:00"
+    rows.append({"external_id": "future", "content": "댓글", "posted_at": "2999-01-01T00:00:00"})
+
+    result = validate_comments_batch(rows)
+
+    assert result.valid_count == 1
+    assert result.valid_data[0].posted_at == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert [item["index"] for item in result.invalid_data] == [1, 2]
+    assert result.invalid_data[1]["errors"][0]["loc"] == ("posted_at",)
+    assert [index for index, item in validation.iter_validate_comments(rows)
+            if isinstance(item, CommentData)] == [0]
+
+
+def test_result_with_validator_error_is_json_serializable():
+    rows = make_rows(2, invalid_index=1)
+    rows[0]["posted_at"] = "2999-01-01T00:00:00+00:00"
+
+    result = validate_comments_batch(rows)
+
+    errors = result.invalid_data[0]["errors"]
+    assert errors[0]["type"] == "value_error"
+    assert "ctx" not in errors[0] and "input" not in errors[0]
+    assert json.loads(result.model_dump_json())["invalid_count"] == 2
+    assert json.loads(json.dumps(result.invalid_data))[0]["index"] == 0
+
+
+def test_batch_json_splits_rows_with_errors():
+    rows = make_rows(3, invalid_index=2)
+
+    result = validate_comments_batch_json(json.dumps(rows).encode())
+
+    assert result.valid_count == 2
+    assert [item["index"] for item in result.invalid_data] == [2]
+
+
+@pytest.mark.parametrize("payload", [b"[{bad", b'{"external_id": "c1"}', b"", "not json"])
+def test_batch_json_rejects_unparseable_or_non_array_payload(payload):
+    with pytest.raises(ValueError, match="JSON 배열"):
+        validate_comments_batch_json(payload)
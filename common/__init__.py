@@ -8,6 +8,9 @@ from .config import Config, get_config
 from .models import BaseModel
 from .utils import safe_log, validate_input, sanitize_text
 from .security import mask_sensitive_data, validate_api_key
+from .rate_limit import TokenBucket
+from .dedup import URLBloom
+from .retry import retry, RetryableError
 
 __all__ = [
     "Config",
@@ -18,5 +21,9 @@ __all__ = [
     "sanitize_text",
     "mask_sensitive_data",
     "validate_api_key",
+    "TokenBucket",
+    "URLBloom",
+    "retry",
+    "RetryableError",
 ]
 
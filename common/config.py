@@ -43,6 +43,10 @@ class Config:
     )
     CRAWLER_TIMEOUT: int = int(os.getenv("CRAWLER_TIMEOUT", "30"))
     CRAWLER_MAX_RETRIES: int = int(os.getenv("CRAWLER_MAX_RETRIES", "3"))
+    # scrape_news 백엔드 ("selenium" 또는 "playwright", playwright는 네이버 댓글 미수집)
+    CRAWLER_BACKEND: str = os.getenv("CRAWLER_BACKEND", "selenium").lower()
+    # True면 이전 실행에서 이미 수집한 URL을 검색 결과에서 제외 (기록: ~/.cache/aiagentcrawl/seen.bloom)
+    CRAWLER_SKIP_SEEN: bool = os.getenv("CRAWLER_SKIP_SEEN", "False").lower() == "true"
 
     # 보안 설정
     SECRET_KEY: Optional[str] = os.getenv("SECRET_KEY")
@@ -0,0 +1,116 @@
+"""
+URL 중복 제거 모듈
+
+여러 실행에 걸쳐 이미 수집한 URL을 기억하여 다시 수집하지 않도록 합니다.
+URL 문자열 대신 해시만 저장하므로 누적 URL이 많아져도 메모리 사용량이 작습니다.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+# 확장형 블룸 필터 (선택적, 없으면 8바이트 해시 집합 사용)
+try:
+    from pybloom_live import ScalableBloomFilter
+    PYBLOOM_AVAILABLE = True
+except ImportError:
+    PYBLOOM_AVAILABLE = False
+
+
+DEFAULT_BLOOM_PATH = Path.home() / ".cache" / "aiagentcrawl" / "seen.bloom"
+
+# 해시 집합 폴백에서 URL당 저장하는 다이제스트 크기
+DIGEST_SIZE = 8
+
+
+class URLBloom:
+    """
+    실행 간 유지되는 URL 방문 기록
+
+    pybloom_live가 있으면 확장형 블룸 필터(오탐률 error_rate)를, 없으면
+    URL 해시 집합을 사용합니다. 저장은 pickle 대신 각 구현의 바이너리 형식을
+    사용합니다 (캐시 파일을 통한 임의 코드 실행 방지).
+    """
+
+    def __init__(self, path: Union[str, Path, None] = DEFAULT_BLOOM_PATH,
+                 initial_capacity: int = 10_000, error_rate: float = 1e-5):
+        """
+        초기화
+
+        Args:
+            path: 기록 파일 경로 (None이면 메모리에만 유지)
+            initial_capacity: 블룸 필터 초기 용량
+            error_rate: 블룸 필터 오탐률
+        """
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self._dirty = False
+        self._filter = self._load()
+
+    def _new_filter(self):
+        """빈 기록 생성"""
+        if PYBLOOM_AVAILABLE:
+            return ScalableBloomFilter(initial_capacity=self.initial_capacity, error_rate=self.error_rate)
+        return set()
+
+    def _load(self):
+        """기록 파일 로드 (없거나 손상되었으면 빈 기록)"""
+        if self.path is None or not self.path.exists():
+            return self._new_filter()
+        try:
+            with open(self.path, "rb") as f:
+                if PYBLOOM_AVAILABLE:
+                    return ScalableBloomFilter.fromfile(f)
+                data = f.read()
+                return {data[i:i + DIGEST_SIZE] for i in range(0, len(data), DIGEST_SIZE)}
+        except Exception:
+            # 다른 구현으로 저장된 파일이거나 손상된 경우 새로 시작
+            return self._new_filter()
+
+    @staticmethod
+    def _digest(url: str) -> bytes:
+        """URL 해시"""
+        return hashlib.blake2b(url.encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+    def __contains__(self, url: str) -> bool:
+        """URL 방문 여부 확인 (기록하지 않음, 블룸 필터는 error_rate 확률로 오탐 가능)"""
+        if isinstance(self._filter, set):
+            return self._digest(url) in self._filter
+        return url in self._filter
+
+    def check_and_add(self, url: str) -> bool:
+        """
+        URL 방문 여부 확인 후 기록
+
+        Args:
+            url: 확인할 URL
+
+        Returns:
+            이미 기록된 URL이면 True (블룸 필터는 error_rate 확률로 오탐 가능)
+        """
+        if isinstance(self._filter, set):
+            digest = self._digest(url)
+            seen = digest in self._filter
+            self._filter.add(digest)
+        else:
+            # ScalableBloomFilter.add는 이미 있던 키면 True 반환
+            seen = self._filter.add(url)
+        if not seen:
+            self._dirty = True
+        return seen
+
+    def save(self) -> None:
+        """변경된 기록을 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            if isinstance(self._filter, set):
+                f.write(b"".join(self._filter))
+            else:
+                self._filter.tofile(f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
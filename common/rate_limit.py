@@ -0,0 +1,72 @@
+"""
+요청 속도 제한 모듈
+
+보안 가이드라인: 크롤링 대상 서버에 과도한 부하를 주지 않도록
+호스트별 요청 속도를 제한합니다.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    토큰 버킷 방식의 속도 제한기 (스레드 안전)
+
+    capacity 만큼의 요청은 대기 없이 통과하고, 이후에는 초당 rate개의
+    속도로 토큰이 충전됩니다.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        초기화
+
+        Args:
+            rate: 초당 충전되는 토큰 수
+            capacity: 버킷 최대 토큰 수 (허용 버스트 크기)
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        if capacity < 1:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰 충전 (락을 보유한 상태에서 호출)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, n: float = 1) -> None:
+        """
+        토큰 n개를 소비 (부족하면 충전될 때까지 대기)
+
+        Args:
+            n: 소비할 토큰 수
+        """
+        if n > self.capacity:
+            raise ValueError("요청 토큰 수가 capacity를 초과합니다.")
+
+        with self._cond:
+            self._refill()
+            while self._tokens < n:
+                # 부족한 토큰이 충전될 때까지 대기 (폴링 없이 한 번에 대기)
+                self._cond.wait(timeout=(n - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= n
+
+    def pause(self, seconds: float) -> None:
+        """
+        남은 토큰을 비우고 seconds 동안 토큰 발급 중단 (429 응답 등 서버 요청 시)
+
+        Args:
+            seconds: 대기 시간 (초)
+        """
+        with self._cond:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
@@ -0,0 +1,124 @@
+"""
+재시도 모듈
+
+일시적인 네트워크 오류나 429/503 응답에 대해 지수 백오프로 재시도합니다.
+서버가 Retry-After 헤더로 대기 시간을 지정하면 그 값을 따릅니다.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple, Type, Union
+
+logger = logging.getLogger(__name__)
+
+
+class RetryableError(Exception):
+    """재시도 가능한 오류 (HTTP 429/5xx 등)"""
+
+    def __init__(self, message: str, status: Optional[int] = None,
+                 retry_after: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            message: 오류 메시지
+            status: HTTP 상태 코드
+            retry_after: 서버가 지정한 대기 시간 (초)
+        """
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 파싱
+
+    Args:
+        value: 헤더 값 (초 단위 정수 또는 HTTP 날짜)
+
+    Returns:
+        대기 시간(초), 파싱할 수 없으면 None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0,
+                  retry_after: Optional[float] = None) -> float:
+    """
+    재시도 대기 시간 계산
+
+    Args:
+        attempt: 실패한 시도 번호 (0부터 시작)
+        base: 첫 재시도 대기 시간 (초)
+        cap: 최대 대기 시간 (초)
+        retry_after: 서버가 지정한 대기 시간 (있으면 우선 사용)
+
+    Returns:
+        대기 시간 (초)
+    """
+    if retry_after is not None:
+        return min(retry_after, cap)
+    return min(base * 2 ** attempt + random.random() * 0.1, cap)
+
+
+def retry(exceptions: Union[Type[BaseException], Tuple[Type[BaseException], ...]],
+          tries: int = 4, base: float = 0.5, cap: float = 30.0):
+    """
+    지수 백오프 재시도 데코레이터 (동기/비동기 함수 모두 지원)
+
+    마지막 시도까지 실패하면 마지막 예외를 그대로 다시 발생시킵니다.
+
+    Args:
+        exceptions: 재시도할 예외 타입
+        tries: 최대 시도 횟수
+        base: 첫 재시도 대기 시간 (초)
+        cap: 최대 대기 시간 (초)
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(tries):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        if attempt == tries - 1:
+                            raise
+                        delay = backoff_delay(attempt, base, cap, getattr(e, "retry_after", None))
+                        logger.debug("%s 재시도 %s/%s (%.2f초 후): %s",
+                                     func.__name__, attempt + 1, tries - 1, delay, e)
+                        await asyncio.sleep(delay)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(tries):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    if attempt == tries - 1:
+                        raise
+                    delay = backoff_delay(attempt, base, cap, getattr(e, "retry_after", None))
+                    logger.debug("%s 재시도 %s/%s (%.2f초 후): %s",
+                                 func.__name__, attempt + 1, tries - 1, delay, e)
+                    time.sleep(delay)
+        return wrapper
+
+    return decorator
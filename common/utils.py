@@ -4,14 +4,70 @@
 공통으로 사용하는 유틸리티 함수들을 제공합니다.
 """
 
+import atexit
 import logging
+import queue
 import re
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
 from datetime import datetime
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# safe_log 레벨 이름 → logging 레벨
+LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+# 민감한 정보 키워드
+SENSITIVE_KEYS = ("key", "password", "secret", "token", "api_key", "auth")
+
+# enable_queue_logging으로 시작한 백그라운드 리스너
+_queue_listener: Optional[QueueListener] = None
+
+
+def enable_queue_logging(target: Optional[logging.Logger] = None) -> None:
+    """
+    로그 출력(포맷팅/파일·콘솔 IO)을 백그라운드 스레드로 이동
+
+    target 로거(기본: 루트)의 기존 핸들러를 QueueListener로 옮기고 그 자리에
+    QueueHandler를 둡니다. 이후 로그 호출은 큐에 넣기만 하므로 크롤링 루프가
+    로그 IO로 멈추지 않습니다. 로깅 설정(basicConfig 등) 이후에 한 번 호출하세요.
+
+    Args:
+        target: 핸들러를 옮길 로거 (None이면 루트 로거)
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return
+
+    target = target or logging.getLogger()
+    handlers = [h for h in target.handlers if not isinstance(h, QueueHandler)]
+    if not handlers:
+        return
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    for handler in handlers:
+        target.removeHandler(handler)
+    target.addHandler(QueueHandler(log_queue))
+
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    # 종료 시 큐에 남은 로그까지 출력
+    atexit.register(stop_queue_logging)
+
+
+def stop_queue_logging() -> None:
+    """백그라운드 로그 리스너 종료 (큐에 남은 로그를 모두 출력한 뒤 반환)"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
 
 def safe_log(message: str, level: str = "info", **kwargs) -> None:
     """
@@ -24,13 +80,15 @@ def safe_log(message: str, level: str = "info", **kwargs) -> None:
         level: 로그 레벨 (info, warning, error, debug)
         **kwargs: 추가 정보 (민감한 정보는 자동으로 마스킹됨)
     """
-    # 민감한 정보 키워드
-    sensitive_keys = ["key", "password", "secret", "token", "api_key", "auth"]
+    levelno = LOG_LEVELS.get(level)
+    # 출력되지 않을 레벨이면 마스킹/메시지 조립 생략
+    if levelno is None or not logger.isEnabledFor(levelno):
+        return
 
     # 민감한 정보 마스킹
     safe_kwargs = {}
     for key, value in kwargs.items():
-        if any(sensitive in key.lower() for sensitive in sensitive_keys):
+        if any(sensitive in key.lower() for sensitive in SENSITIVE_KEYS):
             safe_kwargs[key] = "***MASKED***"
         else:
             safe_kwargs[key] = value
@@ -39,14 +97,7 @@ def safe_log(message: str, level: str = "info", **kwargs) -> None:
     if safe_kwargs:
         log_message += f" | {safe_kwargs}"
 
-    if level == "info":
-        logger.info(log_message)
-    elif level == "warning":
-        logger.warning(log_message)
-    elif level == "error":
-        logger.error(log_message)
-    elif level == "debug":
-        logger.debug(log_message)
+    logger.log(levelno, log_message)
 
 
 def validate_input(text: str, max_length: int = 1000, min_length: int = 1) -> bool:
@@ -0,0 +1,61 @@
+"""
+common.dedup URLBloom 테스트 (해시 집합 폴백)
+"""
+
+import pytest
+
+from common import dedup
+from common.dedup import DIGEST_SIZE, URLBloom
+
+
+@pytest.fixture(autouse=True)
+def hash_set_fallback(monkeypatch):
+    monkeypatch.setattr(dedup, "PYBLOOM_AVAILABLE", False)
+
+
+def test_check_and_add():
+    bloom = URLBloom(path=None)
+
+    assert bloom.check_and_add("https://example.com/a") is False
+    assert bloom.check_and_add("https://example.com/a") is True
+    assert bloom.check_and_add("https://example.com/b") is False
+
+
+def test_contains_does_not_record():
+    bloom = URLBloom(path=None)
+
+    assert "https://example.com/a" not in bloom
+    assert "https://example.com/a" not in bloom
+    bloom.check_and_add("https://example.com/a")
+    assert "https://example.com/a" in bloom
+
+
+def test_save_load_round_trip(tmp_path):
+    path = tmp_path / "cache" / "seen.bloom"
+    urls = [f"https://example.com/article/{i}" for i in range(100)]
+    bloom = URLBloom(path)
+    for url in urls:
+        bloom.check_and_add(url)
+
+    bloom.save()
+
+    assert path.stat().st_size == len(urls) * DIGEST_SIZE
+    assert not path.with_suffix(".bloom.tmp").exists()
+    reloaded = URLBloom(path)
+    assert all(reloaded.check_and_add(url) for url in urls)
+    assert reloaded.check_and_add("https://example.com/new") is False
+
+
+def test_save_skips_unchanged_record(tmp_path):
+    path = tmp_path / "seen.bloom"
+    bloom = URLBloom(path)
+    bloom.check_and_add("https://example.com/a")
+    bloom.save()
+    mtime = path.stat().st_mtime_ns
+
+    reloaded = URLBloom(path)
+    reloaded.check_and_add("https://example.com/a")
+    reloaded.save()
+
+    assert path.stat().st_mtime_ns == mtime
+
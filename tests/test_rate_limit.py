@@ -0,0 +1,78 @@
+"""
+common.rate_limit TokenBucket 테스트
+"""
+
+import pytest
+
+from common import rate_limit as rate_limit_module
+from common.rate_limit import TokenBucket
+
+
+class FakeClock:
+    """time.monotonic 대역 (대기하면 그만큼 시간이 흐름)"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.waits = []
+
+    def monotonic(self):
+        return self.now
+
+    def wait(self, timeout=None):
+        self.waits.append(timeout)
+        self.now += timeout
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit_module.time, "monotonic", clock.monotonic)
+    return clock
+
+
+def make_bucket(clock, rate, capacity=1.0):
+    bucket = TokenBucket(rate, capacity)
+    bucket._cond.wait = clock.wait
+    return bucket
+
+
+def test_burst_up_to_capacity_without_waiting(clock):
+    bucket = make_bucket(clock, rate=2.0, capacity=3)
+
+    for _ in range(3):
+        bucket.acquire()
+
+    assert clock.waits == []
+
+
+def test_acquire_waits_for_refill(clock):
+    bucket = make_bucket(clock, rate=2.0, capacity=1)
+    bucket.acquire()
+
+    bucket.acquire()
+
+    assert clock.waits == [pytest.approx(0.5)]
+
+
+def test_refill_after_pause(clock):
+    bucket = make_bucket(clock, rate=2.0, capacity=2)
+    bucket.acquire()
+
+    bucket.pause(3.0)
+    bucket.acquire()
+
+    # 남은 토큰은 버려지고, 3초 정지 후 토큰 1개가 충전될 때까지 대기
+    assert sum(clock.waits) == pytest.approx(3.5)
+
+    clock.now += 10.0
+    bucket.acquire(2)
+    assert sum(clock.waits) == pytest.approx(3.5)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+    with pytest.raises(ValueError):
+        TokenBucket(1.0, capacity=0.5)
+    with pytest.raises(ValueError):
+        TokenBucket(1.0, capacity=2).acquire(3)
@@ -0,0 +1,104 @@
+"""
+common.retry 재시도/백오프 테스트
+"""
+
+import asyncio
+import importlib
+
+import pytest
+
+from common.retry import RetryableError, backoff_delay, parse_retry_after, retry
+
+# common 패키지가 retry 데코레이터를 같은 이름으로 re-export하므로 모듈은 직접 조회
+retry_module = importlib.import_module("common.retry")
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """time.sleep/asyncio.sleep 대신 대기 시간만 기록 (지터 제거)"""
+    delays = []
+
+    async def fake_async_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(retry_module.random, "random", lambda: 0.0)
+    monkeypatch.setattr(retry_module.time, "sleep", delays.append)
+    monkeypatch.setattr(retry_module.asyncio, "sleep", fake_async_sleep)
+    return delays
+
+
+def test_backoff_delay_doubles_and_caps(monkeypatch):
+    monkeypatch.setattr(retry_module.random, "random", lambda: 0.0)
+
+    assert [backoff_delay(n, base=0.5, cap=3.0) for n in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_backoff_delay_prefers_retry_after_within_cap():
+    assert backoff_delay(0, base=0.5, cap=30.0, retry_after=7.0) == 7.0
+    assert backoff_delay(0, base=0.5, cap=30.0, retry_after=120.0) == 30.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after(" 12 ") == 12.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # 지난 시각
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_gives_up_after_tries(sleeps):
+    calls = []
+
+    @retry(RetryableError, tries=3, base=0.5)
+    def fetch():
+        calls.append(1)
+        raise RetryableError("503", status=503)
+
+    with pytest.raises(RetryableError):
+        fetch()
+
+    assert len(calls) == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_returns_first_success(sleeps):
+    outcomes = iter([RetryableError("503"), RetryableError("503"), "ok"])
+
+    @retry(RetryableError, tries=4, base=0.5)
+    def fetch():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert fetch() == "ok"
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_does_not_catch_other_exceptions(sleeps):
+    calls = []
+
+    @retry(RetryableError, tries=4)
+    def fetch():
+        calls.append(1)
+        raise ValueError("파싱 오류")
+
+    with pytest.raises(ValueError):
+        fetch()
+
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_async_retry_honours_retry_after(sleeps):
+    outcomes = iter([RetryableError("429", status=429, retry_after=4.0), "ok"])
+
+    @retry(RetryableError, tries=3, base=0.5, cap=30.0)
+    async def fetch():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert asyncio.run(fetch()) == "ok"
+    assert sleeps == [4.0]